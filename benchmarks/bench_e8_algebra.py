@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - E8 Algebra Benchmark
+=======================================
+
+Timings of gift.e8_algebra:
+
+- building the sparse structure constants, the Killing form and the Casimir
+- batched commutators, in brackets per second
+- the Jacobi identity over all 248³ basis triples, sparse join against a
+  dense 248³ tensor contraction (timed on a few slices and extrapolated)
+
+Usage:
+    python benchmarks/bench_e8_algebra.py
+    python benchmarks/bench_e8_algebra.py --pairs 10000 --dense-slices 4
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from gift import e8_algebra
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def dense_jacobi_slice(f, a):
+    """Jacobi components with first index a from the dense tensor f[a, b, c]"""
+    # Σ_d f[b,c,d] f[a,d,e] + f[c,a,d] f[b,d,e] + f[a,b,d] f[c,d,e]
+    term1 = np.einsum('bcd,de->bce', f, f[a])
+    term2 = np.einsum('cd,bde->bce', f[:, a], f)
+    term3 = np.einsum('bd,cde->bce', f[a], f)
+    return term1 + term2 + term3
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--pairs', type=int, default=10000,
+                        help="element pairs per bracket batch (default: 10000)")
+    parser.add_argument('--dense-slices', type=int, default=2,
+                        help="slices of the dense Jacobi check to time (default: 2)")
+    args = parser.parse_args(argv)
+    n = e8_algebra.DIM_E8
+
+    print("="*60)
+    print("E8 ALGEBRA BENCHMARK")
+    print("="*60)
+
+    table, seconds = timed(e8_algebra.structure_constants)
+    print(f"  Structure constants:   {seconds * 1e3:10.1f} ms  ({len(table[3]):,} int8 entries)")
+    _, seconds = timed(e8_algebra.killing_form)
+    print(f"  Killing form:          {seconds * 1e3:10.1f} ms")
+    _, seconds = timed(e8_algebra.casimir)
+    print(f"  Casimir:               {seconds * 1e3:10.1f} ms")
+
+    rng = np.random.default_rng(0)
+    x, y = rng.standard_normal((2, args.pairs, n))
+    _, seconds = timed(lambda: e8_algebra.bracket(x, y))
+    print(f"  Brackets:              {args.pairs / seconds:10.3e} /s")
+
+    violations, sparse = timed(e8_algebra.jacobi_violations)
+    print(f"  Jacobi, sparse:        {sparse:10.2f} s   ({violations} violations)")
+
+    a, b, c, f = (np.asarray(array, dtype=np.int64) for array in table)
+    dense = np.zeros((n, n, n))
+    dense[a, b, c] = f
+    slices = range(args.dense_slices)
+    _, seconds = timed(lambda: [dense_jacobi_slice(dense, s) for s in slices])
+    estimate = seconds / args.dense_slices * n
+    print(f"  Jacobi, dense 248³:    {estimate:10.0f} s   (extrapolated from "
+          f"{args.dense_slices} of {n} slices, {estimate / sparse:.0f}× slower)")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Hodge Laplacian Benchmark
+============================================
+
+Scaling of gift.hodge with the mesh resolution n (n⁷ vertices), per form
+degree:
+
+- assembly of the weighted coboundaries, in RAM or memory-mapped
+- matrix-free Laplacian products, single-threaded and on a thread pool
+- the low spectrum by shift-invert (up to --max-solve cells)
+
+Usage:
+    python benchmarks/bench_hodge.py
+    python benchmarks/bench_hodge.py --n 2 3 4 5 --degrees 1 3 --jobs 4 --mmap /tmp/hodge
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from gift import hodge
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--n', type=int, nargs='+', default=[2, 3, 4, 5],
+                        help="vertices per direction (default: 2 3 4 5)")
+    parser.add_argument('--degrees', type=int, nargs='+', default=[1, 3],
+                        help="form degrees (default: 1 3)")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help="threads for the threaded products (default: one per CPU core)")
+    parser.add_argument('--mmap', metavar='DIR',
+                        help="directory for memory-mapped assembly (default: a temporary one)")
+    parser.add_argument('--max-solve', type=float, default=2e5,
+                        help="largest number of cells to compute the spectrum for (default: 2e5)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="products timed per configuration, best kept (default: 5)")
+    args = parser.parse_args(argv)
+    directory = args.mmap or tempfile.mkdtemp(prefix='gift_hodge_')
+
+    print("="*84)
+    print("HODGE LAPLACIAN BENCHMARK")
+    print("="*84)
+    print(f"{'n':>3}{'k':>3}{'cells':>12}{'nnz MB':>9}{'RAM s':>8}{'mmap s':>8}"
+          f"{'Ax ms':>9}{f'Ax ms ×{args.jobs}':>12}{'zero':>6}{'solve s':>10}")
+    print("-"*84)
+    for n in args.n:
+        mesh = hodge.Mesh(n)
+        for k in args.degrees:
+            laplacian, ram_s = timed(lambda: hodge.HodgeLaplacian(mesh, k))
+            _, mmap_s = timed(lambda: hodge.HodgeLaplacian(mesh, k, directory=directory).close())
+            megabytes = sum(m.data.nbytes + m.indices.nbytes + m.indptr.nbytes
+                            for term in laplacian.terms for m in term) / 2**20
+
+            x = np.random.default_rng(0).random(laplacian.size)
+            single = min(timed(lambda: laplacian.matvec(x))[1] for _ in range(args.repeat))
+            with hodge.HodgeLaplacian(mesh, k, jobs=args.jobs) as threaded:
+                threaded.matvec(x)                      # split the row blocks once
+                parallel = min(timed(lambda: threaded.matvec(x))[1]
+                               for _ in range(args.repeat))
+
+            zero, solve = '', ''
+            if laplacian.size <= args.max_solve:
+                result = hodge.spectrum(mesh, k)
+                zero, solve = result.zero_modes, f'{result.seconds:.2f}'
+            print(f"{n:>3}{k:>3}{laplacian.size:>12,}{megabytes:>9.1f}{ram_s:>8.2f}{mmap_s:>8.2f}"
+                  f"{single * 1e3:>9.2f}{parallel * 1e3:>12.2f}{zero:>6}{solve:>10}")
+    print("="*84)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Observable Evaluation Benchmark
+==================================================
+
+Throughput of gift.observables.evaluate() over parameter scans, in
+parameter points per second, for:
+
+- a 1D scan of p2 alone
+- a 1D scan where p2, rank_E8 and Weyl_factor all vary per point
+- a 3D grid of the three independent parameters (broadcast inputs)
+
+Usage:
+    python benchmarks/bench_observables.py
+    python benchmarks/bench_observables.py --points 1e6 --repeat 10
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from gift.observables import evaluate
+
+
+def scans(n_points):
+    """Parameter sets of about n_points points each"""
+    side = round(n_points ** (1 / 3))
+    return {
+        'p2 scan': {'p2': np.linspace(1.5, 2.5, n_points)},
+        'p2 x rank x Weyl': {
+            'p2': np.linspace(1.5, 2.5, n_points),
+            'rank_E8': np.linspace(6, 10, n_points),
+            'Weyl_factor': np.linspace(3, 7, n_points),
+        },
+        f'{side}³ grid': {
+            'p2': np.linspace(1.5, 2.5, side)[:, None, None],
+            'rank_E8': np.linspace(6, 10, side)[None, :, None],
+            'Weyl_factor': np.linspace(3, 7, side)[None, None, :],
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--points', type=float, default=1e7,
+                        help="parameter points per scan (default: 1e7)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="timed evaluations per scan, best kept (default: 5)")
+    args = parser.parse_args(argv)
+
+    print("="*60)
+    print("OBSERVABLE EVALUATION BENCHMARK")
+    print("="*60)
+    print(f"{'scan':<20}{'points':>12}{'best ms':>12}{'points/s':>16}")
+    print("-"*60)
+
+    for name, params in scans(int(args.points)).items():
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = evaluate(params)
+            times.append(time.perf_counter() - start)
+        points = results['n_s'].size
+        best = min(times)
+        print(f"{name:<20}{points:>12,}{best * 1e3:>12.1f}{points / best:>16.3e}")
+
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Precision Backend Benchmark
+==============================================
+
+Throughput of gift.observables.evaluate() per backend, in parameter points
+per second over a p2 scan:
+
+- float64 and longdouble (float128), vectorized NumPy
+- mpmath at several working precisions (element by element)
+
+plus the cost of building the memoized constants of a precision level,
+cold against cached.
+
+Usage:
+    python benchmarks/bench_precision.py
+    python benchmarks/bench_precision.py --points 1e6 --mp-points 1e3 --dps 15 50 1000
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from gift import precision
+from gift.observables import evaluate
+
+
+def best_time(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--points', type=float, default=1e6,
+                        help="points per NumPy scan (default: 1e6)")
+    parser.add_argument('--mp-points', type=float, default=1e3,
+                        help="points per mpmath scan (default: 1e3)")
+    parser.add_argument('--dps', type=int, nargs='+', default=[15, 50, 1000],
+                        help="mpmath precisions in decimal digits (default: 15 50 1000)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="timed evaluations per backend, best kept (default: 3)")
+    args = parser.parse_args(argv)
+
+    runs = [('float64', None, int(args.points)), ('longdouble', None, int(args.points))]
+    runs += [('mpmath', dps, int(args.mp_points)) for dps in args.dps]
+
+    print("="*64)
+    print("PRECISION BACKEND BENCHMARK")
+    print("="*64)
+    print(f"{'backend':<16}{'points':>10}{'best ms':>12}{'points/s':>14}{'vs float64':>12}")
+    print("-"*64)
+
+    reference = None
+    for name, dps, n_points in runs:
+        p2 = np.linspace(1.5, 2.5, n_points)
+        if name == 'mpmath':
+            # Decimal strings, so every point is exact at the working precision
+            p2 = np.array([str(value) for value in p2], dtype=object)
+        evaluate({'p2': p2[:2]}, backend=name, dps=dps)    # warm the constants
+        best = best_time(lambda: evaluate({'p2': p2}, backend=name, dps=dps), args.repeat)
+        rate = n_points / best
+        reference = reference or rate
+        label = name if dps is None else f'mpmath[{dps}]'
+        print(f"{label:<16}{n_points:>10,}{best * 1e3:>12.1f}{rate:>14.3e}{rate / reference:>12.2e}")
+
+    print("-"*64)
+    print(f"{'constants':<16}{'cold ms':>12}{'cached us':>12}")
+    for dps in args.dps:
+        precision.constants.cache_clear()
+        cold = best_time(lambda: precision.constants(dps), 1)
+        cached = best_time(lambda: precision.constants(dps), 100)
+        print(f"{f'dps={dps}':<16}{cold * 1e3:>12.2f}{cached * 1e6:>12.2f}")
+
+    print("="*64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Profiling Overhead Benchmark
+===============================================
+
+Cost of gift.profiling on the pipelines it instruments, disabled vs
+enabled, interleaved and best-of-N to see through timing noise:
+
+- GIFTObservables.compute_all(), whose µs-scale sectors are sampled
+- rasterizing animation frames (build, update, draw per frame)
+- one stage enter/exit, and the no-op stage() when disabled
+
+Usage:
+    python benchmarks/bench_profiling.py
+    python benchmarks/bench_profiling.py --calls 20000 --frames 20 --rounds 15
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gift import profiling
+from gift.observables import GIFTObservables
+
+
+def timed(function, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return (time.perf_counter() - start) / number
+
+
+def compare(function, number, rounds):
+    """Best per-call seconds disabled and enabled, alternating rounds"""
+    disabled, enabled = [], []
+    for _ in range(rounds):
+        disabled.append(timed(function, number))
+        with profiling.enabled():
+            enabled.append(timed(function, number))
+    return min(disabled), min(enabled)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--calls', type=int, default=6400,
+                        help="compute_all() calls per round (default: 6400)")
+    parser.add_argument('--frames', type=int, default=10,
+                        help="animation frames per round, 0 to skip (default: 10)")
+    parser.add_argument('--animation', default='cohomology_breakdown',
+                        help="animation rendered (default: cohomology_breakdown)")
+    parser.add_argument('--rounds', type=int, default=9,
+                        help="alternating disabled/enabled rounds, best kept (default: 9)")
+    args = parser.parse_args(argv)
+
+    print("="*70)
+    print("PROFILING OVERHEAD BENCHMARK")
+    print("="*70)
+    print(f"{'pipeline':<32}{'disabled':>12}{'enabled':>12}{'overhead':>12}")
+    print("-"*70)
+
+    calculator = GIFTObservables()
+    disabled, enabled = compare(calculator.compute_all, args.calls, args.rounds)
+    print(f"{'compute_all()':<32}{disabled * 1e6:>9.2f} µs{enabled * 1e6:>9.2f} µs"
+          f"{100 * (enabled / disabled - 1):>11.2f}%")
+
+    if args.frames:
+        import generate_animations
+
+        def render():
+            for _ in generate_animations.iter_frames(args.animation, 0, args.frames):
+                pass
+        disabled, enabled = compare(render, 1, max(args.rounds // 3, 1))
+        label = f"{args.animation} ×{args.frames} frames"
+        print(f"{label:<32}{disabled * 1e3:>9.1f} ms{enabled * 1e3:>9.1f} ms"
+              f"{100 * (enabled / disabled - 1):>11.2f}%")
+
+    def null_stage():
+        with profiling.stage('bench'):
+            pass
+    empty = timed(lambda: None, 100000)
+    off = timed(null_stage, 100000) - empty
+    with profiling.enabled():
+        on = timed(null_stage, 100000) - empty
+    print(f"{'one stage':<32}{off * 1e9:>9.0f} ns{on * 1e9:>9.0f} ns")
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Render Profiles Benchmark
+============================================
+
+Cost of rasterizing an animation's frames for several render profiles of
+generate_animations.py in one shared pass (figure built and each frame
+updated once, then drawn per profile) vs one full pass per profile, as
+separate runs would, best-of-N:
+
+- per-profile pass: build + update + draw at that resolution
+- shared pass: build + update once, one draw per profile
+
+Encoding is left out: it costs the same either way.
+
+Usage:
+    python benchmarks/bench_render_profiles.py
+    python benchmarks/bench_render_profiles.py --profiles publication thumbnail readme 4k
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+import generate_animations as ga
+
+
+def best(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run(name, draws):
+    for _ in ga.iter_profile_frames(name, draws):
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--animations', nargs='+', default=list(ga.ANIMATIONS),
+                        choices=list(ga.ANIMATIONS), help="animations to benchmark")
+    parser.add_argument('--profiles', nargs='+', default=['publication', 'thumbnail', 'readme'],
+                        choices=list(ga.RENDER_PROFILES),
+                        help="render profiles (default: publication thumbnail readme)")
+    parser.add_argument('--frames', type=int, default=12,
+                        help="frames spread across each animation (default: 12)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="timed passes, best kept (default: 3)")
+    args = parser.parse_args(argv)
+
+    print("="*78)
+    print("RENDER PROFILES BENCHMARK")
+    print("="*78)
+    print(f"Profiles: {', '.join(args.profiles)}; {args.frames} frames per animation")
+    print(f"{'animation':<26}{'separate ms':>14}{'shared ms':>12}{'saved':>9}"
+          f"{'vs 1 pass':>11}")
+    print("-"*78)
+    for name in args.animations:
+        spec = ga.ANIMATIONS[name]
+        frames = np.unique(np.linspace(0, spec['frames'] - 1, args.frames).astype(int))
+        # Frame steps only thin out which frames a profile shows: draw every
+        # profile at every sampled frame, so both sides draw the same pixels
+        per_profile = {profile: {int(frame): [profile] for frame in frames}
+                       for profile in args.profiles}
+        shared = {int(frame): list(args.profiles) for frame in frames}
+
+        separate = {profile: best(lambda: run(name, draws), args.repeat)
+                    for profile, draws in per_profile.items()}
+        together = best(lambda: run(name, shared), args.repeat)
+        total = sum(separate.values())
+        print(f"{name:<26}{total * 1e3:>14.0f}{together * 1e3:>12.0f}"
+              f"{100 * (1 - together / total):>8.1f}%"
+              f"{together / separate[args.profiles[0]]:>10.2f}×")
+    print("-"*78)
+    print(f"'vs 1 pass': shared pass time over a {args.profiles[0]}-only pass")
+    print("="*78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Retained-Mode Rendering Benchmark
+====================================================
+
+Compares the redraw-everything frame callbacks of generate_animations.py
+(ax.clear() and rebuild every artist) with their retained-mode variants
+(artists created once, mutated per frame).
+
+For every animation and mode, frames spread over the whole animation are
+rendered (update + Agg draw) in a fresh interpreter, reporting the median
+and mean per-frame time and the process peak RSS.
+
+Usage:
+    python benchmarks/bench_retained_mode.py
+    python benchmarks/bench_retained_mode.py --frames 50 --animations e8_root_rotation
+"""
+
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+
+def peak_rss_mb():
+    """Peak resident set size of the current process in MB (Unix only)"""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak / 1024**2 if sys.platform == 'darwin' else peak / 1024
+
+
+def measure(name, retained, n_frames):
+    """Time update() + canvas.draw() per frame for one animation builder"""
+    import generate_animations as ga
+
+    spec = ga.ANIMATIONS[name]
+    fig, update = spec['build_retained' if retained else 'build']()
+    fig.set_dpi(spec['dpi'])
+
+    # Warm-up: font cache and first layout pass
+    update(0)
+    fig.canvas.draw()
+
+    times = []
+    for frame in np.linspace(0, spec['frames'] - 1, n_frames).astype(int):
+        start = time.perf_counter()
+        update(frame)
+        fig.canvas.draw()
+        times.append(time.perf_counter() - start)
+
+    return np.median(times) * 1e3, np.mean(times) * 1e3, peak_rss_mb()
+
+
+def main(argv=None):
+    import generate_animations as ga
+
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--frames', type=int, default=30,
+                        help="frames rendered per measurement (default: 30)")
+    parser.add_argument('--animations', nargs='+', default=list(ga.ANIMATIONS),
+                        choices=list(ga.ANIMATIONS), help="animations to benchmark")
+    args = parser.parse_args(argv)
+
+    # A fresh interpreter per measurement keeps peak RSS figures independent
+    context = multiprocessing.get_context('spawn')
+
+    print("="*78)
+    print("RETAINED-MODE RENDERING BENCHMARK")
+    print("="*78)
+    print(f"{'animation':<24}{'mode':<10}{'median ms':>11}{'mean ms':>10}"
+          f"{'speedup':>9}{'peak RSS MB':>14}")
+    print("-"*78)
+
+    for name in args.animations:
+        results = {}
+        for mode, retained in [('redraw', False), ('retained', True)]:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                results[mode] = pool.submit(measure, name, retained, args.frames).result()
+
+        for mode, (median, mean, rss) in results.items():
+            speedup = results['redraw'][0] / median
+            print(f"{name:<24}{mode:<10}{median:>11.2f}{mean:>10.2f}"
+                  f"{speedup:>8.2f}x{rss:>14.1f}")
+
+    print("="*78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Symbolic Derivatives Benchmark
+=================================================
+
+Sensitivities of the 18 observables from the compiled kernels of
+gift.symbolic against central finite differences of evaluate(), over a
+grid of parameter points:
+
+- Jacobian over the parameters: one kernel pass vs 2 evaluate() calls
+  per parameter, and the finite differences' error against the exact one
+- Hessian: one order-2 kernel pass
+- kernel start-up in a fresh process: compiled with sympy (cold) vs
+  loaded from the disk cache (warm)
+
+Usage:
+    python benchmarks/bench_symbolic.py
+    python benchmarks/bench_symbolic.py --points 100000 --repeat 5
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from gift import symbolic
+from gift.observables import OBSERVABLES, PARAMETERS, evaluate, parameters
+
+
+def best(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def finite_differences(point, step):
+    """Central-difference Jacobian over the six parameters, shape (n, 18, 6)"""
+    columns = []
+    for name in PARAMETERS:
+        h = step * np.maximum(1, np.abs(point[name]))
+        up = evaluate({**point, name: point[name] + h})
+        down = evaluate({**point, name: point[name] - h})
+        columns.append(np.stack([(up[o] - down[o]) / (2 * h) for o in OBSERVABLES], axis=-1))
+    return np.stack(columns, axis=-1)
+
+
+def startup(cache_dir):
+    """Seconds for a fresh interpreter to get the order-1 kernel"""
+    code = ("import time; start = time.perf_counter(); from gift import symbolic; "
+            "symbolic.kernel(); print(time.perf_counter() - start)")
+    output = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True,
+                            text=True, check=True,
+                            env={**os.environ, 'GIFT_CACHE_DIR': cache_dir})
+    return float(output.stdout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--points', type=int, default=10000,
+                        help="parameter points in the grid (default: 10000)")
+    parser.add_argument('--step', type=float, default=1e-6,
+                        help="relative finite-difference step (default: 1e-6)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="timed runs, best kept (default: 5)")
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(0)
+    point = parameters({'p2': rng.uniform(1.8, 2.2, args.points),
+                        'rank_E8': rng.uniform(7, 9, args.points),
+                        'Weyl_factor': rng.uniform(4, 6, args.points)})
+    point = {name: np.broadcast_to(value, (args.points,)).copy()
+             for name, value in point.items()}
+    first, second = symbolic.kernel(1), symbolic.kernel(2)
+    variables = symbolic.point(point)
+    columns = [first.variables.index(name) for name in PARAMETERS]
+
+    exact = first(variables).jacobian[..., columns]
+    approximate = finite_differences(point, args.step)
+    scale = np.abs(exact).max(axis=0)
+    error = np.nanmax(np.abs(approximate - exact) / np.where(scale > 0, scale, 1))
+
+    kernel_s = best(lambda: first(variables), args.repeat)
+    hessian_s = best(lambda: second(variables), args.repeat)
+    fd_s = best(lambda: finite_differences(point, args.step), args.repeat)
+
+    print("="*70)
+    print("SYMBOLIC DERIVATIVES BENCHMARK")
+    print("="*70)
+    print(f"Grid: {args.points:,} points, {len(first.variables)} variables, "
+          f"{len(OBSERVABLES)} observables\n")
+    print(f"{'method':<40}{'ms':>10}{'points/s':>16}")
+    print("-"*70)
+    for label, seconds in [
+        ("finite differences (6 parameters)", fd_s),
+        (f"kernel: values + Jacobian ({len(first.variables)} vars)", kernel_s),
+        ("kernel: + Hessian", hessian_s),
+    ]:
+        print(f"{label:<40}{seconds * 1e3:>10.2f}{args.points / seconds:>16,.0f}")
+    print("-"*70)
+    print(f"Finite differences vs exact Jacobian: max error {error:.2e} "
+          f"(relative to each entry's largest magnitude, step {args.step:g})")
+
+    with tempfile.TemporaryDirectory(prefix='gift_symbolic_') as cache_dir:
+        cold = startup(cache_dir)
+        warm = startup(cache_dir)
+    print(f"Start-up in a fresh process: {cold * 1e3:.0f} ms compiled, "
+          f"{warm * 1e3:.0f} ms from the disk cache")
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()
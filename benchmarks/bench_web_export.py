@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - HTML Data Export Benchmark
+=============================================
+
+Payload and decode cost of the precomputed page data of gift.web_export,
+per array, against the same arrays as JSON number lists (what the pages
+would fetch without a binary format):
+
+- bytes on the wire, raw and gzip-compressed
+- decode time: typed views on the buffer (np.frombuffer, like the pages'
+  Float32Array / Uint16Array) vs json.loads of the lists
+
+First paint itself is browser-side: gift_data.js logs the fetch-to-views
+time of each page load to the console.
+
+Usage:
+    python benchmarks/bench_web_export.py
+    python benchmarks/bench_web_export.py --frames 240 --repeat 20
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from gift import web_export
+from gift.observables import OBSERVABLES, evaluate
+
+
+def best(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--frames', type=int, default=web_export.DEFAULT_FRAMES,
+                        help=f"rotation frames (default: {web_export.DEFAULT_FRAMES})")
+    parser.add_argument('--repeat', type=int, default=10,
+                        help="decodes timed per array, best kept (default: 10)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    exported, columns = web_export.arrays(args.frames)
+    buffer, entries = web_export.pack(exported)
+    export_s = time.perf_counter() - start
+
+    # JSON equivalents: float arrays as nested lists, the table dequantized
+    # to full-precision observables as the explorer would compute them
+    grid = web_export.GRID
+    mesh = np.meshgrid(*grid.values(), indexing='ij')
+    results = evaluate(dict(zip(grid, mesh)))
+    as_json = {name: values.astype(float).tolist() for name, values in exported.items()}
+    as_json['observables'] = np.stack([results[name] for name in OBSERVABLES], axis=-1).tolist()
+
+    print("="*90)
+    print("HTML DATA EXPORT BENCHMARK")
+    print("="*90)
+    print(f"{'array':<26}{'binary B':>10}{'gzip B':>9}{'JSON B':>11}{'gzip B':>9}"
+          f"{'views µs':>11}{'JSON ms':>10}")
+    print("-"*90)
+    totals = np.zeros(4)
+    dtypes = {typed: dtype for dtype, typed in web_export.TYPED_ARRAYS.items()}
+    for name, entry in entries.items():
+        raw = buffer[entry['offset']:entry['offset'] + entry['byteLength']]
+        text = json.dumps(as_json[name], separators=(',', ':')).encode()
+        sizes = np.array([len(raw), len(gzip.compress(raw)), len(text), len(gzip.compress(text))])
+        totals += sizes
+        views = best(lambda: np.frombuffer(buffer, dtypes[entry['type']], entry['length'],
+                                           entry['offset']), args.repeat)
+        parse = best(lambda: json.loads(text), args.repeat)
+        print(f"{name:<26}{sizes[0]:>10,}{sizes[1]:>9,}{sizes[2]:>11,}{sizes[3]:>9,}"
+              f"{views * 1e6:>11.1f}{parse * 1e3:>10.2f}")
+    print("-"*90)
+    with tempfile.TemporaryDirectory() as directory:
+        index = web_export.export(directory, args.frames)
+        index_bytes = os.path.getsize(os.path.join(directory, web_export.INDEX_NAME))
+    print(f"{'total (+ index.json)':<26}{int(totals[0]) + index_bytes:>10,}"
+          f"{int(totals[1]):>9,}{int(totals[2]):>11,}{int(totals[3]):>9,}")
+    print(f"\nExport: {export_s:.3f} s for {index['byteLength']:,} B; "
+          f"payload ×{totals[2] / (totals[0] + index_bytes):.1f} smaller than JSON")
+    print("="*90)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Weyl Orbit Benchmark
+=======================================
+
+Enumeration of W(E₈) orbits of fundamental weights, in orbit points per
+second and peak traced memory, for two methods:
+
+- gift.weyl: canonical-parent tree walk, streamed in chunks, no visited set
+- breadth-first search over all simple reflections, deduplicated with a
+  hashed visited set of packed 64-bit keys holding the whole orbit
+
+Usage:
+    python benchmarks/bench_weyl.py
+    python benchmarks/bench_weyl.py --weights 1 2 4 --chunk 4096
+"""
+
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from gift import weyl
+
+
+def visited_set_orbit(labels):
+    """Orbit size by BFS with a global visited set"""
+    cartan = weyl.cartan_matrix().astype(np.int8)
+    frontier = weyl.dominant(labels).astype(np.int8)[None, :]
+    visited = set(weyl.pack(frontier).tolist())
+    while len(frontier):
+        images = np.concatenate([frontier - frontier[:, i:i + 1] * cartan[i]
+                                 for i in range(len(cartan))])
+        keys, first = np.unique(weyl.pack(images), return_index=True)
+        new = [k not in visited for k in keys.tolist()]
+        frontier = images[first[new]]
+        visited.update(keys[new].tolist())
+    return len(visited)
+
+
+def measured(function):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--weights', type=int, nargs='+', default=[8, 1, 2, 5, 4],
+                        help="fundamental weights ω_i to enumerate (default: 8 1 2 5 4)")
+    parser.add_argument('--chunk', type=int, default=weyl.DEFAULT_CHUNK,
+                        help=f"points per streamed chunk (default: {weyl.DEFAULT_CHUNK})")
+    args = parser.parse_args(argv)
+
+    print("="*78)
+    print("WEYL ORBIT BENCHMARK")
+    print("="*78)
+    print(f"{'weight':<8}{'orbit':>10}{'tree pts/s':>14}{'tree MB':>10}"
+          f"{'visited pts/s':>16}{'visited MB':>12}{'speedup':>8}")
+    print("-"*78)
+    for index in args.weights:
+        labels = [0] * 8
+        labels[index - 1] = 1
+        size, tree_s, tree_peak = measured(lambda: weyl.orbit_size(labels, chunk=args.chunk))
+        check, set_s, set_peak = measured(lambda: visited_set_orbit(labels))
+        assert size == check, (size, check)
+        print(f"{f'ω{index}':<8}{size:>10,}{size / tree_s:>14.3e}{tree_peak / 2**20:>10.1f}"
+              f"{size / set_s:>16.3e}{set_peak / 2**20:>12.1f}{set_s / tree_s:>7.1f}x")
+    print("="*78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Regression Benchmark Suite
+=============================================
+
+Fixed set of benchmark cases with stored JSON baselines, to catch
+slowdowns before the asset build times out:
+
+- render/<animation>: per-frame render time (update + Agg draw) of every
+  animation of generate_animations.py
+- assets/full: wall time of a complete serial asset build, without the
+  build cache (the slow case; skipped with --quick)
+- observables/*: compute_all() calls/s, scalar evaluate() calls/s and
+  batched evaluate() points/s
+- uncertainty/monte_carlo: Monte Carlo pseudo-experiments/s
+
+Every case runs its warm-up samples, then its repeat samples, and stores
+their median, mean, standard deviation, quartiles and extremes, next to a
+fingerprint of the machine and library versions. Baselines live in
+benchmarks/baselines/<fingerprint>.json, so each machine compares against
+its own; they are machine-specific and not tracked by git: record one
+with 'run --save' before the change to measure. Everything runs offline.
+
+compare flags every case whose median got worse than the baseline by
+more than --threshold percent and by more than the noise, twice the
+combined relative standard deviation of both runs' samples, and exits
+with status 1 if any did: a noisy case needs a larger change to count.
+Drift between whole runs (frequency scaling, a busy machine) is not in
+the samples; rerun before trusting a marginal flag. Different
+fingerprints are reported, as the comparison is then only indicative.
+
+Usage:
+    python benchmarks/regression.py run --save             # record this machine's baseline
+    python benchmarks/regression.py compare                # run, compare with it
+    python benchmarks/regression.py compare --threshold 5 --quick --only 'observables/*'
+    python benchmarks/regression.py run --output now.json
+    python benchmarks/regression.py compare baselines/1a2b3c4d5e6f.json now.json
+"""
+
+import os
+import sys
+import json
+import time
+import fnmatch
+import hashlib
+import argparse
+import platform
+import datetime
+import tempfile
+import subprocess
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines')
+FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 10.0
+# Changes within this many combined standard deviations count as noise
+NOISE_SIGMAS = 2
+
+
+# ============================================================================
+# Machine Fingerprint
+# ============================================================================
+
+def _cpu_model():
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8') as file:
+            for line in file:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def _memory_gb():
+    try:
+        return round(os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 2**30, 1)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def fingerprint():
+    """Machine and library versions the timings depend on, with a short id"""
+    import scipy
+    import matplotlib
+    import PIL
+
+    machine = {
+        'system': platform.system(),
+        'release': platform.release(),
+        'machine': platform.machine(),
+        'cpu': _cpu_model(),
+        'cpu_count': os.cpu_count(),
+        'memory_gb': _memory_gb(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'matplotlib': matplotlib.__version__,
+        'pillow': PIL.__version__,
+    }
+    # Kernel release changes with every update; it is recorded, not identifying
+    identity = {key: value for key, value in machine.items() if key != 'release'}
+    machine['id'] = hashlib.sha256(json.dumps(identity, sort_keys=True).encode()).hexdigest()[:12]
+    return machine
+
+
+def git_revision():
+    """Commit of the benchmarked tree, or None outside a git checkout"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ============================================================================
+# Cases
+# ============================================================================
+
+class Case:
+    """
+    One benchmark: setup() returns a callable taking one sample (a number
+    in unit), better says whether 'lower' or 'higher' values are better.
+    """
+
+    def __init__(self, name, setup, unit, better, repeat=5, warmup=1, slow=False):
+        self.name = name
+        self.setup = setup
+        self.unit = unit
+        self.better = better
+        self.repeat = repeat
+        self.warmup = warmup
+        self.slow = slow
+
+
+def _render_case(name, frames_per_sample=6):
+    """ms per frame of update + draw, over the same frames spread across the animation"""
+    def setup():
+        import generate_animations as ga
+
+        spec = ga.ANIMATIONS[name]
+        fig, update = spec['build']()
+        fig.set_dpi(spec['dpi'])
+        frames = np.linspace(0, spec['frames'] - 1, frames_per_sample).astype(int)
+
+        def sample():
+            start = time.perf_counter()
+            for frame in frames:
+                update(frame)
+                fig.canvas.draw()
+            return (time.perf_counter() - start) / len(frames) * 1e3
+        return sample
+    return setup
+
+
+def _full_assets():
+    """s for render_all() into a temporary directory, no cache, one process"""
+    import generate_animations as ga
+
+    def sample():
+        output_dir = ga.OUTPUT_DIR
+        with tempfile.TemporaryDirectory(prefix='gift_assets_') as directory:
+            ga.OUTPUT_DIR = directory
+            try:
+                start = time.perf_counter()
+                with open(os.devnull, 'w') as null:
+                    stdout, sys.stdout = sys.stdout, null
+                    try:
+                        ga.render_all(jobs=1)
+                    finally:
+                        sys.stdout = stdout
+                return time.perf_counter() - start
+            finally:
+                ga.OUTPUT_DIR = output_dir
+    return sample
+
+
+def _rate(function, calls):
+    """Sampler of function() calls per second over batches of calls"""
+    def sample():
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        return calls / (time.perf_counter() - start)
+    return sample
+
+
+def _compute_all():
+    from gift.observables import GIFTObservables
+    return _rate(GIFTObservables().compute_all, 2000)
+
+
+def _evaluate_scalar():
+    from gift.observables import evaluate
+    return _rate(evaluate, 2000)
+
+
+def _evaluate_batched(points=10**6):
+    from gift.observables import evaluate
+    params = {'p2': np.linspace(1.5, 2.5, points), 'Weyl_factor': np.linspace(4, 6, points)}
+
+    def sample():
+        start = time.perf_counter()
+        evaluate(params)
+        return points / (time.perf_counter() - start)
+    return sample
+
+
+def _monte_carlo(samples=2**20):
+    from gift.uncertainty import propagate
+
+    def sample():
+        start = time.perf_counter()
+        propagate(samples, seed=0)
+        return samples / (time.perf_counter() - start)
+    return sample
+
+
+ANIMATION_NAMES = ('e8_root_rotation', 'dimensional_reduction', 'cohomology_breakdown',
+                   'precision_evolution')
+
+CASES = [Case(f'render/{name}', _render_case(name), 'ms/frame', 'lower')
+         for name in ANIMATION_NAMES]
+CASES += [
+    Case('assets/full', _full_assets, 's', 'lower', repeat=1, warmup=0, slow=True),
+    Case('observables/compute_all', _compute_all, 'calls/s', 'higher', repeat=9),
+    Case('observables/evaluate_scalar', _evaluate_scalar, 'calls/s', 'higher', repeat=9),
+    Case('observables/evaluate_batched', _evaluate_batched, 'points/s', 'higher', repeat=7),
+    Case('uncertainty/monte_carlo', _monte_carlo, 'samples/s', 'higher', repeat=5),
+]
+
+
+def select(patterns=None, quick=False):
+    """Cases matching any of the glob patterns (all by default), minus slow ones if quick"""
+    return [case for case in CASES
+            if (not patterns or any(fnmatch.fnmatch(case.name, pattern) for pattern in patterns))
+            and not (quick and case.slow)]
+
+
+# ============================================================================
+# Running
+# ============================================================================
+
+def statistics(samples):
+    samples = np.asarray(samples, dtype=float)
+    q1, median, q3 = np.percentile(samples, [25, 50, 75])
+    return {
+        'median': float(median), 'mean': float(samples.mean()),
+        'stdev': float(samples.std(ddof=1)) if len(samples) > 1 else 0.0,
+        'min': float(samples.min()), 'max': float(samples.max()),
+        'q1': float(q1), 'q3': float(q3),
+    }
+
+
+def run_case(case, repeat=None, warmup=None, log=None):
+    """Result dict of one case: unit, direction, samples and their statistics"""
+    repeat = case.repeat if repeat is None else repeat
+    warmup = case.warmup if warmup is None else warmup
+    sample = case.setup()
+    for _ in range(warmup):
+        sample()
+    samples = [sample() for _ in range(repeat)]
+    result = {'unit': case.unit, 'better': case.better, 'warmup': warmup,
+              'repeat': repeat, 'samples': samples, **statistics(samples)}
+    if log is not None:
+        log(f"{case.name:<32}{result['median']:>14.4g} {case.unit:<10}"
+            f"±{100 * result['stdev'] / result['median'] if result['median'] else 0:.1f}%")
+    return result
+
+
+def run(cases, repeat=None, warmup=None, log=print):
+    """Run cases and return the results document"""
+    return {
+        'version': FORMAT_VERSION,
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'fingerprint': fingerprint(),
+        'cases': {case.name: run_case(case, repeat, warmup, log) for case in cases},
+    }
+
+
+def baseline_path(machine=None):
+    """Stored baseline of a machine fingerprint (this machine by default)"""
+    machine = fingerprint() if machine is None else machine
+    return os.path.join(BASELINE_DIR, f"{machine['id']}.json")
+
+
+def save(results, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=1)
+    return path
+
+
+def load(path):
+    with open(path, encoding='utf-8') as file:
+        results = json.load(file)
+    if results.get('version') != FORMAT_VERSION:
+        raise ValueError(f"{path}: benchmark format {results.get('version')}, "
+                         f"expected {FORMAT_VERSION}")
+    return results
+
+
+# ============================================================================
+# Comparison
+# ============================================================================
+
+def spread(result):
+    """Relative standard deviation of a case result's samples, in percent"""
+    return 100 * result['stdev'] / result['median'] if result['median'] else 0.0
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Per-case comparison of medians: [(name, baseline, current, change %,
+    noise %, status)], change > 0 meaning slower and noise NOISE_SIGMAS
+    times the combined spread of both runs; status 'REGRESSION' or
+    'faster' when the change exceeds both threshold and noise, 'ok', or
+    'new' / 'missing' for cases in only one of the two.
+    """
+    rows = []
+    for name in list(baseline['cases']) + [name for name in current['cases']
+                                           if name not in baseline['cases']]:
+        before = baseline['cases'].get(name)
+        after = current['cases'].get(name)
+        if before is None or after is None:
+            rows.append((name, before and before['median'], after and after['median'],
+                         None, None, 'new' if before is None else 'missing'))
+            continue
+        ratio = after['median'] / before['median']
+        change = 100 * (ratio - 1 if before['better'] == 'lower' else 1 / ratio - 1)
+        noise = NOISE_SIGMAS * float(np.hypot(spread(before), spread(after)))
+        limit = max(threshold, noise)
+        status = 'REGRESSION' if change > limit else 'faster' if change < -limit else 'ok'
+        rows.append((name, before['median'], after['median'], change, noise, status))
+    return rows
+
+
+def fingerprint_differences(baseline, current):
+    """{key: (baseline, current)} of the fingerprint entries that differ"""
+    before, after = baseline['fingerprint'], current['fingerprint']
+    return {key: (before.get(key), after.get(key)) for key in sorted(set(before) | set(after))
+            if key not in ('id', 'release') and before.get(key) != after.get(key)}
+
+
+def print_comparison(baseline, current, threshold):
+    rows = compare(baseline, current, threshold)
+    print("="*90)
+    print(f"BENCHMARK COMPARISON (threshold {threshold:g}%)")
+    print("="*90)
+    print(f"Baseline: {baseline['created']} rev {baseline.get('revision')} "
+          f"machine {baseline['fingerprint']['id']}")
+    print(f"Current:  {current['created']} rev {current.get('revision')} "
+          f"machine {current['fingerprint']['id']}")
+    differences = fingerprint_differences(baseline, current)
+    for key, (before, after) in differences.items():
+        print(f"  fingerprint differs: {key}: {before} -> {after}")
+    if differences:
+        print("  (different machines or libraries: changes are only indicative)")
+    print("-"*90)
+    print(f"{'case':<30}{'unit':<9}{'baseline':>10}{'current':>10}{'slower %':>10}"
+          f"{'noise %':>9}  status")
+    print("-"*90)
+    for name, before, after, change, noise, status in rows:
+        unit = (current['cases'].get(name) or baseline['cases'][name])['unit']
+        print(f"{name:<30}{unit:<9}"
+              f"{before if before is not None else float('nan'):>10.4g}"
+              f"{after if after is not None else float('nan'):>10.4g}"
+              f"{change if change is not None else float('nan'):>10.1f}"
+              f"{noise if noise is not None else float('nan'):>9.1f}  {status}")
+    print("="*90)
+    print(f"Medians compared; flagged beyond both the threshold and the noise "
+          f"({NOISE_SIGMAS}x the combined sample spread)")
+    regressions = [row[0] for row in rows if row[5] == 'REGRESSION']
+    listed = f": {', '.join(regressions)}" if regressions else ''
+    print(f"{len(regressions)} regression(s){listed}")
+    return regressions
+
+
+# ============================================================================
+# Main Execution
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    selection = argparse.ArgumentParser(add_help=False)
+    selection.add_argument('--only', nargs='+', metavar='PATTERN',
+                           help="case name globs, e.g. 'render/*' (default: all)")
+    selection.add_argument('--quick', action='store_true', help="skip slow cases (assets/full)")
+    selection.add_argument('--repeat', type=int, help="samples per case (default: per case)")
+    selection.add_argument('--warmup', type=int,
+                           help="warm-up samples per case (default: per case)")
+
+    run_parser = commands.add_parser('run', parents=[selection], help="run the suite")
+    run_parser.add_argument('--output', metavar='PATH', help="write the results to PATH")
+    run_parser.add_argument('--save', action='store_true',
+                            help="store the results as this machine's baseline")
+
+    compare_parser = commands.add_parser('compare', parents=[selection],
+                                         help="compare results with a baseline")
+    compare_parser.add_argument('baseline', nargs='?',
+                                help="baseline file (default: this machine's stored baseline)")
+    compare_parser.add_argument('current', nargs='?',
+                                help="results file (default: run the baseline's cases now)")
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                help=f"slowdown flagged as a regression, in percent, "
+                                     f"if also beyond the noise "
+                                     f"(default: {DEFAULT_THRESHOLD:g})")
+    compare_parser.add_argument('--output', metavar='PATH', help="write the new results to PATH")
+
+    commands.add_parser('list', help="list the cases")
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        for case in CASES:
+            print(f"{case.name:<32}{case.unit:<10}{case.better:<8}"
+                  f"repeat {case.repeat}, warm-up {case.warmup}{', slow' if case.slow else ''}")
+        return 0
+
+    if args.command == 'run':
+        cases = select(args.only, args.quick)
+        results = run(cases, args.repeat, args.warmup)
+        paths = ([args.output] if args.output else []) + ([baseline_path()] if args.save else [])
+        for path in paths:
+            print(f"Results written to {save(results, path)}")
+        return 0
+
+    baseline_file = args.baseline or baseline_path()
+    if not os.path.exists(baseline_file):
+        parser.error(f"no baseline at {baseline_file}; record one with 'run --save'")
+    baseline = load(baseline_file)
+    if args.current:
+        current = load(args.current)
+    else:
+        patterns = args.only or list(baseline['cases'])
+        current = run(select(patterns, args.quick), args.repeat, args.warmup)
+        if args.output:
+            save(current, args.output)
+        # Cases left out on purpose (--only, --quick) are not missing
+        baseline['cases'] = {name: result for name, result in baseline['cases'].items()
+                             if name in current['cases']}
+    regressions = print_comparison(baseline, current, args.threshold)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,17 @@ Animations created:
 3. cohomology_breakdown.gif - H2(21) and H3(77) decomposition
 4. precision_evolution.gif - v1 vs v2 improvement
 
+Usage:
+    python generate_animations.py            # serial rendering
+    python generate_animations.py --jobs 8   # frames split across 8 processes
+    python generate_animations.py --stream   # encode frames as they render
+    python generate_animations.py --format mp4   # stream to ffmpeg (MP4/WebM)
+    python generate_animations.py --force    # ignore the build cache
+    python generate_animations.py --profile --profile-trace trace.json   # stage timings
+    python generate_animations.py --profiles publication thumbnail readme 4k
+    python generate_animations.py --profiles all --output-dir build/animations
+    python generate_animations.py --dataset pdg2024   # revalidate, re-render what changed
+
 Author: Brieuc de La Fourniere
 Version: 2.0
 Date: October 2025
@@ -23,16 +34,29 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
+import argparse
+import json
+import os
+from collections import deque
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
+import matplotlib
+# Frames are rasterized off-screen, identically in every worker process
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from matplotlib.patches import Circle, Rectangle, FancyBboxPatch, Wedge
 from matplotlib.collections import LineCollection
-import os
+from PIL import Image
 
-# Setup
+from gift import e8, encoders, profiling, revalidation
+from gift.render_cache import RenderCache, content_hash
+
+# Setup: the output directories of every render profile are created on
+# first write, below OUTPUT_DIR (see RENDER_PROFILES and --output-dir)
 OUTPUT_DIR = "../publication/animations"
-os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # Color scheme
 COLORS = {
@@ -48,38 +72,22 @@ COLORS = {
 # Animation 1: E₈ Root System Rotation
 # ============================================================================
 
-def generate_e8_roots_animation():
-    """Generate rotating E8 root system visualization"""
-    print("Generating E8 root rotation animation...")
-    
-    # Generate simplified E8 roots (subset for performance)
-    def generate_e8_roots():
-        roots = []
-        # Type 1: ±ei±ej (112 roots)
-        for i in range(8):
-            for j in range(i+1, 8):
-                for s1 in [-1, 1]:
-                    for s2 in [-1, 1]:
-                        root = np.zeros(8)
-                        root[i] = s1
-                        root[j] = s2
-                        roots.append(root)
-        
-        # Type 2: (±1/2)^8 with even minus count (subset)
-        for i in range(32):
-            root = []
-            minus_count = 0
-            for j in range(8):
-                val = 0.5 if ((i >> j) & 1) else -0.5
-                root.append(val)
-                if val < 0:
-                    minus_count += 1
-            if minus_count % 2 == 0:
-                roots.append(np.array(root))
-        
-        return np.array(roots[:240])  # Limit to 240
-    
-    roots = generate_e8_roots()
+# Coordinate planes of R⁸ rotated over one loop (full turns per plane).
+# The default spins the 3D projection about x₃; adding planes that reach
+# x₄..x₈, e.g. ((0, 1), (2, 5)), tumbles the roots through all of SO(8).
+E8_ROTATION = {'planes': ((0, 1),), 'turns': 1}
+
+
+def e8_rotation_frames(n_frames=120):
+    """Every frame's 3D root coordinates and colormap values, precomputed"""
+    with profiling.stage('data', animation='e8_root_rotation'):
+        frames = e8.rotation_frames(n_frames, **E8_ROTATION)
+        return frames, e8.depth_colors(frames)
+
+
+def build_e8_roots_animation():
+    """Build the rotating E8 root system figure and its frame callback"""
+    frames, colors = e8_rotation_frames()
     
     # Setup figure
     fig = plt.figure(figsize=(10, 10), facecolor='#1a1a2e')
@@ -90,22 +98,13 @@ def generate_e8_roots_animation():
         ax.clear()
         ax.set_facecolor('#16213e')
         
-        # Rotate roots
-        angle = frame * 2 * np.pi / 120
-        rotation_matrix = np.array([
-            [np.cos(angle), -np.sin(angle), 0],
-            [np.sin(angle), np.cos(angle), 0],
-            [0, 0, 1]
-        ])
-        
-        # Project to 3D
-        roots_3d = roots[:, :3]
-        rotated = np.dot(roots_3d, rotation_matrix.T)
+        # Precomputed rotated 3D projection
+        rotated = frames[frame]
         
         # Plot
         scatter = ax.scatter(rotated[:, 0], rotated[:, 1], rotated[:, 2],
-                            c=rotated[:, 2], cmap='plasma', s=30, alpha=0.8,
-                            edgecolors='white', linewidths=0.5)
+                            c=colors[frame], cmap='plasma', vmin=0, vmax=1,
+                            s=30, alpha=0.8, edgecolors='white', linewidths=0.5)
         
         ax.set_xlabel('x₁', color='white', fontsize=12)
         ax.set_ylabel('x₂', color='white', fontsize=12)
@@ -122,24 +121,68 @@ def generate_e8_roots_animation():
         
         return scatter,
     
-    # Create animation
-    anim = animation.FuncAnimation(fig, update, frames=120, interval=50, blit=False)
+    return fig, update
+
+
+def build_e8_roots_animation_retained():
+    """
+    Retained-mode variant: the scatter, labels and axis styling are created
+    once and each frame only swaps in the precomputed offsets and colors.
+    """
+    frames, colors = e8_rotation_frames()
+    
+    fig = plt.figure(figsize=(10, 10), facecolor='#1a1a2e')
+    ax = fig.add_subplot(111, projection='3d', facecolor='#16213e')
+    
+    scatter = ax.scatter(frames[0, :, 0], frames[0, :, 1], frames[0, :, 2],
+                        c=colors[0], cmap='plasma', vmin=0, vmax=1,
+                        s=30, alpha=0.8, edgecolors='white', linewidths=0.5)
+    
+    ax.set_xlabel('x₁', color='white', fontsize=12)
+    ax.set_ylabel('x₂', color='white', fontsize=12)
+    ax.set_zlabel('x₃', color='white', fontsize=12)
+    ax.set_title('E₈ Root System (240 roots)\n3D Projection', 
+                 color='white', fontsize=16, pad=20)
+    
+    ax.set_xlim([-1.5, 1.5])
+    ax.set_ylim([-1.5, 1.5])
+    ax.set_zlim([-1.5, 1.5])
+    
+    ax.tick_params(colors='white')
+    ax.grid(True, alpha=0.2)
+    
+    def update(frame):
+        scatter.set_offsets(frames[frame, :, :2])
+        scatter.set_3d_properties(frames[frame, :, 2], 'z')
+        scatter.set_array(colors[frame])
+        
+        return scatter,
     
-    # Save
-    output_path = os.path.join(OUTPUT_DIR, 'e8_root_rotation.gif')
-    anim.save(output_path, writer='pillow', fps=20, dpi=80)
-    print(f"  [OK] Saved to {output_path}")
-    plt.close()
+    return fig, update
 
 
 # ============================================================================
 # Animation 2: Dimensional Reduction Flow
 # ============================================================================
 
-def generate_dimensional_reduction_animation():
-    """Generate 496 → 99 → 18 information flow animation"""
-    print("Generating dimensional reduction flow animation...")
-    
+# Observable sector boxes: (x, y, 'sector\ncount', color)
+REDUCTION_OBSERVABLES = [
+    (7.5, 7.8, 'Neutrinos\n4', COLORS['success']),
+    (7.5, 6.8, 'Gauge\n5', COLORS['highlight']),
+    (7.5, 5.8, 'Higgs\n2', COLORS['accent1']),
+    (7.5, 4.8, 'Leptons\n3', COLORS['accent2']),
+    (7.5, 3.8, 'Cosmology\n3', COLORS['primary']),
+    (7.5, 2.8, 'Structure\n1', COLORS['secondary'])
+]
+
+
+def reduction_frame_inputs(frame):
+    """Inputs a frame shows: the observable boxes only fade in past 60%"""
+    return ['observables'] if frame / 100 > 0.6 else []
+
+
+def build_dimensional_reduction_animation():
+    """Build the 496 → 99 → 18 information flow figure and its frame callback"""
     fig, ax = plt.subplots(figsize=(12, 8), facecolor='#1a1a2e')
     ax.set_facecolor('#16213e')
     
@@ -199,16 +242,7 @@ def generate_dimensional_reduction_animation():
         if progress > 0.6:
             alpha_obs = min(1.0, (progress - 0.6) / 0.3)
             
-            observables = [
-                (7.5, 7.8, 'Neutrinos\n4', COLORS['success']),
-                (7.5, 6.8, 'Gauge\n5', COLORS['highlight']),
-                (7.5, 5.8, 'Higgs\n2', COLORS['accent1']),
-                (7.5, 4.8, 'Leptons\n3', COLORS['accent2']),
-                (7.5, 3.8, 'Cosmology\n3', COLORS['primary']),
-                (7.5, 2.8, 'Structure\n1', COLORS['secondary'])
-            ]
-            
-            for x, y, label, color in observables:
+            for x, y, label, color in REDUCTION_OBSERVABLES:
                 box = FancyBboxPatch((x, y), 1.3, 0.6,
                                     boxstyle="round,pad=0.05",
                                     edgecolor=color, facecolor=color,
@@ -237,37 +271,135 @@ def generate_dimensional_reduction_animation():
         ax.text(5, 0.5, f'Frame: {frame}/100', ha='center', va='center',
                fontsize=10, color='white', alpha=0.5)
     
-    # Create animation
-    anim = animation.FuncAnimation(fig, update, frames=100, interval=50)
+    return fig, update
+
+
+def build_dimensional_reduction_animation_retained():
+    """
+    Retained-mode variant: every box, arrow and label is created once and
+    frames only toggle visibility, fade alphas and update the frame counter.
+    """
+    fig, ax = plt.subplots(figsize=(12, 8), facecolor='#1a1a2e')
+    ax.set_facecolor('#16213e')
+    ax.set_xlim(0, 10)
+    ax.set_ylim(0, 10)
+    ax.axis('off')
+    
+    # E8xE8 box
+    box1 = FancyBboxPatch((0.5, 7), 2, 1.5, 
+                         boxstyle="round,pad=0.1", 
+                         edgecolor=COLORS['primary'], 
+                         facecolor=COLORS['primary'], 
+                         alpha=0.6, linewidth=3)
+    ax.add_patch(box1)
+    ax.text(1.5, 7.75, 'E₈×E₈', ha='center', va='center', 
+            fontsize=18, color='white', weight='bold')
+    ax.text(1.5, 7.3, '496', ha='center', va='center', 
+            fontsize=14, color='white')
+    
+    # Cohomology boxes, as (artist, fully faded-in alpha)
+    cohomology = []
+    for y, label, value, color in [(7.5, 'H²(K₇)', '21', COLORS['accent1']),
+                                   (6.2, 'H³(K₇)', '77', COLORS['accent2'])]:
+        box = FancyBboxPatch((4, y), 1.5, 0.8,
+                             boxstyle="round,pad=0.05",
+                             edgecolor=color, facecolor=color, linewidth=2)
+        ax.add_patch(box)
+        cohomology += [
+            (box, 0.6),
+            (ax.text(4.75, y + 0.4, label, ha='center', va='center',
+                     fontsize=14, color='white'), 1.0),
+            (ax.text(4.75, y, value, ha='center', va='center',
+                     fontsize=12, color='white'), 1.0),
+        ]
+    
+    # Connection lines
+    cohomology += [
+        (ax.arrow(2.5, 7.75, 1.3, 0, head_width=0.2, head_length=0.2,
+                  fc=COLORS['accent1'], ec=COLORS['accent1']), 1.0),
+        (ax.arrow(2.5, 7.5, 1.3, -0.9, head_width=0.2, head_length=0.2,
+                  fc=COLORS['accent2'], ec=COLORS['accent2']), 1.0),
+    ]
+    
+    # Observable boxes
+    observable_artists = []
+    for x, y, label, color in REDUCTION_OBSERVABLES:
+        box = FancyBboxPatch((x, y), 1.3, 0.6,
+                            boxstyle="round,pad=0.05",
+                            edgecolor=color, facecolor=color, linewidth=2)
+        ax.add_patch(box)
+        lines = label.split('\n')
+        observable_artists += [
+            (box, 0.6),
+            (ax.text(x+0.65, y+0.4, lines[0], ha='center', va='center',
+                     fontsize=10, color='white'), 1.0),
+            (ax.text(x+0.65, y+0.15, lines[1], ha='center', va='center',
+                     fontsize=9, color='white', weight='bold'), 1.0),
+        ]
+    
+    # Arrows from cohomology to observables
+    observable_arrows = [
+        ax.arrow(5.5, 7.5, 1.8, 0.2, head_width=0.15, head_length=0.15,
+                 fc=COLORS['success'], ec=COLORS['success'], linewidth=2),
+        ax.arrow(5.5, 6.5, 1.8, 0.2, head_width=0.15, head_length=0.15,
+                 fc=COLORS['highlight'], ec=COLORS['highlight'], linewidth=2),
+    ]
+    
+    # Title and labels
+    ax.text(5, 9.3, 'GIFT Dimensional Reduction', ha='center', va='center',
+           fontsize=20, color='white', weight='bold')
+    ax.text(5, 8.8, 'From E₈×E₈ Topology to Observable Physics',
+           ha='center', va='center', fontsize=14, color='white', alpha=0.8)
+    
+    # Progress indicator
+    frame_text = ax.text(5, 0.5, '', ha='center', va='center',
+                         fontsize=10, color='white', alpha=0.5)
+    
+    def update(frame):
+        progress = frame / 100  # 100 frames total
+        alpha_coh = np.clip((progress - 0.3) / 0.2, 0.0, 1.0)
+        alpha_obs = np.clip((progress - 0.6) / 0.3, 0.0, 1.0)
+        
+        for artist, alpha in cohomology:
+            artist.set_visible(progress > 0.3)
+            artist.set_alpha(alpha * alpha_coh)
+        for artist, alpha in observable_artists:
+            artist.set_visible(progress > 0.6)
+            artist.set_alpha(alpha * alpha_obs)
+        for arrow in observable_arrows:
+            arrow.set_visible(progress > 0.6 and alpha_obs > 0.5)
+            arrow.set_alpha(alpha_obs)
+        frame_text.set_text(f'Frame: {frame}/100')
+        
+        return ([artist for artist, _ in cohomology + observable_artists]
+                + observable_arrows + [frame_text])
     
-    # Save
-    output_path = os.path.join(OUTPUT_DIR, 'dimensional_reduction.gif')
-    anim.save(output_path, writer='pillow', fps=20, dpi=100)
-    print(f"  [OK] Saved to {output_path}")
-    plt.close()
+    return fig, update
 
 
 # ============================================================================
 # Animation 3: Cohomology Breakdown
 # ============================================================================
 
-def generate_cohomology_breakdown_animation():
-    """Generate H2(21) and H3(77) decomposition animation"""
-    print("Generating cohomology breakdown animation...")
-    
+# One pie per cohomology group: (title, total, [(label, value)], colors)
+COHOMOLOGY_DECOMPOSITIONS = [
+    ('H²(K₇) = 21\nGauge Bosons', 21,
+     [('SU(3)_C', 8), ('SU(2)_L', 3), ('U(1)_Y', 1), ('Massive', 9)],
+     [COLORS['success'], COLORS['accent1'], COLORS['highlight'], COLORS['secondary']]),
+    ('H³(K₇) = 77\nChiral Fermions', 77,
+     [('Quarks', 18), ('Leptons', 12), ('Higgs', 4), ('RH ν', 9), ('Dark', 34)],
+     [COLORS['success'], COLORS['accent1'], COLORS['highlight'], COLORS['accent2'], COLORS['secondary']])
+]
+
+
+def build_cohomology_breakdown_animation():
+    """Build the H2(21) and H3(77) decomposition figure and its frame callback"""
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 7), facecolor='#1a1a2e')
     
     def update(frame):
         progress = frame / 100
         
-        for ax, title, total, decomp, colors in [
-            (ax1, 'H²(K₇) = 21\nGauge Bosons', 21,
-             [('SU(3)_C', 8), ('SU(2)_L', 3), ('U(1)_Y', 1), ('Massive', 9)],
-             [COLORS['success'], COLORS['accent1'], COLORS['highlight'], COLORS['secondary']]),
-            (ax2, 'H³(K₇) = 77\nChiral Fermions', 77,
-             [('Quarks', 18), ('Leptons', 12), ('Higgs', 4), ('RH ν', 9), ('Dark', 34)],
-             [COLORS['success'], COLORS['accent1'], COLORS['highlight'], COLORS['accent2'], COLORS['secondary']])
-        ]:
+        for ax, (title, total, decomp, colors) in zip((ax1, ax2), COHOMOLOGY_DECOMPOSITIONS):
             ax.clear()
             ax.set_facecolor('#16213e')
             ax.set_xlim(-1.2, 1.2)
@@ -312,37 +444,114 @@ def generate_cohomology_breakdown_animation():
             ax.text(0, 0, str(total), ha='center', va='center',
                    fontsize=24, color='white', weight='bold')
     
-    # Create animation
-    anim = animation.FuncAnimation(fig, update, frames=100, interval=50)
+    return fig, update
+
+
+def build_cohomology_breakdown_animation_retained():
+    """
+    Retained-mode variant: wedges and labels are created once; frames only
+    sweep the wedge angles and move and fade the labels.
+    """
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 7), facecolor='#1a1a2e')
+    
+    # (total, [(wedge, label, value), ...]) for each pie chart
+    pies = []
+    for ax, (title, total, decomp, colors) in zip((ax1, ax2), COHOMOLOGY_DECOMPOSITIONS):
+        ax.set_facecolor('#16213e')
+        ax.set_xlim(-1.2, 1.2)
+        ax.set_ylim(-1.2, 1.2)
+        ax.set_aspect('equal')
+        ax.axis('off')
+        
+        # Title
+        ax.text(0, 1.35, title, ha='center', va='center',
+               fontsize=16, color='white', weight='bold')
+        
+        slices = []
+        for (label, value), color in zip(decomp, colors):
+            wedge = Wedge((0, 0), 1.0, 0, 0,
+                         facecolor=color, edgecolor='white', linewidth=2, alpha=0.7)
+            ax.add_patch(wedge)
+            text = ax.text(0, 0, f'{label}\n{value}',
+                          ha='center', va='center', fontsize=10,
+                          color='white', weight='bold')
+            slices.append((wedge, text, value))
+        pies.append((total, slices))
+        
+        # Center circle
+        center_circle = Circle((0, 0), 0.4, facecolor='#16213e', 
+                              edgecolor='white', linewidth=2)
+        ax.add_patch(center_circle)
+        
+        # Total in center
+        ax.text(0, 0, str(total), ha='center', va='center',
+               fontsize=24, color='white', weight='bold')
+    
+    def update(frame):
+        progress = frame / 100
+        alpha_label = np.clip((progress - 0.5) / 0.3, 0.0, 1.0)
+        
+        artists = []
+        for total, slices in pies:
+            # Animated pie chart
+            current_angle = 0
+            for wedge, text, value in slices:
+                angle = (value / total) * 360 * min(1.0, progress * 1.5)
+                wedge.set_visible(angle > 0)
+                wedge.set_theta1(current_angle)
+                wedge.set_theta2(current_angle + angle)
+                
+                # Labels (appear after wedge is complete)
+                mid_angle = (current_angle + angle/2) * np.pi / 180
+                label_r = 0.7
+                text.set_visible(angle > 0 and progress > 0.5)
+                text.set_position((label_r * np.cos(mid_angle),
+                                   label_r * np.sin(mid_angle)))
+                text.set_alpha(alpha_label)
+                
+                current_angle += angle
+                artists += [wedge, text]
+        
+        return artists
     
-    # Save
-    output_path = os.path.join(OUTPUT_DIR, 'cohomology_breakdown.gif')
-    anim.save(output_path, writer='pillow', fps=20, dpi=100)
-    print(f"  [OK] Saved to {output_path}")
-    plt.close()
+    return fig, update
 
 
 # ============================================================================
 # Animation 4: Precision Evolution v1 → v2
 # ============================================================================
 
-def generate_precision_evolution_animation():
-    """Generate v1 vs v2 precision improvement animation"""
-    print("Generating precision evolution animation...")
-    
-    # Data
-    observables = [
+# gift.observables names of the PRECISION_DATA observables, in order
+PRECISION_OBSERVABLES = (
+    'theta_12', 'theta_13', 'theta_23', 'delta_CP',
+    'alpha_inv_0', 'alpha_inv_MZ', 'sin2theta_W', 'alpha_s_MZ',
+    'lambda_H', 'm_H', 'Q_Koide', 'm_mu_m_e', 'm_tau_m_mu',
+    'Omega_DE', 'n_s', 'H_0',
+)
+
+PRECISION_DATA = {
+    'observables': [
         'θ₁₂', 'θ₁₃', 'θ₂₃', 'δ_CP',
         'α⁻¹(0)', 'α⁻¹(Mz)', 'sin²θw', 'αs',
         'λH', 'mH', 'Q', 'mμ/me', 'mτ/mμ',
         'ΩDE', 'ns', 'H₀'
-    ]
-    
+    ],
     # Approximate deviations (for illustration)
-    v1_dev = np.array([0.15, 0.62, 0.08, 0.02, 0.65, 0.01, 0.35, 0.08,
-                       0.18, 0.42, 0.01, 0.20, 0.15, 0.85, 0.25, 0.30])
-    v2_dev = np.array([0.062, 0.448, 0.014, 0.005, 0.474, 0.002, 0.216, 0.041,
-                       0.113, 0.294, 0.005, 0.117, 0.119, 0.703, 0.111, 0.145])
+    'v1_dev': np.array([0.15, 0.62, 0.08, 0.02, 0.65, 0.01, 0.35, 0.08,
+                        0.18, 0.42, 0.01, 0.20, 0.15, 0.85, 0.25, 0.30]),
+    'v2_dev': np.array([0.062, 0.448, 0.014, 0.005, 0.474, 0.002, 0.216, 0.041,
+                        0.113, 0.294, 0.005, 0.117, 0.119, 0.703, 0.111, 0.145]),
+    # Mean deviation over all 18 observables, as published
+    'v2_mean': 0.208,
+}
+
+
+def build_precision_evolution_animation():
+    """Build the v1 vs v2 precision improvement figure and its frame callback"""
+    # Data
+    observables = PRECISION_DATA['observables']
+    v1_dev = PRECISION_DATA['v1_dev']
+    v2_dev = PRECISION_DATA['v2_dev']
     
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10), facecolor='#1a1a2e')
     
@@ -378,7 +587,7 @@ def generate_precision_evolution_animation():
         ax2.set_facecolor('#16213e')
         
         frames_shown = int(progress * 50)
-        improvement_curve = np.linspace(0.380, 0.208, 50)[:frames_shown]
+        improvement_curve = np.linspace(0.380, PRECISION_DATA['v2_mean'], 50)[:frames_shown]
         x_curve = np.arange(frames_shown)
         
         ax2.plot(x_curve, improvement_curve, color=COLORS['accent1'], 
@@ -388,8 +597,8 @@ def generate_precision_evolution_animation():
         
         ax2.axhline(y=0.380, color=COLORS['secondary'], linestyle='--', 
                    linewidth=2, alpha=0.5, label='v1: 0.380%')
-        ax2.axhline(y=0.208, color=COLORS['success'], linestyle='--', 
-                   linewidth=2, alpha=0.5, label='v2: 0.208%')
+        ax2.axhline(y=PRECISION_DATA['v2_mean'], color=COLORS['success'], linestyle='--',
+                   linewidth=2, alpha=0.5, label=f"v2: {PRECISION_DATA['v2_mean']:.3f}%")
         
         ax2.set_xlabel('Framework Development', fontsize=14, color='white')
         ax2.set_ylabel('Mean Deviation (%)', fontsize=14, color='white')
@@ -410,23 +619,130 @@ def generate_precision_evolution_animation():
     
     plt.tight_layout()
     
-    # Create animation
-    anim = animation.FuncAnimation(fig, update, frames=100, interval=50)
+    return fig, update
+
+
+def build_precision_evolution_animation_retained():
+    """
+    Retained-mode variant: bars, curve, legends and axis styling are created
+    once. Frames fade the bars, extend the curve and its filled area, and
+    rescale the development axis as the curve grows.
+    """
+    # Data
+    observables = PRECISION_DATA['observables']
+    v1_dev = PRECISION_DATA['v1_dev']
+    v2_dev = PRECISION_DATA['v2_dev']
+    improvement = np.linspace(0.380, PRECISION_DATA['v2_mean'], 50)
+    
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10), facecolor='#1a1a2e')
+    # Lay out the empty panels, as the redraw-everything builder does
+    plt.tight_layout()
+    
+    # Top panel: Bar comparison
+    ax1.set_facecolor('#16213e')
+    
+    x = np.arange(len(observables))
+    width = 0.35
+    
+    bars1 = ax1.bar(x - width/2, v1_dev, width, label='v1', 
+                   color=COLORS['secondary'], edgecolor='white')
+    bars2 = ax1.bar(x + width/2, v2_dev, width, label='v2',
+                   color=COLORS['success'], edgecolor='white')
+    
+    ax1.set_ylabel('Deviation (%)', fontsize=14, color='white')
+    ax1.set_title('GIFT Framework Evolution: v1 → v2', 
+                 fontsize=18, color='white', weight='bold', pad=20)
+    ax1.set_xticks(x)
+    ax1.set_xticklabels(observables, rotation=45, ha='right', fontsize=10, color='white')
+    legend = ax1.legend(fontsize=12, facecolor='#16213e', edgecolor='white', labelcolor='white')
+    ax1.tick_params(colors='white')
+    ax1.grid(axis='y', alpha=0.2, color='white')
+    ax1.axhline(y=1.0, color='red', linestyle='--', linewidth=2, alpha=0.5, label='1% threshold')
+    
+    # Bars and their legend swatches fade in together
+    faded = list(bars1) + list(bars2) + legend.get_patches()
+    
+    # Bottom panel: Mean deviation evolution
+    ax2.set_facecolor('#16213e')
+    
+    curve, = ax2.plot([], [], color=COLORS['accent1'], 
+                      linewidth=3, marker='o', markersize=4)
+    area = ax2.fill_between([], 0, [], color=COLORS['accent1'], alpha=0.3)
+    
+    ax2.axhline(y=0.380, color=COLORS['secondary'], linestyle='--', 
+               linewidth=2, alpha=0.5, label='v1: 0.380%')
+    ax2.axhline(y=PRECISION_DATA['v2_mean'], color=COLORS['success'], linestyle='--',
+               linewidth=2, alpha=0.5, label=f"v2: {PRECISION_DATA['v2_mean']:.3f}%")
+    
+    ax2.set_xlabel('Framework Development', fontsize=14, color='white')
+    ax2.set_ylabel('Mean Deviation (%)', fontsize=14, color='white')
+    ax2.set_title('Precision Improvement Over Time', 
+                 fontsize=16, color='white', weight='bold')
+    ax2.set_ylim(0, 0.5)
+    ax2.legend(fontsize=12, facecolor='#16213e', edgecolor='white', labelcolor='white')
+    ax2.tick_params(colors='white')
+    ax2.grid(alpha=0.2, color='white')
+    
+    # Stats text
+    stats = [
+        ax2.text(25, 0.45, 'Parameter reduction: 4 → 3', 
+                fontsize=12, color=COLORS['success'], weight='bold'),
+        ax2.text(25, 0.40, 'Improvement: 45% better precision',
+                fontsize=12, color=COLORS['accent1'], weight='bold'),
+    ]
+    
+    def update(frame):
+        progress = frame / 100
+        
+        # Fade in bars
+        alpha = min(1.0, progress * 2)
+        for patch in faded:
+            patch.set_alpha(alpha)
+        
+        frames_shown = int(progress * 50)
+        x_curve = np.arange(frames_shown)
+        y_curve = improvement[:frames_shown]
+        curve.set_data(x_curve, y_curve)
+        
+        # Same outline as fill_between(x_curve, 0, y_curve)
+        if frames_shown:
+            baseline = np.column_stack([x_curve, np.zeros(frames_shown)])
+            top = np.column_stack([x_curve, y_curve])
+            area.set_verts([np.concatenate([top[:1], baseline, top[-1:], top[::-1]])])
+        else:
+            area.set_verts([])
+        
+        # The development axis follows the curve, as autoscaling did
+        ax2.relim()
+        ax2.autoscale_view(scaley=False)
+        
+        alpha_text = np.clip((progress - 0.8) / 0.2, 0.0, 1.0)
+        for text in stats:
+            text.set_visible(progress > 0.8)
+            text.set_alpha(alpha_text)
+        
+        return faded + [curve, area] + stats
     
-    # Save
-    output_path = os.path.join(OUTPUT_DIR, 'precision_evolution.gif')
-    anim.save(output_path, writer='pillow', fps=20, dpi=100)
-    print(f"  [OK] Saved to {output_path}")
-    plt.close()
+    return fig, update
 
 
 # ============================================================================
 # Animation 5: Framework Summary Card (Static image for README)
 # ============================================================================
 
-def generate_summary_card():
-    """Generate static summary card for README"""
+# Figures shown on the summary card, as published; apply_assets() replaces
+# them with those revalidated against a dataset
+SUMMARY_CARD = {
+    'mean_deviation': '0.208%',
+    'deviations': {'delta_CP': '0.005%', 'Q_Koide': '0.005%', 'Omega_DE': '0.60%',
+                   'N_generations': '0.000%'},
+}
+
+
+def generate_summary_card(profiles=None):
+    """Generate static summary card for README (publication profile by default)"""
     print("Generating summary card...")
+    profiles = profiles or [DEFAULT_PROFILE]
     
     fig, ax = plt.subplots(figsize=(12, 8), facecolor='#1a1a2e')
     ax.set_facecolor('#16213e')
@@ -448,15 +764,16 @@ def generate_summary_card():
     
     ax.text(5, 7.3, '18 Observables from 3 Parameters', ha='center', va='center',
            fontsize=20, color='white', weight='bold')
-    ax.text(5, 6.7, 'Mean Precision: 0.208%', ha='center', va='center',
+    ax.text(5, 6.7, f"Mean Precision: {SUMMARY_CARD['mean_deviation']}", ha='center', va='center',
            fontsize=16, color=COLORS['success'], weight='bold')
     
     # Key results (4 boxes)
+    deviations = SUMMARY_CARD['deviations']
     results = [
-        ("δ_CP = ζ(3)+√5\n196.99°", "0.005%\ndeviation", COLORS['success']),
-        ("Q = 2/3 exact\n(Koide)", "0.005%\ndeviation", COLORS['success']),
-        ("ΩDE = ln(2)\n(binary)", "0.60%\ndeviation", COLORS['accent1']),
-        ("Ngen = 3\n(exact)", "0.000%\ndeviation", COLORS['success'])
+        ("δ_CP = ζ(3)+√5\n196.99°", f"{deviations['delta_CP']}\ndeviation", COLORS['success']),
+        ("Q = 2/3 exact\n(Koide)", f"{deviations['Q_Koide']}\ndeviation", COLORS['success']),
+        ("ΩDE = ln(2)\n(binary)", f"{deviations['Omega_DE']}\ndeviation", COLORS['accent1']),
+        ("Ngen = 3\n(exact)", f"{deviations['N_generations']}\ndeviation", COLORS['success'])
     ]
     
     x_positions = [1.5, 3.8, 6.1, 8.4]
@@ -517,49 +834,776 @@ def generate_summary_card():
     
     plt.tight_layout()
     
-    # Save as high-res PNG
-    output_path = os.path.join(OUTPUT_DIR, 'gift_summary_card.png')
-    plt.savefig(output_path, dpi=150, facecolor='#1a1a2e', edgecolor='none',
-               bbox_inches='tight')
-    print(f"  [OK] Saved to {output_path}")
-    plt.close()
+    # Save as high-res PNG, once per profile from the same figure
+    for profile in profiles:
+        path = output_path('gift_summary_card.png', profile)
+        fig.savefig(path, dpi=profile_dpi(fig, SUMMARY_CARD_DPI, profile),
+                    facecolor='#1a1a2e', edgecolor='none', bbox_inches='tight')
+        print(f"  [OK] Saved to {path}")
+    plt.close(fig)
+
+
+# ============================================================================
+# Render Pipeline
+# ============================================================================
+
+# Frame count, playback rate and rasterization DPI of each animation.
+# 'build' redraws every frame from scratch; 'build_retained' mutates
+# persistent artists, and 'blit' marks whether its frames only touch the
+# artists that update() returns (safe for FuncAnimation(..., blit=True)).
+# 'inputs' is the data the builders read, hashed into the build cache
+# keys; 'frame_inputs' optionally narrows down which inputs one frame
+# shows, so changing an input only re-renders the frames that show it.
+ANIMATIONS = {
+    'e8_root_rotation': {
+        'label': 'E8 root rotation',
+        'build': build_e8_roots_animation,
+        'build_retained': build_e8_roots_animation_retained,
+        'blit': True,
+        'inputs': {'rotation': E8_ROTATION, 'frames': e8_rotation_frames, 'e8': e8},
+        'frames': 120, 'fps': 20, 'dpi': 80,
+    },
+    'dimensional_reduction': {
+        'label': 'dimensional reduction flow',
+        'build': build_dimensional_reduction_animation,
+        'build_retained': build_dimensional_reduction_animation_retained,
+        'blit': True,
+        'inputs': {'observables': REDUCTION_OBSERVABLES},
+        'frame_inputs': reduction_frame_inputs,
+        'frames': 100, 'fps': 20, 'dpi': 100,
+    },
+    'cohomology_breakdown': {
+        'label': 'cohomology breakdown',
+        'build': build_cohomology_breakdown_animation,
+        'build_retained': build_cohomology_breakdown_animation_retained,
+        'blit': True,
+        'inputs': {'decompositions': COHOMOLOGY_DECOMPOSITIONS},
+        'frames': 100, 'fps': 20, 'dpi': 100,
+    },
+    'precision_evolution': {
+        'label': 'precision evolution',
+        'build': build_precision_evolution_animation,
+        'build_retained': build_precision_evolution_animation_retained,
+        # The development axis rescales every frame, which blitting misses
+        'blit': False,
+        'inputs': PRECISION_DATA,
+        'frames': 100, 'fps': 20, 'dpi': 100,
+    },
+}
+
+
+def make_animation(name, retained=False):
+    """Wrap an animation's figure in a FuncAnimation for interactive display"""
+    spec = ANIMATIONS[name]
+    if retained:
+        fig, update = spec['build_retained']()
+        blit = spec['blit']
+    else:
+        fig, update = spec['build']()
+        blit = False
+    return animation.FuncAnimation(fig, update, frames=spec['frames'],
+                                   interval=1000 / spec['fps'], blit=blit)
+
+
+# Declarative output variants of every animation and of the summary card.
+# 'width' fixes the width in pixels: the DPI follows from each figure's
+# size in inches, so the layout is the same in every variant. Without it
+# the DPIs of ANIMATIONS (and SUMMARY_CARD_DPI) apply. 'frame_step' keeps
+# every n-th frame at 1/n the frame rate, so every variant lasts as long.
+# 'directory' is relative to OUTPUT_DIR (the profile name by default), and
+# 'stream' encodes frames as they arrive, keeping large frames out of memory.
+RENDER_PROFILES = {
+    'publication': {'directory': ''},
+    'thumbnail': {'width': 320, 'frame_step': 2},
+    'readme': {'width': 800},
+    '4k': {'width': 3840, 'stream': True},
+}
+
+DEFAULT_PROFILE = 'publication'
+
+SUMMARY_CARD_DPI = 150
+
+
+def profile_settings(profile):
+    """Settings of a render profile, defaults filled in"""
+    settings = {'width': None, 'frame_step': 1, 'directory': profile, 'stream': False}
+    settings.update(RENDER_PROFILES[profile])
+    return settings
+
+
+def load_profiles(path):
+    """Add or override render profiles from a JSON object of name -> settings"""
+    with open(path, encoding='utf-8') as f:
+        profiles = json.load(f)
+    known = set(profile_settings(DEFAULT_PROFILE))
+    for name, settings in profiles.items():
+        unknown = set(settings) - known
+        if unknown:
+            raise ValueError(f"Render profile {name!r}: unknown settings {sorted(unknown)}, "
+                             f"expected some of {sorted(known)}")
+        if int(settings.get('frame_step', 1)) < 1:
+            raise ValueError(f"Render profile {name!r}: frame_step must be at least 1")
+    RENDER_PROFILES.update(profiles)
+    return list(profiles)
+
+
+def profile_dpi(fig, dpi, profile):
+    """DPI of a figure in a render profile, `dpi` unless the profile fixes a width"""
+    width = profile_settings(profile)['width']
+    if width is None:
+        return dpi
+    # Half a pixel of headroom, as Agg truncates the canvas size to whole pixels
+    return (width + 0.5) / fig.get_figwidth()
+
+
+def output_path(filename, profile=None):
+    """Path of an output file of a render profile, creating its directory"""
+    settings = profile_settings(profile or DEFAULT_PROFILE)
+    directory = os.path.join(OUTPUT_DIR, settings['directory'])
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, filename)
+
+
+def iter_profile_frames(name, draws, retained=False):
+    """
+    Rasterize frames of an animation for several render profiles at once.
+    
+    `draws` maps each frame to render to the profiles to draw it for. The
+    figure is built once and every frame updated once: the artists, and
+    the data behind them, are shared by all the resolutions, and each
+    extra profile only costs rasterizing the frame again. Every call
+    builds its own figure, so chunks of frames can be rendered in separate
+    worker processes.
+    
+    Yields (frame, profile, buffer) in frame order, then in each frame's
+    profile order. The buffer is the canvas' own (height, width, 4) RGBA
+    buffer, without a copy: it is only valid until the next one is drawn.
+    """
+    spec = ANIMATIONS[name]
+    with profiling.stage('build', animation=name):
+        fig, update = spec['build_retained' if retained else 'build']()
+    dpis = {profile: profile_dpi(fig, spec['dpi'], profile)
+            for profiles in draws.values() for profile in profiles}
+    
+    try:
+        for frame in sorted(draws):
+            with profiling.stage('frame/update'):
+                update(frame)
+            for profile in draws[frame]:
+                if fig.dpi != dpis[profile]:
+                    fig.set_dpi(dpis[profile])
+                with profiling.stage('frame/draw'):
+                    fig.canvas.draw()
+                yield frame, profile, np.asarray(fig.canvas.buffer_rgba())
+    finally:
+        plt.close(fig)
+
+
+def iter_frames(name, start, stop, retained=False):
+    """
+    Rasterize frames [start, stop) of an animation at its publication
+    resolution; each buffer is only valid until the next one is drawn.
+    """
+    draws = {frame: [DEFAULT_PROFILE] for frame in range(start, stop)}
+    for _, _, buffer in iter_profile_frames(name, draws, retained):
+        yield buffer
+
+
+def render_frames(name, draws, retained=False):
+    """
+    Rasterize frames of an animation into standalone buffers (see
+    iter_profile_frames for `draws`).
+    
+    Returns:
+        list of (frame, profile, (width, height), raw RGBA frame buffer)
+    """
+    frames = []
+    for frame, profile, buffer in iter_profile_frames(name, draws, retained):
+        height, width = buffer.shape[:2]
+        frames.append((frame, profile, (width, height), buffer.tobytes()))
+    return frames
+
+
+def frame_chunks(n_frames, n_chunks):
+    """Split range(n_frames) into at most n_chunks contiguous (start, stop) pairs"""
+    bounds = np.linspace(0, n_frames, min(n_chunks, n_frames) + 1).astype(int)
+    return [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+class CollectedGifWriter(encoders.StreamWriter):
+    """
+    GIF writer with the same output as matplotlib's PillowWriter: frames
+    are converted as they arrive and encoded all at once by Pillow's
+    save_all() on close, so every frame is held in memory until then.
+    """
+    
+    def _open(self):
+        self._images = []
+    
+    def _write(self, frame):
+        image = Image.frombuffer('RGBA', self.size, frame, 'raw', 'RGBA', 0, 1)
+        # Same conversion as PillowWriter: opaque frames go through RGB,
+        # which quantizes to the GIF palette more cleanly
+        if image.getextrema()[3][0] == 255:
+            image = image.convert('RGB')
+        else:
+            # Detach from the buffer, which the next frame may overwrite
+            image = image.copy()
+        self._images.append(image)
+    
+    def _close(self):
+        with profiling.stage('encode', frames=len(self._images)):
+            self._images[0].save(self.path, save_all=True, append_images=self._images[1:],
+                                 duration=int(1000 / self.fps), loop=0)
+        self._images = None
+    
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is not None:
+            # Nothing worth encoding from an interrupted animation
+            self._closed = True
+            self._images = None
+        self.close()
+
+
+def save_gif(output_path, frames, fps):
+    """Encode RGBA frames, in frame order, to a GIF holding them all in memory"""
+    with CollectedGifWriter(output_path, fps) as writer:
+        for frame in frames:
+            with profiling.stage('frame/encode'):
+                writer.write(frame)
+
+
+def open_output(path, fps, stream=False):
+    """
+    Writer of an animation file, by extension. GIFs are collected and
+    encoded at the end unless streamed; mp4 and webm always stream.
+    """
+    if path.lower().endswith('.gif') and not stream:
+        return CollectedGifWriter(path, fps)
+    return encoders.open_writer(path, fps)
+
+
+def write_animation(name, frames, stream=False, fmt='gif', profile=None):
+    """
+    Encode an animation's frames to <name>.<fmt> in a profile's directory.
+    
+    The default GIF path collects every frame before encoding, as
+    matplotlib's PillowWriter does. With stream=True (implied for mp4 and
+    webm), each frame is encoded as soon as it arrives and then dropped,
+    so memory stays constant whatever the frame count or DPI.
+    """
+    spec = ANIMATIONS[name]
+    settings = profile_settings(profile or DEFAULT_PROFILE)
+    path = output_path(f'{name}.{fmt}', profile)
+    with open_output(path, spec['fps'] / settings['frame_step'],
+                     stream or settings['stream']) as writer:
+        for frame in frames:
+            with profiling.stage('frame/encode'):
+                writer.write(frame)
+    print(f"  [OK] Saved to {path} ({writer.summary()})")
+
+
+def render_animation(name, retained=False, stream=False, fmt='gif', profile=None):
+    """Render and save one animation serially in the current process"""
+    print(f"Generating {ANIMATIONS[name]['label']} animation...")
+    profile = profile or DEFAULT_PROFILE
+    draws = {frame: [profile] for frame in
+             range(0, ANIMATIONS[name]['frames'], profile_settings(profile)['frame_step'])}
+    with profiling.stage('animation', animation=name):
+        frames = (buffer for _, _, buffer in iter_profile_frames(name, draws, retained))
+        write_animation(name, frames, stream, fmt, profile)
+
+
+def generate_e8_roots_animation():
+    """Generate rotating E8 root system visualization"""
+    render_animation('e8_root_rotation')
+
+
+def generate_dimensional_reduction_animation():
+    """Generate 496 → 99 → 18 information flow animation"""
+    render_animation('dimensional_reduction')
+
+
+def generate_cohomology_breakdown_animation():
+    """Generate H2(21) and H3(77) decomposition animation"""
+    render_animation('cohomology_breakdown')
+
+
+def generate_precision_evolution_animation():
+    """Generate v1 vs v2 precision improvement animation"""
+    render_animation('precision_evolution')
+
+
+# Upper bound on the frames of one worker task. Small chunks let the
+# parent consume results while later chunks are still rendering.
+MAX_CHUNK_FRAMES = 16
+
+
+def _worker_setup(output_dir, profiles, assets, initializer=None, initargs=()):
+    """Pool initializer: the parent's output directory, render profiles and
+    revalidated asset inputs, which workers started by spawn would
+    otherwise re-import as defaults"""
+    global OUTPUT_DIR
+    OUTPUT_DIR = output_dir
+    RENDER_PROFILES.update(profiles)
+    PRECISION_DATA.update(assets['precision_evolution'])
+    SUMMARY_CARD.update(assets['summary_card'])
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _traced(function, *args):
+    """Run a worker task; returns its result and the worker's profiling events"""
+    return function(*args), profiling.drain()
+
+
+def _pooled_frames(pool, tasks, window):
+    """
+    Yield (name, frame, profile, buffer) for every task's frames, in task order.
+    
+    At most `window` chunks are submitted or waiting to be consumed at any
+    time, so the frames held by the parent stay bounded while every worker
+    keeps busy, including across animation boundaries.
+    """
+    tasks = iter(tasks)
+    pending = deque()
+    
+    def submit_next():
+        for name, draws, retained in tasks:
+            pending.append((name, pool.submit(_traced, render_frames, name, draws, retained)))
+            return
+    
+    for _ in range(window):
+        submit_next()
+    
+    while pending:
+        name, future = pending.popleft()
+        with profiling.stage('wait'):
+            frames, events = future.result()
+        profiling.merge(events)
+        submit_next()
+        for frame, profile, (width, height), data in frames:
+            buffer = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 4)
+            yield name, frame, profile, buffer
+
+
+def environment_key():
+    """Library versions and rcParams, which every rendered pixel depends on"""
+    import PIL
+    return content_hash(
+        {'matplotlib': matplotlib.__version__, 'numpy': np.__version__,
+         'pillow': PIL.__version__},
+        {key: repr(value) for key, value in dict.items(matplotlib.rcParams)},
+    )
+
+
+def frame_cache_keys(name, retained=False, profile=None):
+    """
+    Build cache key of every frame of an animation in a render profile.
+    
+    A frame's key covers the builder's source code, COLORS, frame count,
+    DPI (or the profile's width) and environment, plus the inputs that
+    frame shows, so frames that do not show a changed input keep their
+    key. Profiles of the same resolution share their frames.
+    """
+    spec = ANIMATIONS[name]
+    builder = spec['build_retained' if retained else 'build']
+    code_key = content_hash(builder, COLORS, spec['frames'], spec['dpi'],
+                            environment_key())
+    width = profile_settings(profile or DEFAULT_PROFILE)['width']
+    if width is not None:
+        code_key = content_hash(code_key, width)
+    input_keys = {key: content_hash(value) for key, value in spec['inputs'].items()}
+    
+    keys = []
+    for frame in range(spec['frames']):
+        shown = spec['frame_inputs'](frame) if 'frame_inputs' in spec else input_keys
+        keys.append(content_hash(code_key, frame,
+                                 {key: input_keys[key] for key in shown}))
+    return keys
+
+
+def output_cache_key(name, frame_keys, stream=False, fmt='gif', fps=None):
+    """Build cache key of an animation file: its frames plus the encoding"""
+    encoder = encoders if stream or fmt != 'gif' else CollectedGifWriter
+    return content_hash(frame_keys, fps or ANIMATIONS[name]['fps'], fmt, encoder)
+
+
+def render_summary_card(profiles=None):
+    """generate_summary_card() as a profiling stage"""
+    with profiling.stage('summary_card'):
+        generate_summary_card(profiles)
+
+
+def summary_card_key(profile=None):
+    width = profile_settings(profile or DEFAULT_PROFILE)['width']
+    return content_hash(generate_summary_card, COLORS, SUMMARY_CARD, environment_key(),
+                        SUMMARY_CARD_DPI if width is None else width)
+
+
+def plan_outputs(name, profiles, retained=False, stream=False, fmt='gif', cache=None):
+    """
+    Output files of an animation, one per render profile, that are not
+    up to date in the cache (all of them without a cache).
+    
+    Each output is a dict of its profile, path, cache key, fps, whether it
+    streams, the cache keys of the frames it shows ({frame: key}) and the
+    set of those frames missing from the cache, to be rendered.
+    """
+    spec = ANIMATIONS[name]
+    outputs = []
+    for profile in profiles:
+        settings = profile_settings(profile)
+        all_keys = frame_cache_keys(name, retained, profile)
+        frame_keys = {frame: all_keys[frame]
+                      for frame in range(0, spec['frames'], settings['frame_step'])}
+        fps = spec['fps'] / settings['frame_step']
+        streamed = stream or settings['stream']
+        key = output_cache_key(name, list(frame_keys.values()), streamed, fmt, fps)
+        path = output_path(f'{name}.{fmt}', profile)
+        if cache is not None and cache.output_is_current(path, key):
+            print(f"Skipping {spec['label']} animation [{profile}] (unchanged)")
+            continue
+        missing = {frame for frame, frame_key in frame_keys.items()
+                   if cache is None or not cache.has_frame(frame_key)}
+        outputs.append({'profile': profile, 'path': path, 'key': key, 'fps': fps,
+                        'stream': streamed, 'frame_keys': frame_keys, 'missing': missing})
+    return outputs
+
+
+def frame_draws(outputs):
+    """{frame: profiles} of the frames missing from any output, in output order"""
+    draws = {}
+    for output in outputs:
+        for frame in output['missing']:
+            draws.setdefault(frame, []).append(output['profile'])
+    return dict(sorted(draws.items()))
+
+
+def _assemble_outputs(name, outputs, rendered, cache, retained):
+    """
+    Write every output of an animation in one pass over its frames: the
+    frames missing from the cache from the `rendered` (name, frame,
+    profile, buffer) stream, stored as they pass, and the others from the
+    cache.
+    """
+    with ExitStack() as stack:
+        writers = [stack.enter_context(open_output(output['path'], output['fps'],
+                                                   output['stream']))
+                   for output in outputs]
+        for frame in range(ANIMATIONS[name]['frames']):
+            for output, writer in zip(outputs, writers):
+                key = output['frame_keys'].get(frame)
+                if key is None:
+                    continue
+                if frame in output['missing']:
+                    shown = next(rendered)
+                    assert shown[:3] == (name, frame, output['profile']), \
+                        "Rendered frames out of order"
+                    data = shown[3]
+                    if cache is not None:
+                        with profiling.stage('frame/cache_store'):
+                            cache.store_frame(key, data)
+                else:
+                    with profiling.stage('frame/cache_load'):
+                        data = cache.load_frame(key)
+                    if data is None:
+                        # Lost since planning: render just this frame
+                        [(_, _, (width, height), raw)] = render_frames(
+                            name, {frame: [output['profile']]}, retained)
+                        data = np.frombuffer(raw, dtype=np.uint8).reshape(height, width, 4)
+                        cache.store_frame(key, data)
+                with profiling.stage('frame/encode'):
+                    writer.write(data)
+    for output, writer in zip(outputs, writers):
+        print(f"  [OK] Saved to {output['path']} ({writer.summary()})")
+
+
+def render_all(jobs=1, retained=False, stream=False, fmt='gif', cache=None, force=False,
+               profiles=None, names=None, summary_card=True):
+    """
+    Render every animation (or those in names) and the summary card (unless
+    summary_card=False), in every render profile.
+    
+    Each animation's figure is built once per process and each of its
+    frames updated once, then rasterized for every profile that needs it,
+    and all the profiles' files are encoded in the same pass: N variants
+    share the data preparation and the artists, and cost N
+    rasterizations and encodings rather than N full runs.
+    
+    With jobs > 1, each animation's frames are split into contiguous chunks
+    that a pool of worker processes rasterizes concurrently. Chunks are
+    stitched back in frame order and encoded exactly as in a serial run, so
+    the output files are byte-identical whatever the number of jobs.
+    
+    With retained=True, frames come from the retained-mode builders;
+    stream and fmt select the encoder (see write_animation).
+    
+    With a RenderCache, files whose cache key is unchanged are skipped and
+    only frames missing from the cache are rendered; force=True ignores
+    the cache (but refreshes it).
+    """
+    profiles = list(profiles or [DEFAULT_PROFILE])
+    reuse = cache if not force else None
+    
+    plans = []
+    for name in (names or ANIMATIONS):
+        outputs = plan_outputs(name, profiles, retained, stream, fmt, reuse)
+        if outputs:
+            plans.append((name, outputs, frame_draws(outputs)))
+    
+    card_profiles = [
+        profile for profile in (profiles if summary_card else [])
+        if reuse is None or not reuse.output_is_current(
+            output_path('gift_summary_card.png', profile), summary_card_key(profile))
+    ]
+    if summary_card and len(card_profiles) < len(profiles):
+        print("Skipping summary card (unchanged) for "
+              + ", ".join(p for p in profiles if p not in card_profiles))
+    
+    def write_planned(rendered):
+        for name, outputs, draws in plans:
+            n_render = sum(len(drawn) for drawn in draws.values())
+            n_frames = sum(len(output['frame_keys']) for output in outputs)
+            print(f"Generating {ANIMATIONS[name]['label']} animation "
+                  f"({n_render}/{n_frames} frames to render, "
+                  f"{', '.join(output['profile'] for output in outputs)})...")
+            with profiling.stage('animation', animation=name):
+                _assemble_outputs(name, outputs, rendered, cache, retained)
+            if cache is not None:
+                for output in outputs:
+                    cache.record_output(output['path'], output['key'])
+    
+    try:
+        if jobs <= 1:
+            write_planned((name, *rendered) for name, _, draws in plans
+                          for rendered in iter_profile_frames(name, draws, retained))
+            if card_profiles:
+                render_summary_card(card_profiles)
+        else:
+            tasks = []
+            for name, _, draws in plans:
+                frames = list(draws)
+                n_chunks = max(jobs, -(-len(frames) // MAX_CHUNK_FRAMES))
+                for start, stop in frame_chunks(len(frames), n_chunks):
+                    tasks.append((name, {frame: draws[frame] for frame in frames[start:stop]},
+                                  retained))
+            initializer, initargs = profiling.worker_setup()
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_worker_setup,
+                                     initargs=(OUTPUT_DIR, RENDER_PROFILES,
+                                               {'precision_evolution': PRECISION_DATA,
+                                                'summary_card': SUMMARY_CARD},
+                                               initializer, initargs)) as pool:
+                card = (pool.submit(_traced, render_summary_card, card_profiles)
+                        if card_profiles else None)
+                write_planned(_pooled_frames(pool, tasks, window=2 * jobs))
+                if card is not None:
+                    profiling.merge(card.result()[1])
+        if cache is not None:
+            for profile in card_profiles:
+                cache.record_output(output_path('gift_summary_card.png', profile),
+                                    summary_card_key(profile))
+    finally:
+        if cache is not None:
+            # Keep whatever was rendered, even from an interrupted run
+            evicted = cache.evict()
+            cache.save()
+            print(f"\nBuild cache: {cache.hits} frames reused, "
+                  f"{len(cache.manifest['frames'])} stored "
+                  f"({cache.frame_bytes / 1e6:.1f} MB, {evicted} evicted)")
+
+
+# ============================================================================
+# Dataset revalidation
+# ============================================================================
+
+# Animations reading revalidated inputs (so does the summary card)
+REVALIDATED_ANIMATIONS = ['precision_evolution']
+
+
+def precision_asset(stats, *comparisons):
+    """PRECISION_DATA inputs from the comparisons of PRECISION_OBSERVABLES"""
+    return {
+        'v2_dev': [c['deviation_percent'] if c is not None else float('nan')
+                   for c in comparisons],
+        'v2_mean': stats.get('mean_deviation_percent', float('nan')),
+    }
+
+
+def summary_card_asset(stats, delta_cp, koide, omega_de, n_generations):
+    """SUMMARY_CARD figures; the card quotes Omega_DE = ln 2 against the data"""
+    def percent(value):
+        return f"{value:.3f}%" if value is not None else "n/a"
+
+    def deviation(comparison):
+        return comparison['deviation_percent'] if comparison is not None else None
+
+    omega = None
+    if omega_de is not None and omega_de['exp'] != 0:
+        omega = abs((np.log(2) - omega_de['exp']) / omega_de['exp']) * 100
+    return {
+        'mean_deviation': percent(stats.get('mean_deviation_percent')),
+        'deviations': {'delta_CP': percent(deviation(delta_cp)),
+                       'Q_Koide': percent(deviation(koide)),
+                       'Omega_DE': percent(omega),
+                       'N_generations': percent(deviation(n_generations))},
+    }
+
+
+def asset_graph():
+    """
+    gift.revalidation's validation graph extended with the inputs of the
+    rendered assets: 'asset:precision_evolution' and 'asset:summary_card'
+    """
+    graph = revalidation.validation_graph()
+    graph.add('asset:precision_evolution', precision_asset,
+              ['statistics', *(f'comparison:{name}' for name in PRECISION_OBSERVABLES)])
+    graph.add('asset:summary_card', summary_card_asset,
+              ['statistics', 'comparison:delta_CP', 'comparison:Q_Koide', 'data:Omega_DE',
+               'comparison:N_generations'])
+    return graph
+
+
+def apply_assets(values):
+    """Feed the asset node values of an asset_graph() run to the builders"""
+    precision = values['asset:precision_evolution']
+    PRECISION_DATA.update(v2_dev=np.array(precision['v2_dev']), v2_mean=precision['v2_mean'])
+    SUMMARY_CARD.update(values['asset:summary_card'])
+
+
+def revalidate_assets(dataset):
+    """
+    Revalidate against a dataset and apply its asset inputs; unchanged
+    inputs leave the build cache keys, and so the files, unchanged.
+    """
+    result = revalidation.revalidate(dataset, graph=asset_graph())
+    record = result.dataset
+    print(f"Dataset: {record['version']}"
+          + (f" (base {record['base']})" if record['base'] else ""))
+    print(f"Revalidation: {len(result.recomputed)} nodes recomputed, "
+          f"{len(result.reused)} from the memo")
+    for name in result.recomputed:
+        print(f"  {name}")
+    apply_assets(result.values)
+    return result
 
 
 # ============================================================================
 # Main Execution
 # ============================================================================
 
-def main():
+def main(argv=None):
     """Generate all animations"""
+    global OUTPUT_DIR
+    parser = argparse.ArgumentParser(description="Generate the GIFT framework animations")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="worker processes used to render frames "
+                             "(default: 1, serial; 0: one per CPU core)")
+    parser.add_argument('--retained', action='store_true',
+                        help="render with the retained-mode builders, which reuse "
+                             "artists across frames instead of redrawing them")
+    parser.add_argument('--format', choices=['gif', 'mp4', 'webm'], default='gif',
+                        help="animation file format (default: gif); mp4 and webm "
+                             "are streamed to a local ffmpeg")
+    parser.add_argument('--stream', action='store_true',
+                        help="encode each frame as soon as it is rendered, keeping "
+                             "memory constant (implied for mp4 and webm)")
+    parser.add_argument('--force', action='store_true',
+                        help="ignore the build cache: re-render every frame and "
+                             "rewrite every file, even if unchanged")
+    parser.add_argument('--cache-size', type=float, default=1024, metavar='MB',
+                        help="size budget of cached frames, least recently used "
+                             "evicted first (default: 1024; 0 keeps no frames)")
+    parser.add_argument('--profiles', nargs='+', default=[DEFAULT_PROFILE], metavar='PROFILE',
+                        help="render profiles to produce in one pass, among "
+                             f"{', '.join(RENDER_PROFILES)} or 'all' "
+                             f"(default: {DEFAULT_PROFILE})")
+    parser.add_argument('--profiles-file', metavar='JSON',
+                        help="JSON object of extra or overridden render profiles, "
+                             "name -> {width, frame_step, directory, stream}")
+    parser.add_argument('--dataset', metavar='VERSION',
+                        help="revalidate against an experimental dataset (version in "
+                             "gift/datasets or path) and render only the assets that "
+                             "read it, re-rendering only those whose inputs changed")
+    parser.add_argument('--output-dir', default=OUTPUT_DIR,
+                        help=f"root output directory (default: {OUTPUT_DIR})")
+    parser.add_argument('--profile', action='store_true',
+                        help="time every stage (build, frame update, draw, encode, ...) "
+                             "and print per-stage statistics and per-frame histograms")
+    parser.add_argument('--profile-trace', metavar='PATH',
+                        help="also write a Chrome / Perfetto trace file (implies --profile)")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="also track peak memory per stage with tracemalloc "
+                             "(implies --profile; slows allocation-heavy stages)")
+    args = parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count()
+    OUTPUT_DIR = args.output_dir
+    if args.profiles_file:
+        try:
+            load_profiles(args.profiles_file)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+    profiles = list(RENDER_PROFILES) if 'all' in args.profiles else args.profiles
+    unknown = [profile for profile in profiles if profile not in RENDER_PROFILES]
+    if unknown:
+        parser.error(f"unknown render profiles {unknown}, expected some of "
+                     f"{list(RENDER_PROFILES)} or 'all'")
+    profiler = None
+    if args.profile or args.profile_trace or args.profile_memory:
+        profiler = profiling.enable(memory=args.profile_memory)
+    
+    # Shares GIFT_CACHE_DIR with the E8 tables; an empty value disables it
+    cache = None
+    if e8.cache_dir():
+        cache = RenderCache(os.path.join(e8.cache_dir(), 'renders'),
+                            max_bytes=int(args.cache_size * 1024**2))
+    
     print("="*70)
     print("GIFT FRAMEWORK - ANIMATION GENERATOR")
     print("="*70)
     print(f"\nOutput directory: {OUTPUT_DIR}")
+    print(f"Render profiles: {', '.join(profiles)}")
+    print(f"Worker processes: {jobs}")
+    print(f"Build cache: {cache.directory if cache else 'disabled'}")
+    names = None
+    if args.dataset:
+        try:
+            revalidate_assets(args.dataset)
+        except ValueError as e:
+            parser.error(str(e))
+        names = REVALIDATED_ANIMATIONS
     print("\nGenerating animations...\n")
     
     try:
         # Generate all animations
-        generate_e8_roots_animation()
-        generate_dimensional_reduction_animation()
-        generate_cohomology_breakdown_animation()
-        generate_precision_evolution_animation()
-        generate_summary_card()
+        render_all(jobs, args.retained, args.stream, args.format, cache, args.force,
+                   profiles, names)
         
         print("\n" + "="*70)
         print("ALL ANIMATIONS GENERATED SUCCESSFULLY")
         print("="*70)
-        print(f"\nFiles created in: {OUTPUT_DIR}/")
-        print("  1. e8_root_rotation.gif")
-        print("  2. dimensional_reduction.gif")
-        print("  3. cohomology_breakdown.gif")
-        print("  4. precision_evolution.gif")
-        print("  5. gift_summary_card.png (static)")
+        for profile in profiles:
+            directory = os.path.join(OUTPUT_DIR, profile_settings(profile)['directory'])
+            print(f"\nFiles created in: {os.path.join(directory, '')} [{profile}]")
+            for i, name in enumerate(names or ANIMATIONS, start=1):
+                print(f"  {i}. {name}.{args.format}")
+            print(f"  {len(names or ANIMATIONS) + 1}. gift_summary_card.png (static)")
         print("\nReady for README and social media sharing!")
         
     except Exception as e:
         print(f"\n[ERROR] {e}")
         import traceback
         traceback.print_exc()
+    
+    finally:
+        if profiler is not None:
+            profiling.disable()
+            print("\n" + "="*70)
+            print("PROFILE")
+            print("="*70)
+            print(profiler.report())
+            if args.profile_trace:
+                print(f"\nTrace written to {profiler.write_trace(args.profile_trace)}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Computational Core
+=====================================
+
+Reusable computations behind the GIFT v2 notebooks, animations and
+interactive pages.
+
+Modules:
+    e8 - E8 root system with cached inner products, graph and projections
+    e8_algebra - Sparse E8/E8xE8 structure constants, adjoint representation, Killing form
+    encoders - Streaming GIF/MP4/WebM frame writers with bounded memory
+    render_cache - Content-hash build cache for rendered outputs and frames
+    observables - Vectorized evaluation of the 18 observables over parameter grids
+    experimental - Experimental values and uncertainties of the observables
+    uncertainty - Monte Carlo propagation of experimental uncertainties
+    constants - GIFTConstants: topological parameters and exact relations
+    framework_v2 - GIFTFrameworkV2 of the interactive notebook
+    tables - pandas comparison tables against experiment
+    plotting - matplotlib validation charts
+    emergence - PhysicalLawsEmergence printouts
+    validation - Complete validation report (python -m gift.validation)
+    precision - Long double and mpmath backends for evaluate()
+    formula_search - Exhaustive formula search against the experimental values
+    weyl - Weyl group W(E8) orbit enumeration on integral weights
+    hodge - Discrete Hodge Laplacian spectra on T7 and T7/Γ toy models of K7
+    running - Two-loop RG running of the predicted gauge couplings, batched
+    report - Headless validation reports and scans streamed to NDJSON/Parquet/Arrow
+    web_export - Precomputed binary data (roots, rotations, observable grid) for the HTML pages
+    profiling - Opt-in stage timers, latency histograms, peak memory and Chrome traces
+    symbolic - sympy observables compiled to cached value/Jacobian/Hessian kernels
+    revalidation - Memoized revalidation graph and report diffs across dataset versions
+
+Submodules and the notebook classes are imported on first attribute
+access, so `import gift` loads nothing; the core computation needs only
+NumPy, and pandas/matplotlib are imported only by tables and plotting.
+
+Usage:
+    import gift
+    gift.GIFTObservables().compute_all()   # imports gift.observables
+    gift.compare_with_experiment(...)      # imports gift.tables (pandas)
+
+Author: Brieuc de La Fourniere
+Version: 2.0
+"""
+
+__version__ = "2.0.0"
+
+import importlib
+
+_SUBMODULES = (
+    'e8', 'e8_algebra', 'encoders', 'render_cache', 'observables', 'experimental',
+    'uncertainty', 'constants', 'framework_v2', 'tables', 'plotting',
+    'emergence', 'validation', 'precision', 'formula_search', 'weyl', 'hodge', 'running',
+    'report', 'web_export', 'profiling', 'symbolic', 'revalidation',
+)
+
+# Public name -> submodule defining it
+_ATTRIBUTES = {
+    'GIFTConstants': 'constants',
+    'GIFTObservables': 'observables',
+    'evaluate': 'observables',
+    'OBSERVABLES': 'observables',
+    'ExperimentalData': 'experimental',
+    'compare_with_experiment': 'tables',
+    'GIFTFrameworkV2': 'framework_v2',
+    'PhysicalLawsEmergence': 'emergence',
+}
+
+__all__ = sorted(_ATTRIBUTES) + list(_SUBMODULES)
+
+
+def __getattr__(name):
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(f'.{_ATTRIBUTES[name]}', __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Fundamental Constants
+========================================
+
+GIFTConstants from the validation notebook: the three independent
+topological parameters, the exact derived relations, the K7/E8
+topological data and the mathematical constants. Imports only NumPy.
+
+Usage:
+    from gift import GIFTConstants
+    c = GIFTConstants()                    # verifies the exact relations
+    c.tau, c.H_star                        # 3.8967..., 99
+    c.print_summary()
+"""
+
+from datetime import datetime
+
+import numpy as np
+
+
+class GIFTConstants:
+    """
+    Fundamental constants of the GIFT framework.
+
+    The framework proposes that all physical observables derive from
+    three independent topological parameters:
+    - p2 = 2 (duality parameter from G2/K7 and E8×E8/E8)
+    - rank(E8) = 8 (Cartan subalgebra dimension)
+    - Weyl_factor = 5 (from pentagonal symmetry in Weyl group)
+
+    All other parameters are derived through exact mathematical relations
+    or composite definitions involving topological invariants.
+    """
+
+    # ========== INDEPENDENT TOPOLOGICAL PARAMETERS (3) ==========
+    p2 = 2.0  # Duality parameter (exact)
+    rank_E8 = 8  # Cartan dimension of E8 algebra
+    Weyl_factor = 5  # Pentagonal symmetry factor
+
+    # ========== DERIVED FUNDAMENTAL PARAMETERS ==========
+    beta0 = np.pi / rank_E8  # β₀ = π/8 (exact)
+    xi = (Weyl_factor / p2) * (np.pi / rank_E8)  # ξ = 5π/16 (exact relation)
+    delta = 2 * np.pi / (Weyl_factor**2)  # δ = 2π/25 (Weyl phase)
+
+    # ========== TOPOLOGICAL DATA ==========
+    # E8 algebra properties
+    dim_E8 = 248
+    dim_E8xE8 = 2 * dim_E8  # = 496
+
+    # K7 manifold Betti numbers (cohomology dimensions)
+    b0 = 1  # H⁰(K₇)
+    b2 = 21  # H²(K₇) - gauge bosons
+    b3 = 77  # H³(K₇) - chiral fermions
+    b4 = 77  # H⁴(K₇) - Poincaré dual to b3
+    b5 = 21  # H⁵(K₇) - Poincaré dual to b2
+    b7 = 1  # H⁷(K₇)
+    H_star = b0 + b2 + b3  # Total cohomology = 99
+
+    # Geometric dimensions
+    dim_K7 = 7  # K₇ manifold dimension
+    dim_G2 = 14  # G₂ holonomy group dimension
+    dim_J3 = 27  # Exceptional Jordan algebra J₃(𝕆)
+
+    # ========== COMPOSITE PARAMETER τ ==========
+    # τ = (dim(E₈×E₈) × b₂(K₇)) / (dim(J₃(𝕆)) × H*(K₇))
+    tau = (dim_E8xE8 * b2) / (dim_J3 * H_star)  # = 10416/2673 = 3.8967...
+
+    # ========== MATHEMATICAL CONSTANTS ==========
+    pi = np.pi
+    e = np.e
+
+    # Golden ratio
+    phi = (1 + np.sqrt(5)) / 2
+
+    # Euler-Mascheroni constant (high precision)
+    gamma = 0.5772156649015328606065120900824024310421593359399235988057672348849
+
+    # Riemann zeta values
+    zeta2 = np.pi**2 / 6  # ζ(2) = π²/6 (Basel problem)
+    zeta3 = 1.2020569031595942853997381615114499907649862923404988817922715553418382
+
+    # Binary entropy
+    ln2 = np.log(2)
+
+    # Square roots
+    sqrt2 = np.sqrt(2)
+    sqrt5 = np.sqrt(5)
+    sqrt17 = np.sqrt(17)
+
+    def __init__(self):
+        """Verify exact relations hold numerically"""
+        # Verify ξ = (5/2)β₀
+        xi_check = (self.Weyl_factor / self.p2) * self.beta0
+        assert abs(self.xi - xi_check) < 1e-15, "ξ relation verification failed"
+
+        # Verify p2 from multiple origins
+        p2_local = self.dim_G2 / self.dim_K7
+        p2_global = self.dim_E8xE8 / self.dim_E8
+        assert abs(p2_local - 2.0) < 1e-15, "p2 local calculation failed"
+        assert abs(p2_global - 2.0) < 1e-15, "p2 global calculation failed"
+
+    def print_summary(self):
+        """Display fundamental parameter structure"""
+        print("="*70)
+        print("GIFT FRAMEWORK v2 - FUNDAMENTAL PARAMETERS")
+        print("="*70)
+        print(f"\nDate: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+        print("\n[INDEPENDENT TOPOLOGICAL PARAMETERS (3)]")
+        print(f"  p₂ = {self.p2} (duality)")
+        print(f"  rank(E₈) = {self.rank_E8} (Cartan dimension)")
+        print(f"  Weyl_factor = {self.Weyl_factor} (pentagonal symmetry)")
+
+        print("\n[DERIVED PARAMETERS - EXACT RELATIONS]")
+        print(f"  β₀ = π/8 = {self.beta0:.18f}")
+        print(f"  ξ = (5/2)β₀ = {self.xi:.18f}  [PROVEN: ξ = (Weyl/p₂)×β₀]")
+        print(f"  δ = 2π/25 = {self.delta:.18f}")
+
+        print("\n[COMPOSITE PARAMETER]")
+        print(f"  τ = (496×21)/(27×99) = {self.tau:.18f}")
+        print(f"    = 10416/2673 = 3472/891 (reduced form)")
+        print(f"    = (2⁴×7×31)/(3⁴×11) [Note: Mersenne prime M₅=31]")
+
+        print("\n[TOPOLOGICAL INVARIANTS]")
+        print(f"  dim(E₈×E₈) = {self.dim_E8xE8}")
+        print(f"  b₂(K₇) = {self.b2} (gauge bosons)")
+        print(f"  b₃(K₇) = {self.b3} (fermions)")
+        print(f"  H*(K₇) = {self.H_star} (total cohomology)")
+
+        print("\n[VERIFICATION OF EXACT RELATIONS]")
+        print(f"  ξ/β₀ = {self.xi/self.beta0:.18f} (expected: 2.5)")
+        print(f"  p₂(local) = G₂/K₇ = {self.dim_G2}/{self.dim_K7} = {self.dim_G2/self.dim_K7}")
+        print(f"  p₂(global) = E₈×E₈/E₈ = {self.dim_E8xE8}/{self.dim_E8} = {self.dim_E8xE8/self.dim_E8}")
+        print("="*70)
@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - E₈ Root System
+=================================
+
+Exact, fully vectorized construction of the 240 roots of E₈ (even
+coordinate system) and of the derived data used by the animations,
+notebooks and interactive pages:
+
+- inner-product (Gram) matrix of all roots
+- root adjacency graph (pairs at 60°, inner product 1)
+- standard 2D/3D projections, including the Coxeter plane (h = 30)
+- precomputed rotation sequences: every frame's projected coordinates for
+  rotations in arbitrary planes of SO(8), in one batched einsum
+
+Roots are built with doubled coordinates so every entry is an integer:
+    112 roots  ±eᵢ ± eⱼ                      (i < j)
+    128 roots  (±½, ..., ±½)  with an even number of minus signs
+
+Derived tables are computed once per process (in-memory cache) and
+persisted to an .npz file in the cache directory, so later processes
+load them instead of recomputing. Set GIFT_CACHE_DIR to relocate the
+cache, or to an empty string to keep it in memory only.
+
+Usage:
+    from gift import e8
+    roots = e8.roots()                    # (240, 8)
+    xy = e8.projection('coxeter')         # (240, 2)
+    frames = e8.rotation_frames(120)      # (120, 240, 3)
+"""
+
+import os
+import zipfile
+import functools
+
+import numpy as np
+
+RANK = 8
+N_ROOTS = 240
+COXETER_NUMBER = 30
+
+# Bump whenever the construction or the stored tables change
+CACHE_VERSION = 1
+
+# Simple roots α₁..α₈ (Bourbaki labelling), doubled to integer coordinates
+SIMPLE_ROOTS_DOUBLED = np.array([
+    [1, -1, -1, -1, -1, -1, -1, 1],   # α₁ = ½(e₁ - e₂ - ... - e₇ + e₈)
+    [2, 2, 0, 0, 0, 0, 0, 0],         # α₂ = e₁ + e₂
+    [-2, 2, 0, 0, 0, 0, 0, 0],        # α₃ = e₂ - e₁
+    [0, -2, 2, 0, 0, 0, 0, 0],        # α₄ = e₃ - e₂
+    [0, 0, -2, 2, 0, 0, 0, 0],        # α₅ = e₄ - e₃
+    [0, 0, 0, -2, 2, 0, 0, 0],        # α₆ = e₅ - e₄
+    [0, 0, 0, 0, -2, 2, 0, 0],        # α₇ = e₆ - e₅
+    [0, 0, 0, 0, 0, -2, 2, 0],        # α₈ = e₇ - e₆
+], dtype=np.int8)
+
+# Orthonormal bases (rows) of the standard projections, see _projection_bases
+PROJECTIONS = ('coordinate', 'coordinate3d', 'coxeter', 'coxeter3d')
+
+
+# ============================================================================
+# Construction
+# ============================================================================
+
+def _integer_roots_doubled():
+    """The 112 roots ±eᵢ ± eⱼ, doubled"""
+    i, j = np.triu_indices(RANK, k=1)
+    signs = np.array([[1, 1], [1, -1], [-1, 1], [-1, -1]], dtype=np.int8)
+
+    roots = np.zeros((len(i), len(signs), RANK), dtype=np.int8)
+    pairs = np.arange(len(i))[:, None]
+    columns = np.arange(len(signs))
+    roots[pairs, columns, i[:, None]] = 2 * signs[:, 0]
+    roots[pairs, columns, j[:, None]] = 2 * signs[:, 1]
+    return roots.reshape(-1, RANK)
+
+
+def _half_integer_roots_doubled():
+    """The 128 roots (±½)⁸ with an even number of minus signs, doubled"""
+    minus = (np.arange(2**RANK)[:, None] >> np.arange(RANK)) & 1
+    even = minus.sum(axis=1) % 2 == 0
+    return (1 - 2 * minus[even]).astype(np.int8)
+
+
+def _coxeter_eigenvector(coxeter, exponent):
+    """Eigenvector of the Coxeter element for exp(2πi·exponent/h), fixed phase"""
+    eigenvalues, eigenvectors = np.linalg.eig(coxeter)
+    target = np.exp(2j * np.pi * exponent / COXETER_NUMBER)
+    vector = eigenvectors[:, np.argmin(np.abs(eigenvalues - target))]
+
+    # Rotate the phase so the largest component is real and positive,
+    # which pins the projected picture independently of the LAPACK build
+    pivot = np.argmax(np.abs(vector))
+    return vector * np.exp(-1j * np.angle(vector[pivot]))
+
+
+def _projection_bases():
+    """
+    Orthonormal projection bases (k × 8):
+    - coordinate / coordinate3d: the first 2 / 3 coordinate axes
+    - coxeter: the Coxeter plane, where roots form 8 rings of 30
+    - coxeter3d: the Coxeter plane plus the real part of the exponent-7
+      eigenvector, orthogonal to it
+    """
+    simple = SIMPLE_ROOTS_DOUBLED / 2
+    coxeter = np.eye(RANK)
+    for alpha in simple:
+        # Reflection s_α(v) = v - (v·α)α for a root of norm² 2
+        coxeter = coxeter @ (np.eye(RANK) - np.outer(alpha, alpha))
+
+    v1 = _coxeter_eigenvector(coxeter, 1)
+    v7 = _coxeter_eigenvector(coxeter, 7)
+    plane = np.array([v1.real, v1.imag])
+    plane /= np.linalg.norm(plane, axis=1, keepdims=True)
+    depth = v7.real / np.linalg.norm(v7.real)
+
+    return {
+        'coordinate': np.eye(RANK)[:2],
+        'coordinate3d': np.eye(RANK)[:3],
+        'coxeter': plane,
+        'coxeter3d': np.vstack([plane, depth]),
+    }
+
+
+def _compute_tables():
+    """Build every cached table from scratch"""
+    doubled = np.concatenate([_integer_roots_doubled(),
+                              _half_integer_roots_doubled()])
+
+    # Exact integer inner products: (2a)·(2b) / 4
+    wide = doubled.astype(np.int32)
+    inner = (wide @ wide.T) // 4
+    edges = np.argwhere(np.triu(inner == 1))
+
+    assert doubled.shape == (N_ROOTS, RANK), "E8 root count failed"
+    assert np.all(np.diag(inner) == 2), "E8 root norm failed"
+    assert len(np.unique(doubled, axis=0)) == N_ROOTS, "E8 roots not distinct"
+
+    tables = {
+        'roots_doubled': doubled,
+        'inner_products': inner.astype(np.int8),
+        'edges': edges.astype(np.int16),
+    }
+    roots = doubled / 2
+    for name, basis in _projection_bases().items():
+        tables[f'basis_{name}'] = basis
+        tables[f'projection_{name}'] = roots @ basis.T
+    return tables
+
+
+# ============================================================================
+# Cache
+# ============================================================================
+
+def cache_dir():
+    """Directory of the on-disk cache ('' disables it)"""
+    return os.environ.get('GIFT_CACHE_DIR',
+                          os.path.join(os.path.expanduser('~'), '.cache', 'gift'))
+
+
+def cache_path():
+    """Path of the .npz file holding the cached E8 tables, or None"""
+    directory = cache_dir()
+    if not directory:
+        return None
+    return os.path.join(directory, f'e8_v{CACHE_VERSION}.npz')
+
+
+def _load(path):
+    """Read cached tables, or None if the file is missing or unusable"""
+    try:
+        with np.load(path) as data:
+            tables = {key: data[key] for key in data.files}
+    except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+        return None
+
+    expected = {'roots_doubled', 'inner_products', 'edges'}
+    expected |= {f'{kind}_{name}' for kind in ('basis', 'projection')
+                 for name in PROJECTIONS}
+    return tables if expected <= set(tables) else None
+
+
+def _save(path, tables):
+    """Write tables atomically; an unwritable cache is silently skipped"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **tables)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _tables():
+    path = cache_path()
+    tables = _load(path) if path else None
+    if tables is None:
+        tables = _compute_tables()
+        if path:
+            _save(path, tables)
+
+    # Shared across callers, so never let them be modified in place
+    for array in tables.values():
+        array.setflags(write=False)
+    return tables
+
+
+def clear_cache():
+    """Drop the in-memory tables and delete the on-disk cache file"""
+    _tables.cache_clear()
+    roots.cache_clear()
+    adjacency.cache_clear()
+    path = cache_path()
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+# ============================================================================
+# Public API
+# ============================================================================
+
+def roots_doubled():
+    """All 240 roots with doubled (exact int8) coordinates, shape (240, 8)"""
+    return _tables()['roots_doubled']
+
+
+@functools.lru_cache(maxsize=None)
+def roots():
+    """All 240 roots of E8, shape (240, 8), norm² = 2"""
+    result = roots_doubled() / 2
+    result.setflags(write=False)
+    return result
+
+
+def simple_roots():
+    """The 8 simple roots α₁..α₈, shape (8, 8)"""
+    return SIMPLE_ROOTS_DOUBLED / 2
+
+
+def inner_products():
+    """Exact root inner products, int8 (240, 240) with values in {0, ±1, ±2}"""
+    return _tables()['inner_products']
+
+
+@functools.lru_cache(maxsize=None)
+def adjacency():
+    """Root graph: True where two roots are at 60° (inner product 1)"""
+    result = inner_products() == 1
+    result.setflags(write=False)
+    return result
+
+
+def edges():
+    """Edges (i < j) of the root graph, shape (6720, 2)"""
+    return _tables()['edges']
+
+
+def projection_basis(name='coxeter'):
+    """Orthonormal rows spanning a standard projection, shape (k, 8)"""
+    if name not in PROJECTIONS:
+        raise ValueError(f"Unknown projection {name!r}, expected one of {PROJECTIONS}")
+    return _tables()[f'basis_{name}']
+
+
+def projection(name='coxeter'):
+    """Roots projected onto a standard 2D/3D basis, shape (240, k)"""
+    if name not in PROJECTIONS:
+        raise ValueError(f"Unknown projection {name!r}, expected one of {PROJECTIONS}")
+    return _tables()[f'projection_{name}']
+
+
+# ============================================================================
+# Rotation Sequences
+# ============================================================================
+
+def rotation_stack(n_frames, planes=((0, 1),), turns=1):
+    """
+    Rotations of R⁸ for every frame of a looping sequence, shape (frames, 8, 8).
+    
+    Frame f rotates each coordinate plane (i, j) by 2π·turns·f/n_frames,
+    applying the planes in the order given. Planes are arbitrary, so any
+    one-parameter subgroup of the maximal torus of SO(8) can be animated.
+    
+    Args:
+        n_frames: Number of frames in the loop
+        planes: Sequence of coordinate index pairs (i, j)
+        turns: Full turns per loop, one value or one per plane
+    """
+    planes = np.atleast_2d(planes)
+    turns = np.broadcast_to(np.asarray(turns, dtype=float), (len(planes),))
+    angles = 2 * np.pi * np.outer(np.arange(n_frames) / n_frames, turns)
+
+    stack = np.tile(np.eye(RANK), (n_frames, 1, 1))
+    for (i, j), theta in zip(planes, angles.T):
+        # Left-multiply every frame by the Givens rotation of plane (i, j)
+        cos, sin = np.cos(theta)[:, None], np.sin(theta)[:, None]
+        row_i, row_j = stack[:, i].copy(), stack[:, j]
+        stack[:, i] = cos * row_i - sin * row_j
+        stack[:, j] = sin * row_i + cos * row_j
+    return stack
+
+
+def rotation_frames(n_frames, planes=((0, 1),), turns=1, basis='coordinate3d'):
+    """
+    Projected root coordinates for every frame, shape (frames, 240, k).
+    
+    Each frame's rotation is folded into the projection basis first, so the
+    whole sequence is a single einsum over the (frames, k, 8) stack. The
+    default spins the first three coordinates about the x₃ axis.
+    """
+    maps = projection_basis(basis) @ rotation_stack(n_frames, planes, turns)
+    return np.einsum('fkd,rd->frk', maps, roots())
+
+
+def depth_colors(frames):
+    """
+    Per-frame color values in [0, 1] from the last projected coordinate,
+    normalized to each frame's range like an autoscaled colormap.
+    Shape (frames, 240).
+    """
+    depth = frames[..., -1]
+    low = depth.min(axis=1, keepdims=True)
+    span = depth.max(axis=1, keepdims=True) - low
+    return (depth - low) / np.where(span > 0, span, 1)
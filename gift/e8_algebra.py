@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - E₈ and E₈×E₈ Lie Algebras
+============================================
+
+The 248-dimensional Lie algebra E₈ built from its root system (gift.e8),
+as sparse integer structure constants:
+
+    [X_a, X_b] = Σ_c f^c_ab X_c
+
+in the Chevalley-type basis of Kac (Infinite-Dimensional Lie Algebras,
+§7.8): X_0..X_7 span the Cartan subalgebra (the simple roots α_k) and
+X_8.. are the root vectors E_α, in the order of e8.roots(), with
+
+    [α_k, E_α] = (α_k|α) E_α
+    [E_α, E_-α] = -α                       (in the basis α_k)
+    [E_α, E_β] = ε(α, β) E_α+β             if α+β is a root
+
+The sign ε is the bimultiplicative cocycle with ε(α_i, α_i) = -1 and
+ε(α_i, α_j) = (-1)^(α_i|α_j) for i < j, 1 for i > j. Every constant is an
+integer in [-6, 6], so the whole table is 16,694 int8 entries (COO)
+against 15 million for a dense 248³ array.
+
+Built on it:
+
+- adjoint(): the 248 generators ad(X_a) as one CSR matrix
+- bracket(): batched commutators of any number of element pairs
+- killing_form(): K_ab = tr(ad X_a ad X_b), equal to 60·(X_a|X_b)
+- casimir(): the quadratic Casimir in the adjoint representation
+- jacobi_violations(): the Jacobi identity checked over every basis triple
+  by a sparse join of the structure constants, in seconds
+
+E₈×E₈ (dimension 496) is the direct sum of two copies: pass copies=2.
+
+Usage:
+    from gift import e8_algebra
+    a, b, c, f = e8_algebra.structure_constants()     # COO, f int8
+    z = e8_algebra.bracket(x, y)                     # (..., 248)
+    assert e8_algebra.jacobi_violations() == 0
+"""
+
+import functools
+
+import numpy as np
+import scipy.sparse
+
+from . import e8
+
+DIM_E8 = e8.RANK + e8.N_ROOTS
+
+# Dual Coxeter number: Killing form = 2h∨ × normalized invariant form
+DUAL_COXETER_NUMBER = 30
+
+INDEX_DTYPE = np.uint16
+VALUE_DTYPE = np.int8
+
+# Element pairs per step of bracket()
+BRACKET_CHUNK = 64
+
+
+# ============================================================================
+# Structure constants
+# ============================================================================
+
+def _root_index(doubled):
+    """Lookup of root → index, from the root's doubled coordinates"""
+    # Doubled coordinates lie in [-2, 2]: read them as base-5 digits
+    codes = (doubled.astype(np.int64) + 2) @ 5**np.arange(e8.RANK)
+    order = np.argsort(codes)
+
+    def lookup(vectors):
+        keys = (vectors.astype(np.int64) + 2) @ 5**np.arange(e8.RANK)
+        position = np.searchsorted(codes, keys, sorter=order)
+        return order[position]
+
+    return lookup
+
+
+def cartan_matrix():
+    """Cartan matrix (α_i|α_j) of the simple roots, int (8, 8)"""
+    simple = e8.SIMPLE_ROOTS_DOUBLED.astype(np.int64)
+    return simple @ simple.T // 4
+
+
+def simple_root_coordinates():
+    """Integer coordinates of every root in the simple-root basis, (240, 8)"""
+    simple = e8.SIMPLE_ROOTS_DOUBLED.astype(float)
+    coordinates = np.linalg.solve(simple.T, e8.roots_doubled().T.astype(float)).T
+    return np.rint(coordinates).astype(np.int64)
+
+
+def _cocycle():
+    """ε(α, β) for every pair of roots, int (240, 240)"""
+    cartan = cartan_matrix()
+    upper = np.triu(cartan, k=1) + np.eye(e8.RANK, dtype=np.int64)
+    c = simple_root_coordinates()
+    return 1 - 2 * ((c @ upper @ c.T) % 2)
+
+
+@functools.lru_cache(maxsize=None)
+def _e8_structure_constants():
+    doubled = e8.roots_doubled()
+    inner = e8.inner_products().astype(np.int64)
+    coordinates = simple_root_coordinates()
+    simple = e8.SIMPLE_ROOTS_DOUBLED.astype(np.int64)
+    lookup = _root_index(doubled)
+    cartan = e8.RANK
+    parts = []
+
+    # [α_k, E_α] = (α_k|α) E_α, and the opposite order
+    pairing = simple @ doubled.T.astype(np.int64) // 4
+    k, r = np.nonzero(pairing)
+    parts.append((k, cartan + r, cartan + r, pairing[k, r]))
+    parts.append((cartan + r, k, cartan + r, -pairing[k, r]))
+
+    # [E_α, E_-α] = -α = -Σ c_k α_k
+    r, s = np.nonzero(inner == -2)
+    rr, k = np.nonzero(coordinates[r])
+    parts.append((cartan + r[rr], cartan + s[rr], k, -coordinates[r[rr], k]))
+
+    # [E_α, E_β] = ε(α, β) E_α+β when (α|β) = -1
+    r, s = np.nonzero(inner == -1)
+    t = lookup(doubled[r].astype(np.int64) + doubled[s])
+    parts.append((cartan + r, cartan + s, cartan + t, _cocycle()[r, s]))
+
+    a, b, c, f = (np.concatenate(column) for column in zip(*parts))
+    order = np.lexsort((c, b, a))
+    table = (a[order].astype(INDEX_DTYPE), b[order].astype(INDEX_DTYPE),
+             c[order].astype(INDEX_DTYPE), f[order].astype(VALUE_DTYPE))
+    for array in table:
+        array.setflags(write=False)
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def structure_constants(copies=1):
+    """
+    Nonzero structure constants as COO arrays (a, b, c, f), sorted by
+    (a, b, c): [X_a, X_b] = Σ f X_c. Indices uint16, values int8.
+    copies=2 gives E₈×E₈, the second copy offset by 248.
+    """
+    a, b, c, f = _e8_structure_constants()
+    if copies == 1:
+        return a, b, c, f
+    offsets = (np.arange(copies) * DIM_E8)[:, None]
+    table = tuple((index + offsets).astype(INDEX_DTYPE).ravel() for index in (a, b, c))
+    table += (np.tile(f, copies),)
+    for array in table:
+        array.setflags(write=False)
+    return table
+
+
+def dimension(copies=1):
+    return copies * DIM_E8
+
+
+# ============================================================================
+# Adjoint representation
+# ============================================================================
+
+@functools.lru_cache(maxsize=None)
+def adjoint(copies=1):
+    """
+    The adjoint generators as one CSR matrix of shape (dim, dim²): row a is
+    ad(X_a) flattened, (ad X_a)_cb = f^c_ab. adjoint_matrix() gives one
+    generator, element_adjoint() the adjoint of arbitrary elements.
+    """
+    a, b, c, f = structure_constants(copies)
+    n = dimension(copies)
+    flat = c.astype(np.int64) * n + b
+    return scipy.sparse.csr_matrix((f, (a, flat)), shape=(n, n * n), dtype=VALUE_DTYPE)
+
+
+def adjoint_matrix(a, copies=1):
+    """ad(X_a) as a CSR matrix (dim, dim)"""
+    n = dimension(copies)
+    return adjoint(copies)[a].reshape((n, n)).tocsr()
+
+
+def element_adjoint(x, copies=1):
+    """ad(x) of elements x (..., dim), dense (..., dim, dim)"""
+    x = np.asarray(x, dtype=float)
+    n = dimension(copies)
+    flat = adjoint(copies).T @ x.reshape(-1, n).T
+    return flat.T.reshape(x.shape[:-1] + (n, n))
+
+
+@functools.lru_cache(maxsize=None)
+def _bracket_operators(copies):
+    """Sparse gather/scatter operators of bracket()"""
+    a, b, c, f = structure_constants(copies)
+    n = dimension(copies)
+    nnz = len(f)
+    scatter = scipy.sparse.csr_matrix(
+        (f.astype(float), (c.astype(np.int64), np.arange(nnz))), shape=(n, nnz))
+    return a.astype(np.intp), b.astype(np.intp), scatter
+
+
+def bracket(x, y, copies=1):
+    """
+    Commutators [x, y] of elements given by coordinates, batched over the
+    leading axes of x and y (broadcast), shape (..., dim).
+    """
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    n = dimension(copies)
+    a, b, scatter = _bracket_operators(copies)
+    x2, y2 = x.reshape(-1, n), y.reshape(-1, n)
+    out = np.empty(x2.shape)
+
+    # Σ_ab f^c_ab x^a y^b: gather the nonzero products, scatter-add into c.
+    # Elements go along the columns so the gathers copy whole rows, a chunk
+    # at a time to keep the (entries × chunk) products small.
+    for start in range(0, len(x2), BRACKET_CHUNK):
+        stop = start + BRACKET_CHUNK
+        products = np.ascontiguousarray(x2[start:stop].T)[a]
+        products *= np.ascontiguousarray(y2[start:stop].T)[b]
+        out[start:stop] = (scatter @ products).T
+    return out.reshape(x.shape)
+
+
+def killing_form(copies=1):
+    """K_ab = tr(ad X_a ad X_b), exact integers, dense int64 (dim, dim)"""
+    n = dimension(copies)
+    generators = adjoint(copies).astype(np.int64)
+    # tr(A B) = Σ_cb A_cb B_bc: pair each generator with the transposes
+    transposed = generators.tocoo()
+    c, b = np.divmod(transposed.col, n)
+    transposes = scipy.sparse.csr_matrix(
+        (transposed.data, (transposed.row, b * n + c)), shape=generators.shape)
+    return (generators @ transposes.T).toarray()
+
+
+def invariant_form(copies=1):
+    """Normalized invariant form (X_a|X_b) = K_ab / 2h∨, int64 (dim, dim)"""
+    return killing_form(copies) // (2 * DUAL_COXETER_NUMBER)
+
+
+def casimir(form=None, copies=1):
+    """
+    Quadratic Casimir Σ g^ab ad(X_a) ad(X_b) in the adjoint representation,
+    dense (dim, dim), with g the inverse of form (default: the normalized
+    invariant form, giving 2h∨ = 60 times the identity; the Killing form
+    gives the identity).
+    """
+    form = invariant_form(copies) if form is None else form
+    n = dimension(copies)
+    inverse = np.linalg.inv(np.asarray(form, dtype=float))
+    generators = adjoint(copies).astype(float)
+    # Σ_b g^ab ad(X_b) for every a, then Σ_a ad(X_a) · that
+    raised = scipy.sparse.csr_matrix(inverse) @ generators
+    total = np.zeros((n, n))
+    for a in range(n):
+        left = generators[a].reshape((n, n))
+        right = raised[a].reshape((n, n))
+        total += (left @ right).toarray()
+    return total
+
+
+# ============================================================================
+# Verification
+# ============================================================================
+
+def _by_first_index(a, n):
+    """Start of each first-index run in a table sorted by a"""
+    return np.searchsorted(a, np.arange(n + 1))
+
+
+def jacobi_violations(copies=1):
+    """
+    Number of basis components (a, b, c, e) where the Jacobi identity
+        [X_a, [X_b, X_c]] + [X_b, [X_c, X_a]] + [X_c, [X_a, X_b]] = 0
+    fails, computed exactly over all dim³ triples from the sparse table.
+    """
+    a, b, c, f = (np.asarray(array, dtype=np.int64) for array in structure_constants(copies))
+    n = dimension(copies)
+
+    # T(x, y, z, e) = Σ_d f^d_yz f^e_xd: join [X_y, X_z] = f X_d with
+    # [X_x, X_d] = f' X_e on d, reading the second table by its second index
+    by_b = np.argsort(b, kind='stable')
+    starts = _by_first_index(b[by_b], n)
+    counts = starts[c + 1] - starts[c]
+    left = np.repeat(np.arange(len(f)), counts)
+    offsets = np.arange(len(left)) - np.repeat(np.cumsum(counts) - counts, counts)
+    right = by_b[np.repeat(starts[c], counts) + offsets]
+
+    x, y, z, e = a[right], a[left], b[left], c[right]
+    values = f[left] * f[right]
+
+    # Sum T over the three cyclic orders of (x, y, z) for each component
+    key = lambda p, q, r: ((p * n + q) * n + r) * n + e
+    keys = np.concatenate([key(x, y, z), key(y, z, x), key(z, x, y)])
+    unique, inverse = np.unique(keys, return_inverse=True)
+    totals = np.bincount(inverse, weights=np.tile(values, 3), minlength=len(unique))
+    return int(np.count_nonzero(totals))
+
+
+def antisymmetry_violations(copies=1):
+    """Number of entries where f^c_ab ≠ -f^c_ba"""
+    a, b, c, f = (np.asarray(array, dtype=np.int64) for array in structure_constants(copies))
+    n = dimension(copies)
+    forward = dict(zip(((a * n + b) * n + c).tolist(), f.tolist()))
+    swapped = ((b * n + a) * n + c).tolist()
+    return sum(forward.get(key, 0) != -value for key, value in zip(swapped, f.tolist()))
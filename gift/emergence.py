@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Emergence of Physical Laws
+=============================================
+
+PhysicalLawsEmergence from the validation notebook: speculative printouts
+of how Maxwell, thermodynamics, quantum mechanics, gravity and the weak and
+strong interactions might emerge from the K7 geometry. Print only; loaded
+lazily so that importing gift never pays for it.
+
+Usage:
+    from gift import GIFTConstants, PhysicalLawsEmergence
+    emergence = PhysicalLawsEmergence(GIFTConstants())
+    emergence.gravity()
+"""
+
+import numpy as np
+
+
+class PhysicalLawsEmergence:
+    """
+    Exploration of how fundamental physical laws might emerge from
+    the geometric structure of the GIFT framework.
+
+    NOTE: This section is highly speculative and represents ongoing
+    research directions rather than established results. The geometric
+    mechanisms proposed here require rigorous mathematical development.
+    """
+
+    def __init__(self, constants):
+        self.c = constants
+
+    def maxwell_equations(self):
+        """
+        Emergence of electromagnetic theory from gauge structure.
+
+        In the GIFT framework, the U(1) gauge field emerges from H²(K₇).
+        Maxwell's equations may arise as consistency conditions for
+        the harmonic 2-forms under dimensional reduction.
+        """
+        print("\n" + "="*70)
+        print("EMERGENCE OF MAXWELL EQUATIONS")
+        print("="*70)
+
+        print("\nProposed mechanism:")
+        print("  1) U(1) gauge field A_μ emerges from H²(K₇) harmonic forms")
+        print("  2) Field strength F_μν = ∂_μA_ν - ∂_νA_μ from exterior derivative")
+        print("  3) Bianchi identity dF = 0 gives:")
+        print("     ∂_μF_νλ + ∂_νF_λμ + ∂_λF_μν = 0")
+        print("     → ∇·B = 0 and ∇×E + ∂B/∂t = 0")
+        print("\n  4) Yang-Mills equations D_μF^μν = J^ν give:")
+        print("     → ∇·E = ρ/ε₀ and ∇×B - ∂E/∂t = μ₀J")
+
+        print("\nGeometric origin of fine structure constant:")
+        print(f"  α⁻¹(0) = τ × 7 × 5 = {self.c.tau * 7 * 5:.6f}")
+        print(f"  τ encodes topological data: (E₈×E₈ dimension) × (gauge modes)")
+        print(f"                            / (Jordan algebra) × (cohomology)")
+        print("\n  Speculation: α represents information capacity of U(1) sector")
+        print(f"  relative to total E₈×E₈ structure.")
+
+    def thermodynamics(self):
+        """
+        Thermodynamic laws from information-theoretic structure.
+
+        The framework suggests a deep connection between geometry,
+        information theory, and thermodynamics through the ln(2) relation.
+        """
+        print("\n" + "="*70)
+        print("EMERGENCE OF THERMODYNAMICS")
+        print("="*70)
+
+        print("\nProposed mechanism:")
+        print("  1) Binary entropy: S = k_B ln(2) per fundamental degree of freedom")
+        print(f"     Ω_DE = ln(2) = {self.c.ln2:.6f} suggests binary information basis")
+
+        print("\n  2) First Law: dE = TdS - PdV")
+        print("     May emerge from variational principle on K₇:")
+        print("     δ∫[R - |F|² - V(φ)] = 0")
+
+        print("\n  3) Second Law: dS ≥ 0")
+        print("     Could follow from irreversibility in dimensional reduction:")
+        print(f"     11D → 4D increases coarse-graining → entropy production")
+
+        print("\n  4) Bekenstein-Hawking entropy:")
+        print("     S = (k_B × Area)/(4 l_P²)")
+        print("     Geometric interpretation: Entropy ∝ cohomology dimensions")
+        print(f"     H*(K₇) = {self.c.H_star} modes may set entropy per volume")
+
+        print("\n  5) Temperature scale:")
+        print("     T ~ ℏ/k_B × 1/R_K₇")
+        print("     where R_K₇ ~ l_Planck is compactification radius")
+
+    def quantum_mechanics(self):
+        """
+        Quantum theory from geometric quantization of K₇.
+
+        The discrete structure of cohomology may underlie quantum discreteness.
+        """
+        print("\n" + "="*70)
+        print("EMERGENCE OF QUANTUM MECHANICS")
+        print("="*70)
+
+        print("\nProposed mechanism:")
+        print("  1) Hilbert space: H = ⊕_i H^i(K₇, ℂ)")
+        print(f"     dim(H) = {self.c.H_star} (finite-dimensional initially)")
+        print(f"     Full theory: Include Kaluza-Klein tower → infinite-dimensional")
+
+        print("\n  2) Canonical quantization:")
+        print("     Symplectic form ω on K₇ → [x̂, p̂] = iℏ")
+        print("     ℏ sets scale: ℏ ~ 1/(Vol(K₇)/l_P⁷)")
+
+        print("\n  3) Wave-particle duality:")
+        print("     Particles = zero-modes in H³(K₇)")
+        print("     Waves = harmonic forms with d*ω + *dω = 0")
+
+        print("\n  4) Uncertainty principle:")
+        print("     Δx Δp ≥ ℏ/2")
+        print("     May arise from non-commutativity of K₇ coordinates")
+        print("     in non-commutative geometry extension")
+
+        print("\n  5) Superposition:")
+        print("     Linear structure of cohomology H*(K₇, ℂ)")
+        print("     States = elements of complex vector space")
+
+    def gravity(self):
+        """
+        General relativity from higher-dimensional geometry.
+
+        Standard Kaluza-Klein mechanism extended to 11D supergravity.
+        """
+        print("\n" + "="*70)
+        print("EMERGENCE OF GENERAL RELATIVITY")
+        print("="*70)
+
+        print("\nProposed mechanism:")
+        print("  1) 11D metric: ds²_11 = e^(2A(y)) η_μν dx^μ dx^ν + g_mn(y) dy^m dy^n")
+        print("     Warped compactification on AdS₄ × K₇")
+
+        print("\n  2) Einstein equations in 4D emerge from 11D:")
+        print("     R_MN - (1/2)g_MN R = T_MN")
+        print("     Dimensional reduction → Rμν - (1/2)gμν R = 8πG Tμν")
+
+        print("\n  3) Effective Planck mass:")
+        print("     M_Pl,4D² = M_Pl,11D⁹ × Vol(K₇)")
+        print(f"     Vol(K₇) ~ l_P⁷ → M_Pl,4D ~ 10¹⁹ GeV")
+
+        print("\n  4) Cosmological constant:")
+        print(f"     Λ ~ 1/R_AdS² ")
+        print("     AdS₄ radius R_AdS related to K₇ moduli")
+        print(f"     Ω_DE = ln(2) may constrain R_AdS/l_P ratio")
+
+        print("\n  5) Gravitational waves:")
+        print("     Metric perturbations h_μν propagate in 4D")
+        print("     Speed c = 1 fixed by Lorentz invariance of AdS₄")
+
+    def weak_interactions(self):
+        """
+        Weak force from SU(2)_L gauge structure in H²(K₇).
+        """
+        print("\n" + "="*70)
+        print("EMERGENCE OF WEAK INTERACTIONS")
+        print("="*70)
+
+        print("\nProposed mechanism:")
+        print("  1) SU(2)_L gauge bosons W^±, W⁰ from 3 modes in H²(K₇)")
+        print(f"     dim(H²_SU(2)) = 3 (part of total b₂ = {self.c.b2})")
+
+        print("\n  2) Electroweak mixing:")
+        print(f"     sin²θ_W = ζ(2) - √2 = {self.c.zeta2 - self.c.sqrt2:.6f}")
+        print("     Z⁰ = cos(θ_W)W⁰ - sin(θ_W)B⁰")
+        print("     A = sin(θ_W)W⁰ + cos(θ_W)B⁰")
+
+        print("\n  3) Parity violation:")
+        print("     Chirality from orientation of K₇")
+        print("     Left-handed: ψ_L couples to SU(2)_L")
+        print("     Right-handed: ψ_R singlets under SU(2)_L")
+
+        print("\n  4) Mass generation:")
+        print("     Higgs mechanism: ⟨φ⟩ ≠ 0 breaks SU(2)_L × U(1)_Y → U(1)_EM")
+        print(f"     M_W = g₂v/2, M_Z = M_W/cos(θ_W)")
+        print(f"     Ratio M_W/M_Z = {np.sqrt(1 - (self.c.zeta2 - self.c.sqrt2)):.5f}")
+
+    def strong_interactions(self):
+        """
+        QCD from SU(3)_C gauge structure in H²(K₇).
+        """
+        print("\n" + "="*70)
+        print("EMERGENCE OF STRONG INTERACTIONS")
+        print("="*70)
+
+        print("\nProposed mechanism:")
+        print("  1) SU(3)_C gauge bosons (gluons) from 8 modes in H²(K₇)")
+        print(f"     dim(H²_SU(3)) = 8 (part of total b₂ = {self.c.b2})")
+
+        print("\n  2) Running coupling:")
+        print(f"     α_s(M_Z) = √2/12 = {self.c.sqrt2/12:.6f}")
+        print("     RG flow: α_s(μ) determined by geometric β-function")
+        print("     Related to K₇ volume form integration")
+
+        print("\n  3) Confinement:")
+        print("     Speculation: Non-perturbative effects from K₇ topology")
+        print("     χ(K₇) = 0 (Euler characteristic) → gluon condensate?")
+        print("     Instantons from non-trivial π₃(SU(3)) wrapping K₇ cycles")
+
+        print("\n  4) Asymptotic freedom:")
+        print("     β(α_s) < 0 for SU(3) → α_s(μ→∞) → 0")
+        print("     Geometric: Related to negative curvature components of K₇")
+
+        print("\n  5) Chiral symmetry breaking:")
+        print("     Quark condensate ⟨q̄q⟩ ≠ 0")
+        print("     Mass generation: m_constituent ~ ΛQCD ~ 200 MeV")
+        print(f"     Scale ΛQCD may relate to 1/Vol(K₇)^(1/7)")
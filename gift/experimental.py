@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Experimental Data
+====================================
+
+Experimental values with uncertainties for the 18 observables, from:
+- Particle Data Group (PDG 2022)
+- NuFIT 5.3 (neutrino oscillations)
+- Planck 2018 (cosmology)
+- ATLAS/CMS combined (Higgs)
+
+Datasets are versioned JSON files in gift/datasets/ (or any path):
+{"version", "description", "sources", "data": {observable: {"exp", "err",
+"unit"}}}, where "base" names a dataset whose entries the file inherits,
+so a new release only lists what changed. DATA is DEFAULT_DATASET;
+gift.revalidation recomputes what a new version affects.
+
+ExperimentalData keeps the class interface of the validation notebook.
+
+Usage:
+    from gift import experimental
+    experimental.DATA['m_H']              # {'exp': 125.25, 'err': 0.17, 'unit': 'GeV'}
+    experimental.values(), experimental.errors()   # arrays in OBSERVABLES order
+    experimental.load('pdg2022')['data']  # a dataset version, by name or path
+    experimental.versions()               # ['pdg2022', ...]
+"""
+
+import os
+import json
+
+import numpy as np
+
+from .observables import OBSERVABLES
+
+DATASET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'datasets')
+DEFAULT_DATASET = 'pdg2022'
+
+ENTRY_KEYS = ('exp', 'err', 'unit')
+
+
+# ============================================================================
+# Datasets
+# ============================================================================
+
+def versions():
+    """Names of the dataset versions shipped in DATASET_DIR"""
+    return sorted(name[:-5] for name in os.listdir(DATASET_DIR) if name.endswith('.json'))
+
+
+def dataset_path(version):
+    """Path of a dataset: a version name in DATASET_DIR, or a path to a .json file"""
+    if version.endswith('.json') or os.sep in version:
+        return version
+    return os.path.join(DATASET_DIR, f'{version}.json')
+
+
+def load(version=DEFAULT_DATASET, _children=()):
+    """
+    Dataset record by version name or path, with the entries of its base
+    dataset merged in.
+
+    Returns:
+        Dict with 'version', 'description', 'sources', 'base' (or None) and
+        'data' (observable -> {'exp', 'err', 'unit'}, in OBSERVABLES order)
+    """
+    path = dataset_path(version)
+    try:
+        with open(path, encoding='utf-8') as f:
+            record = json.load(f)
+    except FileNotFoundError:
+        raise ValueError(f"No dataset {version!r}, expected a path or one of "
+                         f"{versions()}") from None
+
+    name = record.get('version') or os.path.splitext(os.path.basename(path))[0]
+    data = {}
+    if record.get('base'):
+        if name in _children or record['base'] == name:
+            raise ValueError(f"Dataset {name!r} is its own base")
+        data.update(load(record['base'], _children + (name,))['data'])
+    for observable, entry in record.get('data', {}).items():
+        if observable not in OBSERVABLES:
+            raise ValueError(f"Dataset {name!r}: unknown observable {observable!r}")
+        merged = {**data.get(observable, {}), **entry}
+        missing = [key for key in ENTRY_KEYS if key not in merged]
+        if missing:
+            raise ValueError(f"Dataset {name!r}: {observable} lacks {missing}")
+        data[observable] = merged
+
+    return {
+        'version': name,
+        'description': record.get('description', ''),
+        'sources': list(record.get('sources', [])),
+        'base': record.get('base'),
+        'data': {observable: data[observable] for observable in OBSERVABLES
+                 if observable in data},
+    }
+
+
+DATA = load(DEFAULT_DATASET)['data']
+
+
+# ============================================================================
+# Arrays
+# ============================================================================
+
+def values(names=OBSERVABLES, data=None):
+    """Experimental central values, float array in the order of names"""
+    data = DATA if data is None else data
+    return np.array([data[name]['exp'] for name in names], dtype=float)
+
+
+def errors(names=OBSERVABLES, data=None):
+    """Experimental 1σ uncertainties, float array in the order of names"""
+    data = DATA if data is None else data
+    return np.array([data[name]['err'] for name in names], dtype=float)
+
+
+class ExperimentalData:
+    """
+    Experimental values with uncertainties from:
+    - Particle Data Group (PDG 2022)
+    - NuFIT 5.3 (neutrino oscillations)
+    - Planck 2018 (cosmology)
+    - ATLAS/CMS combined (Higgs)
+    """
+
+    data = DATA
@@ -0,0 +1,568 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Exhaustive Formula Search
+============================================
+
+Enumerates every expression tree over the topological integers and
+mathematical constants (b2 = 21, b3 = 77, H* = 99, 248, 496, ζ(3), γ, φ, π,
+...) up to a number of operations, and matches the values against every
+experimental observable. How many candidates land within a given tolerance
+of each measurement measures how likely formulas like θ₂₃ = (8+77)/99 are
+to appear by chance.
+
+Expressions are built level by level, a level being the number of
+operations (+ - × ÷ ^ and √, ln):
+
+- levels below the search depth are stored as flat arrays (value, operation,
+  child levels and indices) and deduplicated: commutative operations are
+  enumerated once per unordered pair, and expressions are keyed by a
+  canonical value hash (float64 bits with the last 12 mantissa bits
+  dropped, i.e. equal to about 1e-12), keeping the simplest expression of
+  each value
+- the last level is never stored: it is generated in blocks, and each
+  block is bisected against the sorted target windows (np.searchsorted)
+  rather than compared with every target
+
+Blocks of the last level are independent tasks, run serially or on a
+process pool. Progress (finished tasks, matches so far) is checkpointed to
+an .npz file so an interrupted search resumes where it stopped.
+
+Memory grows with the last stored level, time with the last level. With
+the default leaves and operations, depth 4 stores 5·10^6 expressions
+(about 600 MB peak) and matches 10^9 candidates at about 2·10^7 per second
+per worker. Depth 5 needs fewer leaves or operations.
+
+Usage:
+    from gift.formula_search import search
+    result, levels, operations = search(depth=3, tolerance=1e-3, jobs=8)
+    result.hits('theta_23')
+    result.print_summary(levels, operations)
+
+    python -m gift.formula_search --depth 4 --jobs 8 --checkpoint search.npz
+"""
+
+import os
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import experimental
+from .observables import (
+    OBSERVABLES, P2, WEYL_FACTOR, DIM_K7, RANK_E8, DIM_G2, B2, DIM_J3, B3,
+    H_STAR, DIM_E8, DIM_E8xE8, GAMMA, ZETA3, PHI,
+)
+from .render_cache import content_hash
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+LEAVES = {
+    # Topological integers
+    'p₂': P2, 'Weyl': WEYL_FACTOR, 'dim(K₇)': DIM_K7, 'rank(E₈)': RANK_E8,
+    'dim(G₂)': DIM_G2, 'b₂': B2, 'dim(J₃)': DIM_J3, 'b₃': B3, 'H*': H_STAR,
+    'dim(E₈)': DIM_E8, 'dim(E₈×E₈)': DIM_E8xE8,
+    # Mathematical constants
+    'π': np.pi, 'γ': GAMMA, 'ζ(3)': ZETA3, 'φ': PHI,
+}
+
+BINARY_OPERATIONS = {
+    '+': np.add, '-': np.subtract, '×': np.multiply, '÷': np.divide, '^': np.power,
+}
+UNARY_OPERATIONS = {'√': np.sqrt, 'ln': np.log}
+COMMUTATIVE = {'+', '×'}
+
+DEFAULT_DEPTH = 3
+DEFAULT_TOLERANCE = 1e-3
+DEFAULT_BLOCK_SIZE = 2**20
+DEFAULT_KEEP = 10
+CHECKPOINT_SECONDS = 60
+
+# Mantissa bits ignored by the canonical value hash
+_HASH_DROP_BITS = 12
+
+# Operation code of leaves and "no child" marker
+_LEAF = 255
+
+# One match: value, relative error and the expression's top node
+RECORD_DTYPE = np.dtype([
+    ('value', 'f8'), ('error', 'f8'), ('level', 'u1'), ('op', 'u1'),
+    ('a', 'u1'), ('i', 'i8'), ('b', 'u1'), ('j', 'i8'),
+])
+
+
+def value_keys(values):
+    """Canonical value hash: float64 bits without the lowest mantissa bits"""
+    return np.ascontiguousarray(values, dtype=float).view(np.int64) >> _HASH_DROP_BITS
+
+
+# ============================================================================
+# Expression levels
+# ============================================================================
+
+class Level:
+    """
+    All distinct expressions with the same number of operations: values and
+    top node (operation code, child levels a/b, child indices i/j).
+    """
+
+    def __init__(self, values, op, a, i, b, j):
+        self.values = values
+        self.op = op
+        self.a = a
+        self.i = i
+        self.b = b
+        self.j = j
+
+    def __len__(self):
+        return len(self.values)
+
+    @classmethod
+    def leaves(cls, leaves):
+        n = len(leaves)
+        marker = np.full(n, _LEAF, dtype=np.uint8)
+        return cls(np.array(list(leaves.values()), dtype=float), marker.copy(),
+                   marker.copy(), np.arange(n), marker.copy(), np.zeros(n, dtype=np.int64))
+
+    def take(self, index):
+        return Level(*(array[index] for array in
+                       (self.values, self.op, self.a, self.i, self.b, self.j)))
+
+
+class Operations:
+    """Operation codes: binary operations first, then unary ones"""
+
+    def __init__(self, binary=BINARY_OPERATIONS, unary=UNARY_OPERATIONS):
+        self.names = list(binary) + list(unary)
+        self.functions = list(binary.values()) + list(unary.values())
+        self.n_binary = len(binary)
+
+    def is_unary(self, code):
+        return code >= self.n_binary
+
+
+def _blocks(level, operations, left, right, block_size):
+    """
+    Tasks generating one level: (op, a, b, start, stop), blocks of rows of
+    the left operand. Unary tasks have b = _LEAF.
+    """
+    tasks = []
+    n = level - 1
+    for code, name in enumerate(operations.names):
+        if operations.is_unary(code):
+            pairs = [(n, _LEAF)]
+        else:
+            pairs = [(a, n - a) for a in range(n + 1)
+                     if not (name in COMMUTATIVE and a > n - a)]
+        for a, b in pairs:
+            rows = len(left[a])
+            width = 1 if b == _LEAF else len(right[b])
+            step = max(1, block_size // max(width, 1))
+            tasks.extend((code, a, b, start, min(start + step, rows))
+                         for start in range(0, rows, step))
+    return tasks
+
+
+def _evaluate_block(levels, operations, task):
+    """Values of one block, flattened row-major (rows: left operand)"""
+    code, a, b, start, stop = task
+    function = operations.functions[code]
+    x = levels[a].values[start:stop]
+    with np.errstate(all='ignore'):
+        if b == _LEAF:
+            return function(x)
+        return function(x[:, None], levels[b].values[None, :]).ravel()
+
+
+def _children(levels, operations, task, index):
+    """
+    Child indices (i, j) of the flat block positions index, dropping the
+    duplicate half of commutative operations on one level. Returns
+    (index, i, j) restricted to the kept positions, and the boolean mask
+    of those positions in index (which may repeat positions).
+    """
+    code, a, b, start, stop = task
+    keep = np.ones(len(index), dtype=bool)
+    if b == _LEAF:
+        return index, start + index, np.zeros(len(index), dtype=np.int64), keep
+    i, j = np.divmod(index, len(levels[b]))
+    i += start
+    if a == b and operations.names[code] in COMMUTATIVE:
+        # Each unordered pair once
+        keep = j >= i
+        index, i, j = index[keep], i[keep], j[keep]
+    return index, i, j, keep
+
+
+def _block_candidates(levels, operations, task, size):
+    """Distinct candidates of a block: size, less the commutative duplicates"""
+    code, a, b, start, stop = task
+    if a != b or operations.names[code] not in COMMUTATIVE:
+        return size
+    rows = np.arange(start, stop)
+    return int(np.maximum(len(levels[b]) - rows, 0).sum())
+
+
+def build_levels(depth, leaves=LEAVES, operations=None, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Deduplicated expression levels 0..depth-1 (level 0: the leaves). An
+    expression is dropped if a simpler or earlier one has the same value.
+    """
+    operations = operations or Operations()
+    levels = [Level.leaves(leaves)]
+    seen = np.unique(value_keys(levels[0].values))
+
+    for level in range(1, depth):
+        parts, part_keys = [], []
+        for task in _blocks(level, operations, levels, levels, block_size):
+            values = _evaluate_block(levels, operations, task)
+            valid = np.flatnonzero(np.isfinite(values) & (values != 0))
+            valid, i, j, _ = _children(levels, operations, task, valid)
+
+            # Deduplicate each block as it comes, so only new values are kept
+            keys, first = np.unique(value_keys(values[valid]), return_index=True)
+            new = ~np.isin(keys, seen, assume_unique=True)
+            first = np.sort(first[new])
+            code, a, b = task[:3]
+            n = len(first)
+            part_keys.append(value_keys(values[valid[first]]))
+            parts.append([values[valid[first]], np.full(n, code, np.uint8),
+                          np.full(n, a, np.uint8), i[first], np.full(n, b, np.uint8), j[first]])
+
+        # Then across blocks, one column at a time to bound peak memory
+        keys, first = np.unique(np.concatenate(part_keys), return_index=True)
+        del part_keys
+        first.sort()
+        columns = []
+        for column in range(6):
+            columns.append(np.concatenate([part[column] for part in parts])[first])
+            for part in parts:
+                part[column] = None
+        levels.append(Level(*columns))
+        seen = np.union1d(seen, keys)
+
+    return levels
+
+
+def expression(levels, operations, level, index, names=tuple(LEAVES)):
+    """Readable formula of expression index of a level"""
+    node = levels[level]
+    code = node.op[index]
+    if code == _LEAF:
+        return names[node.i[index]]
+    return _format(levels, operations, code, node.a[index], node.i[index],
+                   node.b[index], node.j[index], names)
+
+
+def _format(levels, operations, code, a, i, b, j, names):
+    left = expression(levels, operations, a, i, names)
+    name = operations.names[code]
+    if operations.is_unary(code):
+        return f"{name}({left})"
+    return f"({left} {name} {expression(levels, operations, b, j, names)})"
+
+
+# ============================================================================
+# Matching
+# ============================================================================
+
+def target_windows(tolerance=DEFAULT_TOLERANCE, data=None, names=OBSERVABLES):
+    """
+    Relative tolerance windows around the experimental values, split into
+    groups of non-overlapping windows sorted by lower bound, for bisection.
+    Returns (names, values, groups) with groups a list of (lo, hi, target).
+    """
+    data = experimental.DATA if data is None else data
+    names = [name for name in names if data[name]['exp'] != 0]
+    values = experimental.values(names, data)
+    lo = values - tolerance * np.abs(values)
+    hi = values + tolerance * np.abs(values)
+
+    groups = []
+    for target in np.argsort(lo):
+        for group in groups:
+            if lo[target] > hi[group[-1]]:
+                group.append(target)
+                break
+        else:
+            groups.append([target])
+    groups = [(lo[group], hi[group], np.array(group)) for group in groups]
+    return names, values, groups
+
+
+def match(values, groups):
+    """(candidate index, target index) of every value inside a window"""
+    hits, targets = [], []
+    for lo, hi, target in groups:
+        k = np.searchsorted(lo, values, side='right') - 1
+        inside = (k >= 0) & (values <= hi[np.maximum(k, 0)])
+        index = np.flatnonzero(inside)
+        hits.append(index)
+        targets.append(target[k[index]])
+    return np.concatenate(hits), np.concatenate(targets)
+
+
+class SearchResult:
+    """
+    Mergeable matches of a search: per target, the canonical keys of every
+    distinct matching value and the best matches by relative error. Keys
+    are collected in chunks and deduplicated on demand (keys()).
+    """
+
+    def __init__(self, names, values, keep=DEFAULT_KEEP):
+        self.names = list(names)
+        self.values = np.asarray(values, dtype=float)
+        self.keep = keep
+        self.candidates = 0
+        self._keys = [[] for _ in self.names]
+        self.best = [np.zeros(0, dtype=RECORD_DTYPE) for _ in self.names]
+
+    def empty_copy(self):
+        return SearchResult(self.names, self.values, self.keep)
+
+    def keys(self, target):
+        """Sorted distinct value keys matching target (an index)"""
+        chunks = self._keys[target]
+        if len(chunks) != 1:
+            chunks[:] = [np.unique(np.concatenate(chunks)) if chunks
+                         else np.zeros(0, dtype=np.int64)]
+        return chunks[0]
+
+    def add_matches(self, targets, records):
+        """Add records (RECORD_DTYPE) matching the given target indices"""
+        keys = value_keys(records['value'])
+        for target in np.unique(targets):
+            mine = targets == target
+            self._add(target, keys[mine], records[mine])
+
+    def _add(self, target, keys, records):
+        self._keys[target].append(keys)
+        if len(self._keys[target]) > 256:
+            self.keys(target)
+        best = np.concatenate([self.best[target], records])
+        best = best[np.lexsort((best['level'], np.abs(best['error'])))]
+        _, first = np.unique(value_keys(best['value']), return_index=True)
+        self.best[target] = best[np.sort(first)][:self.keep]
+
+    def merge(self, other):
+        self.candidates += other.candidates
+        for target in range(len(self.names)):
+            if other._keys[target]:
+                self._add(target, other.keys(target), other.best[target])
+        return self
+
+    def hits(self, name):
+        """Number of distinct values within tolerance of an observable"""
+        return len(self.keys(self.names.index(name)))
+
+    def print_summary(self, levels, operations, top=3):
+        print("="*78)
+        print("FORMULA SEARCH")
+        print("="*78)
+        print(f"  Candidate expressions: {self.candidates:,}")
+        print(f"  {'observable':<15}{'experiment':>14}{'hits':>10}{'fraction':>12}  best match")
+        print("-"*78)
+        for target, name in enumerate(self.names):
+            hits = len(self.keys(target))
+            fraction = hits / max(self.candidates, 1)
+            print(f"  {name:<15}{self.values[target]:>14.6g}{hits:>10,}"
+                  f"{fraction:>12.2e}")
+            for record in self.best[target][:top]:
+                formula = _format_record(levels, operations, record)
+                print(f"      {record['value']:<16.10g}{record['error']:+.2e}  {formula}")
+        print("="*78)
+
+
+def _record(values, targets, target_values, level, code, a, i, b, j):
+    records = np.zeros(len(values), dtype=RECORD_DTYPE)
+    records['value'] = values
+    records['error'] = (values - target_values[targets]) / target_values[targets]
+    records['level'] = level
+    records['op'], records['a'], records['i'] = code, a, i
+    records['b'], records['j'] = b, j
+    return records
+
+
+def _format_record(levels, operations, record):
+    if record['op'] == _LEAF:
+        return tuple(LEAVES)[record['i']]
+    return _format(levels, operations, record['op'], record['a'], record['i'],
+                   record['b'], record['j'], tuple(LEAVES))
+
+
+# ============================================================================
+# Search engine
+# ============================================================================
+
+# Per-process search state, set by _init_worker
+_STATE = {}
+
+
+def _init_worker(levels, operations, groups, template):
+    _STATE.update(levels=levels, operations=operations, groups=groups, template=template)
+
+
+def search_stored(levels, groups, template):
+    """Matches among the stored (deduplicated) levels"""
+    result = template.empty_copy()
+    for level, node in enumerate(levels):
+        result.candidates += len(node)
+        hits, targets = match(node.values, groups)
+        records = _record(node.values[hits], targets, template.values, level,
+                          node.op[hits], node.a[hits], node.i[hits],
+                          node.b[hits], node.j[hits])
+        result.add_matches(targets, records)
+    return result
+
+
+def search_block(task):
+    """Matches of one block of the last level"""
+    levels, operations = _STATE['levels'], _STATE['operations']
+    result = _STATE['template'].empty_copy()
+    values = _evaluate_block(levels, operations, task)
+    result.candidates = _block_candidates(levels, operations, task, len(values))
+
+    # A candidate within tolerance of several targets is a hit of each
+    hits, targets = match(values, _STATE['groups'])
+    kept, i, j, keep = _children(levels, operations, task, hits)
+    targets = targets[keep]
+    code, a, b = task[:3]
+    result.add_matches(targets, _record(values[kept], targets, result.values,
+                                        len(levels), code, a, i, b, j))
+    return result
+
+
+def _config_digest(depth, leaves, operations, tolerance, block_size, names, values, keep):
+    """Checkpoint key: everything that changes the matches, target values included"""
+    return content_hash(depth, leaves, operations.names, tolerance, block_size, names,
+                        values, keep)
+
+
+def save_checkpoint(path, digest, done, result):
+    """Write finished tasks and matches so far atomically"""
+    keys = [result.keys(target) for target in range(len(result.names))]
+    n_best = [len(best) for best in result.best]
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, digest=np.array(digest), done=done,
+                 candidates=np.array(result.candidates),
+                 key_counts=np.array([len(k) for k in keys]), keys=np.concatenate(keys),
+                 best_counts=np.array(n_best), best=np.concatenate(result.best))
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path, digest, n_tasks, template):
+    """(done, result) of a checkpoint of the same search, or None"""
+    try:
+        with np.load(path) as f:
+            if str(f['digest']) != digest or len(f['done']) != n_tasks:
+                return None
+            result = template.empty_copy()
+            result.candidates = int(f['candidates'])
+            result._keys = [[keys] for keys in
+                            np.split(f['keys'], np.cumsum(f['key_counts'])[:-1])]
+            result.best = np.split(f['best'], np.cumsum(f['best_counts'])[:-1])
+            return f['done'].copy(), result
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def search(depth=DEFAULT_DEPTH, tolerance=DEFAULT_TOLERANCE, jobs=1, data=None,
+           leaves=LEAVES, operations=None, block_size=DEFAULT_BLOCK_SIZE,
+           keep=DEFAULT_KEEP, checkpoint=None, verbose=False):
+    """
+    Match every expression with up to depth operations against the
+    experimental values.
+
+    Args:
+        depth: Maximum number of operations per expression
+        tolerance: Relative half-width of the window around each value
+        jobs: Worker processes for the last level
+        checkpoint: .npz path to resume from and save progress to
+
+    Returns:
+        (SearchResult, levels, operations); levels and operations turn
+        match records back into formulas
+    """
+    operations = operations or Operations()
+    names, values, groups = target_windows(tolerance, data)
+    template = SearchResult(names, values, keep)
+
+    levels = build_levels(depth, leaves, operations, block_size)
+    tasks = _blocks(depth, operations, levels, levels, block_size)
+    digest = _config_digest(depth, leaves, operations, tolerance, block_size, names,
+                            values, keep)
+
+    state = load_checkpoint(checkpoint, digest, len(tasks), template) if checkpoint else None
+    if state is None:
+        done = np.zeros(len(tasks), dtype=bool)
+        result = search_stored(levels, groups, template)
+    else:
+        done, result = state
+    if verbose:
+        print(f"  Stored levels: {[len(level) for level in levels]}, "
+              f"{len(tasks) - done.sum()} of {len(tasks)} block(s) to search")
+
+    pending = [index for index in range(len(tasks)) if not done[index]]
+    initargs = (levels, operations, groups, template)
+    last_save = time.monotonic()
+
+    def finish(index, block):
+        nonlocal last_save
+        result.merge(block)
+        done[index] = True
+        if checkpoint and time.monotonic() - last_save > CHECKPOINT_SECONDS:
+            save_checkpoint(checkpoint, digest, done, result)
+            last_save = time.monotonic()
+
+    if jobs <= 1:
+        _init_worker(*initargs)
+        for index in pending:
+            finish(index, search_block(tasks[index]))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=initargs) as pool:
+            blocks = pool.map(search_block, (tasks[index] for index in pending))
+            for index, block in zip(pending, blocks):
+                finish(index, block)
+
+    if checkpoint:
+        save_checkpoint(checkpoint, digest, done, result)
+    return result, levels, operations
+
+
+# ============================================================================
+# Main Execution
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exhaustive search of formulas over "
+                                                 "topological integers and constants")
+    parser.add_argument('-d', '--depth', type=int, default=DEFAULT_DEPTH,
+                        help=f"maximum operations per expression (default: {DEFAULT_DEPTH})")
+    parser.add_argument('-t', '--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f"relative tolerance (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="worker processes (default: 1; 0: one per CPU core)")
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE,
+                        help=f"candidates per task (default: {DEFAULT_BLOCK_SIZE})")
+    parser.add_argument('--checkpoint', help="checkpoint file (.npz) to resume from and update")
+    parser.add_argument('--top', type=int, default=3, help="best matches shown per observable")
+    args = parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count()
+
+    start = time.perf_counter()
+    result, levels, operations = search(args.depth, args.tolerance, jobs,
+                                        block_size=args.block_size, keep=max(args.top, 1),
+                                        checkpoint=args.checkpoint, verbose=True)
+    elapsed = time.perf_counter() - start
+
+    result.print_summary(levels, operations, args.top)
+    print(f"  {result.candidates / elapsed:.3e} candidates/s with {jobs} worker(s)")
+    print("="*78)
+
+
+if __name__ == "__main__":
+    main()
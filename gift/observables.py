@@ -0,0 +1,512 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Vectorized Observables
+=========================================
+
+Silent, side-effect free evaluation of the 18 observables of
+GIFTObservables.compute_all() over whole parameter grids at once.
+
+    evaluate(params: dict[str, ndarray]) -> dict[str, ndarray]
+
+Parameters may be scalars or arrays of any broadcast-compatible shapes:
+
+- independent: p2, rank_E8, Weyl_factor
+- derived: beta0 = π/rank_E8, xi = (Weyl_factor/p2)·beta0,
+  delta = 2π/Weyl_factor², computed from the independent parameters
+  unless given explicitly
+
+Each formula is evaluated only over the parameters it depends on, then
+broadcast to the common shape, so scanning one parameter never pays for
+the observables that ignore it. Out-of-domain points give nan/inf silently.
+
+GIFTObservables keeps the step-by-step calculation of the validation
+notebook at the reference parameters (printed with verbose=True).
+
+Usage:
+    from gift.observables import evaluate
+    p2, weyl = np.meshgrid(np.linspace(1.5, 2.5, 1000), np.arange(3, 8))
+    results = evaluate({'p2': p2, 'Weyl_factor': weyl})
+    results['n_s'].shape                   # (5, 1000)
+
+    GIFTObservables(verbose=True).compute_all()
+"""
+
+import contextlib
+
+import numpy as np
+
+from . import profiling
+from .constants import GIFTConstants
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+# Module-level aliases of GIFTConstants, the single source of the values
+
+# Independent topological parameters (reference values)
+P2 = GIFTConstants.p2
+RANK_E8 = GIFTConstants.rank_E8
+WEYL_FACTOR = GIFTConstants.Weyl_factor
+
+# Topological data
+DIM_E8 = GIFTConstants.dim_E8
+DIM_E8xE8 = GIFTConstants.dim_E8xE8
+B2 = GIFTConstants.b2
+B3 = GIFTConstants.b3
+H_STAR = GIFTConstants.H_star
+DIM_K7 = GIFTConstants.dim_K7
+DIM_G2 = GIFTConstants.dim_G2
+DIM_J3 = GIFTConstants.dim_J3
+TAU = GIFTConstants.tau
+
+# Mathematical constants
+GAMMA = GIFTConstants.gamma
+ZETA2 = GIFTConstants.zeta2
+ZETA3 = GIFTConstants.zeta3
+PHI = GIFTConstants.phi
+
+# External inputs, not derived
+HIGGS_VEV = 246.0       # GeV
+H0_PLANCK = 67.36       # km/s/Mpc
+
+INDEPENDENT_PARAMETERS = ('p2', 'rank_E8', 'Weyl_factor')
+DERIVED_PARAMETERS = ('beta0', 'xi', 'delta')
+PARAMETERS = INDEPENDENT_PARAMETERS + DERIVED_PARAMETERS
+
+# In GIFTObservables.compute_all() order
+OBSERVABLES = (
+    'theta_12', 'theta_13', 'theta_23', 'delta_CP',
+    'alpha_inv_0', 'alpha_inv_MZ', 'sin2theta_W', 'alpha_s_MZ', 'MW_MZ',
+    'lambda_H', 'm_H',
+    'Q_Koide', 'm_mu_m_e', 'm_tau_m_mu',
+    'Omega_DE', 'n_s', 'H_0',
+    'N_generations',
+)
+
+_DEGREES = 180 / np.pi
+
+
+# ============================================================================
+# Backends
+# ============================================================================
+
+class Backend:
+    """
+    Number type evaluate() works in: conversion of parameters to arrays,
+    the elementary functions the formulas use, the transcendental constants
+    at matching precision, and the context (e.g. working precision) to
+    evaluate under. gift.precision provides long double and mpmath backends.
+    """
+
+    def __init__(self, name, asarray, constants, sqrt=np.sqrt, arctan=np.arctan,
+                 exp2=np.exp2, context=contextlib.nullcontext):
+        self.name = name
+        self.asarray = asarray
+        self.constants = constants
+        self.sqrt = sqrt
+        self.arctan = arctan
+        self.exp2 = exp2
+        self.context = context
+
+    def __repr__(self):
+        return f"Backend({self.name!r})"
+
+
+FLOAT64 = Backend('float64', lambda value: np.asarray(value, dtype=float), {
+    'one': 1.0, 'pi': np.pi, 'degrees': _DEGREES,
+    'gamma': GAMMA, 'zeta2': ZETA2, 'zeta3': ZETA3, 'phi': PHI,
+    'sqrt2': np.sqrt(2), 'sqrt5': np.sqrt(5), 'sqrt17': np.sqrt(17),
+    'tau': TAU, 'higgs_vev': HIGGS_VEV, 'h0_planck': H0_PLANCK,
+})
+
+
+def get_backend(backend=None, dps=None):
+    """
+    Backend instance for a name: 'float64' (default), 'longdouble' (alias
+    'float128') or 'mpmath' at dps decimal digits. Instances pass through.
+    """
+    if backend is None or backend == 'float64':
+        return FLOAT64
+    if isinstance(backend, Backend):
+        return backend
+    from . import precision
+    return precision.get_backend(backend, dps)
+
+
+# ============================================================================
+# Evaluation
+# ============================================================================
+
+def parameters(params=None, backend=None):
+    """
+    All six parameters as arrays of the backend's type (not broadcast
+    against each other), filling in reference values and the exact
+    derived relations.
+    """
+    params = dict(params or {})
+    unknown = set(params) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown parameters {sorted(unknown)}, expected some of {PARAMETERS}")
+
+    backend = get_backend(backend)
+    asarray, pi = backend.asarray, backend.constants['pi']
+    p2 = asarray(params.get('p2', P2))
+    rank = asarray(params.get('rank_E8', RANK_E8))
+    weyl = asarray(params.get('Weyl_factor', WEYL_FACTOR))
+
+    with np.errstate(divide='ignore', invalid='ignore'), backend.context():
+        beta0 = asarray(params['beta0']) if 'beta0' in params else asarray(pi / rank)
+        xi = asarray(params['xi']) if 'xi' in params else asarray((weyl / p2) * beta0)
+        delta = (asarray(params['delta']) if 'delta' in params
+                 else asarray(2 * pi / weyl**2))
+
+    return {'p2': p2, 'rank_E8': rank, 'Weyl_factor': weyl,
+            'beta0': beta0, 'xi': xi, 'delta': delta}
+
+
+def evaluate(params=None, backend=None, dps=None):
+    """
+    Compute all 18 observables for every point of a parameter grid.
+
+    Args:
+        params: Mapping of parameter name to scalar or array; missing
+            parameters take their reference (or derived) values
+        backend: 'float64' (default), 'longdouble' or 'mpmath', or a Backend
+        dps: Decimal digits of the mpmath backend (default: precision.DEFAULT_DPS)
+
+    Returns:
+        Dict of observable name to a read-only array with the common
+        broadcast shape of the given parameters (angles in degrees); float
+        for float64, np.longdouble or object arrays of mpf otherwise
+    """
+    backend = get_backend(backend, dps)
+    p = parameters(params, backend)
+    shape = np.broadcast_shapes(*(value.shape for value in p.values()))
+    rank, weyl, xi = p['rank_E8'], p['Weyl_factor'], p['xi']
+    k = backend.constants
+    sqrt, arctan, exp2 = backend.sqrt, backend.arctan, backend.exp2
+    degrees = k['degrees']
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'), backend.context():
+        # Neutrino sector
+        theta_12 = arctan(sqrt(p['delta'] * (1 / k['gamma']))) * degrees
+        theta_23 = (rank + B3) * (degrees / H_STAR)
+
+        # Gauge sector
+        sin2theta_W = k['zeta2'] - k['sqrt2']
+        alpha_inv_MZ = exp2(rank - 1) - k['one'] / 24
+
+        # Higgs sector
+        lambda_H = k['sqrt17'] * exp2(-weyl)
+        m_H = k['higgs_vev'] * sqrt(2 * lambda_H)
+
+        # Cosmology
+        H_0 = k['h0_planck'] * (k['zeta3'] / xi)**p['beta0']
+
+        results = {
+            'theta_12': theta_12,
+            'theta_13': (k['pi'] / B2) * degrees,
+            'theta_23': theta_23,
+            'delta_CP': (k['zeta3'] + k['sqrt5']) * degrees,
+            'alpha_inv_0': weyl * (k['tau'] * DIM_K7),
+            'alpha_inv_MZ': alpha_inv_MZ,
+            'sin2theta_W': sin2theta_W,
+            'alpha_s_MZ': k['sqrt2'] / 12,
+            'MW_MZ': sqrt(k['one'] - sin2theta_W),
+            'lambda_H': lambda_H,
+            'm_H': m_H,
+            'Q_Koide': k['one'] * DIM_G2 / B2,
+            'm_mu_m_e': DIM_J3**k['phi'],
+            'm_tau_m_mu': (DIM_K7 + B3) / weyl,
+            'Omega_DE': k['zeta3'] * k['gamma'],
+            'n_s': xi * xi,
+            'H_0': H_0,
+            'N_generations': rank - weyl,
+        }
+
+        return {name: np.broadcast_to(backend.asarray(value), shape)
+                for name, value in results.items()}
+
+
+# ============================================================================
+# Step-by-step calculation (validation notebook)
+# ============================================================================
+
+class GIFTObservables:
+    """
+    Calculate all 18 observables from the fundamental topological parameters.
+
+    Each calculation includes:
+    - The explicit formula from the framework
+    - Step-by-step numerical evaluation
+    - Comparison with experimental values
+
+    The step-by-step evaluation is printed only with verbose=True; the
+    default is silent for batch use. For parameter scans use evaluate().
+    """
+
+    def __init__(self, verbose=False):
+        self.c = GIFTConstants()
+        self.verbose = verbose
+        self.observables = {}
+
+    def _print(self, *args):
+        if self.verbose:
+            print(*args)
+
+    # compute_all() order, as (profiling stage, method); a few µs per
+    # sector, so profiled runs time one call in profiling.SAMPLE_EVERY
+    SECTORS = tuple((f'observables/{sector}', f'compute_{sector}') for sector in (
+        'neutrino_sector', 'gauge_sector', 'higgs_sector', 'lepton_sector',
+        'cosmology', 'generation_structure'))
+
+    def compute_all(self):
+        """Compute all observables systematically"""
+        self._print("\n" + "="*70)
+        self._print("COMPUTING ALL OBSERVABLES FROM TOPOLOGY")
+        self._print("="*70)
+
+        profiler = profiling.active()
+        if profiler is None or not profiler.due('observables'):
+            self.compute_neutrino_sector()
+            self.compute_gauge_sector()
+            self.compute_higgs_sector()
+            self.compute_lepton_sector()
+            self.compute_cosmology()
+            self.compute_generation_structure()
+        else:
+            with profiler.stage('observables/compute_all'):
+                for name, method in self.SECTORS:
+                    with profiler.stage(name):
+                        getattr(self, method)()
+
+        return self.observables
+
+    def compute_neutrino_sector(self):
+        """
+        Neutrino mixing angles and CP phase.
+
+        These parameters arise from the geometric structure of K₇:
+        - θ₁₂: Ratio of Weyl phase to spectral density
+        - θ₁₃: Direct connection to b₂(K₇) = 21
+        - θ₂₃: Ratio of cohomology dimensions
+        - δ_CP: Volume integral involving ζ(3) and pentagonal symmetry
+        """
+        self._print("\n[1] NEUTRINO SECTOR")
+        self._print("-" * 70)
+
+        # θ₁₂ = arctan(√(δ/γ))
+        ratio = self.c.delta / self.c.gamma
+        theta_12_rad = np.arctan(np.sqrt(ratio))
+        theta_12_deg = np.degrees(theta_12_rad)
+        self._print(f"  θ₁₂ = arctan(√(δ/γ))")
+        self._print(f"      = arctan(√({self.c.delta:.6f}/{self.c.gamma:.6f}))")
+        self._print(f"      = {theta_12_deg:.6f}°")
+
+        # θ₁₃ = π/21 = π/b₂(K₇)
+        theta_13_rad = self.c.pi / self.c.b2
+        theta_13_deg = np.degrees(theta_13_rad)
+        self._print(f"\n  θ₁₃ = π/21 = π/b₂(K₇)")
+        self._print(f"      = {theta_13_deg:.6f}°")
+
+        # θ₂₃ = (rank(E₈) + b₃(K₇))/H*(K₇) = (8+77)/99
+        theta_23_rad = (self.c.rank_E8 + self.c.b3) / self.c.H_star
+        theta_23_deg = np.degrees(theta_23_rad)
+        self._print(f"\n  θ₂₃ = (8+77)/99 = 85/99")
+        self._print(f"      = {theta_23_deg:.6f}°")
+
+        # δ_CP = ζ(3) + √5
+        delta_CP_rad = self.c.zeta3 + self.c.sqrt5
+        delta_CP_deg = np.degrees(delta_CP_rad)
+        self._print(f"\n  δ_CP = ζ(3) + √5")
+        self._print(f"       = {self.c.zeta3:.6f} + {self.c.sqrt5:.6f}")
+        self._print(f"       = {delta_CP_deg:.6f}°")
+
+        self.observables['theta_12'] = theta_12_deg
+        self.observables['theta_13'] = theta_13_deg
+        self.observables['theta_23'] = theta_23_deg
+        self.observables['delta_CP'] = delta_CP_deg
+
+    def compute_gauge_sector(self):
+        """
+        Gauge couplings and mixing angles.
+
+        The gauge structure emerges from the dimensional reduction:
+        - H²(K₇) = 21 modes split into SU(3)⊕SU(2)⊕U(1)⊕hidden
+        - Running is geometric (related to K₇ volume)
+        """
+        self._print("\n[2] GAUGE SECTOR")
+        self._print("-" * 70)
+
+        # α⁻¹(0) = τ × dim(K₇) × Weyl_factor = τ × 7 × 5
+        alpha_inv_0 = self.c.tau * self.c.dim_K7 * self.c.Weyl_factor
+        self._print(f"  α⁻¹(0) = τ×7×5")
+        self._print(f"         = {self.c.tau:.6f} × 7 × 5")
+        self._print(f"         = {alpha_inv_0:.6f}")
+
+        # α⁻¹(M_Z) = 2⁷ - 1/24 = 128 - 1/24
+        alpha_inv_MZ = 2**(self.c.rank_E8 - 1) - 1/24
+        self._print(f"\n  α⁻¹(M_Z) = 2^(rank-1) - 1/24")
+        self._print(f"           = 2⁷ - 1/24")
+        self._print(f"           = {alpha_inv_MZ:.6f}")
+
+        # sin²θ_W = ζ(2) - √2 = π²/6 - √2
+        sin2theta_W = self.c.zeta2 - self.c.sqrt2
+        self._print(f"\n  sin²θ_W = ζ(2) - √2")
+        self._print(f"          = {self.c.zeta2:.6f} - {self.c.sqrt2:.6f}")
+        self._print(f"          = {sin2theta_W:.6f}")
+
+        # α_s(M_Z) = √2/12
+        alpha_s_MZ = self.c.sqrt2 / 12
+        self._print(f"\n  α_s(M_Z) = √2/12")
+        self._print(f"           = {alpha_s_MZ:.6f}")
+
+        # M_W/M_Z = √(1 - sin²θ_W)
+        MW_MZ = np.sqrt(1 - sin2theta_W)
+        self._print(f"\n  M_W/M_Z = √(1 - sin²θ_W)")
+        self._print(f"          = {MW_MZ:.6f}")
+
+        self.observables['alpha_inv_0'] = alpha_inv_0
+        self.observables['alpha_inv_MZ'] = alpha_inv_MZ
+        self.observables['sin2theta_W'] = sin2theta_W
+        self.observables['alpha_s_MZ'] = alpha_s_MZ
+        self.observables['MW_MZ'] = MW_MZ
+
+    def compute_higgs_sector(self):
+        """
+        Higgs coupling and mass.
+
+        The Higgs emerges from H³(K₇) modes. The number 17 has dual origin:
+        - G₂ canonical: 17 = dim(Λ²₁₄) + dim(su(2)_L) = 14 + 3
+        - Effective gauge: 17 = b₂(K₇) - dim(Higgs) = 21 - 4
+        """
+        self._print("\n[3] HIGGS SECTOR")
+        self._print("-" * 70)
+
+        # λ_H = √17/2^Weyl_factor = √17/32
+        lambda_H = self.c.sqrt17 / (2**self.c.Weyl_factor)
+        self._print(f"  λ_H = √17/2^Weyl_factor")
+        self._print(f"      = √17/2⁵")
+        self._print(f"      = {self.c.sqrt17:.6f}/32")
+        self._print(f"      = {lambda_H:.6f}")
+        self._print(f"\n  Note: 17 = 14+3 (G₂ origin) = 21-4 (gauge origin)")
+
+        # m_H = v × √(2λ_H), where v = 246 GeV (external input)
+        v = 246.0  # GeV - VEV from electroweak symmetry breaking
+        m_H = v * np.sqrt(2 * lambda_H)
+        self._print(f"\n  m_H = v × √(2λ_H)")
+        self._print(f"      = {v} GeV × √(2×{lambda_H:.6f})")
+        self._print(f"      = {m_H:.2f} GeV")
+        self._print(f"  [Note: VEV v=246 GeV is external input, not derived]")
+
+        self.observables['lambda_H'] = lambda_H
+        self.observables['m_H'] = m_H
+
+    def compute_lepton_sector(self):
+        """
+        Charged lepton mass ratios.
+
+        These emerge from intersection numbers in H³(K₇) involving
+        topological invariants and the golden ratio φ.
+        """
+        self._print("\n[4] LEPTON SECTOR")
+        self._print("-" * 70)
+
+        # Q_Koide = dim(G₂)/b₂(K₇) = 14/21 = 2/3 (exact)
+        Q_Koide = self.c.dim_G2 / self.c.b2
+        self._print(f"  Q_Koide = dim(G₂)/b₂(K₇)")
+        self._print(f"          = {self.c.dim_G2}/{self.c.b2}")
+        self._print(f"          = {Q_Koide:.18f}")
+        self._print(f"          = 2/3 (exact rational)")
+
+        # m_μ/m_e = dim(J₃)^φ = 27^φ
+        ratio_mu_e = self.c.dim_J3**self.c.phi
+        self._print(f"\n  m_μ/m_e = dim(J₃)^φ = 27^φ")
+        self._print(f"          = 27^{self.c.phi:.6f}")
+        self._print(f"          = {ratio_mu_e:.6f}")
+
+        # m_τ/m_μ = (dim(K₇) + b₃(K₇))/Weyl_factor = (7+77)/5 = 84/5
+        ratio_tau_mu = (self.c.dim_K7 + self.c.b3) / self.c.Weyl_factor
+        self._print(f"\n  m_τ/m_μ = (7+77)/5 = 84/5")
+        self._print(f"          = {ratio_tau_mu:.6f}")
+        self._print(f"          = {ratio_tau_mu:.1f} (exact rational)")
+
+        self.observables['Q_Koide'] = Q_Koide
+        self.observables['m_mu_m_e'] = ratio_mu_e
+        self.observables['m_tau_m_mu'] = ratio_tau_mu
+
+    def compute_cosmology(self):
+        """
+        Cosmological observables.
+
+        These parameters connect particle physics to cosmology through
+        the same geometric structure:
+        - Ω_DE: Binary entropy ln(2) from p₂ structure
+        - n_s: Spectral index from projection efficiency ξ²
+        - H₀: Hubble parameter with geometric correction
+        """
+        self._print("\n[5] COSMOLOGICAL OBSERVABLES")
+        self._print("-" * 70)
+
+        # Ω_DE = ζ(3) × γ (effective with quantum corrections)
+        # Pure topological: Ω_DE = ln(p₂) = ln(2) = 0.693147...
+        Omega_DE_pure = self.c.ln2
+        Omega_DE_eff = self.c.zeta3 * self.c.gamma
+        self._print(f"  Ω_DE (topological) = ln(p₂) = ln(2)")
+        self._print(f"                     = {Omega_DE_pure:.6f}")
+        self._print(f"\n  Ω_DE (effective with quantum corrections)")
+        self._print(f"       = ζ(3) × γ")
+        self._print(f"       = {Omega_DE_eff:.6f}")
+        self._print(f"  Correction: {(Omega_DE_eff-Omega_DE_pure)/Omega_DE_pure*100:.2f}%")
+
+        # Triple verification of ln(2):
+        self._print(f"\n  Triple geometric origin of ln(2):")
+        self._print(f"    1) ln(p₂) = ln(2) = {np.log(2):.6f}")
+        self._print(f"    2) ln(E₈×E₈/E₈) = ln(496/248) = {np.log(496/248):.6f}")
+        self._print(f"    3) ln(G₂/K₇) = ln(14/7) = {np.log(14/7):.6f}")
+
+        # n_s = ξ²
+        n_s = self.c.xi**2
+        self._print(f"\n  n_s = ξ²")
+        self._print(f"      = ({self.c.xi:.6f})²")
+        self._print(f"      = {n_s:.6f}")
+
+        # H₀ with geometric correction
+        H0_Planck = 67.36  # km/s/Mpc (external input from Planck)
+        correction_factor = (self.c.zeta3 / self.c.xi)**self.c.beta0
+        H0 = H0_Planck * correction_factor
+        self._print(f"\n  H₀ = H₀^(Planck) × (ζ(3)/ξ)^β₀")
+        self._print(f"     = {H0_Planck} × {correction_factor:.6f}")
+        self._print(f"     = {H0:.2f} km/s/Mpc")
+        self._print(f"  [Note: Planck value H₀={H0_Planck} is external input]")
+
+        self.observables['Omega_DE'] = Omega_DE_eff
+        self.observables['n_s'] = n_s
+        self.observables['H_0'] = H0
+
+    def compute_generation_structure(self):
+        """
+        Number of fermion generations.
+
+        This fundamental parameter emerges topologically from the
+        relationship between rank(E₈) and Weyl_factor.
+        """
+        self._print("\n[6] GENERATION STRUCTURE")
+        self._print("-" * 70)
+
+        # Method 1: N_gen = rank(E₈) - Weyl_factor
+        N_gen_v1 = self.c.rank_E8 - self.c.Weyl_factor
+        self._print(f"  Method 1: N_gen = rank(E₈) - Weyl_factor")
+        self._print(f"                  = {self.c.rank_E8} - {self.c.Weyl_factor}")
+        self._print(f"                  = {N_gen_v1} (exact)")
+
+        # Method 2: N_gen = (dim(K₇) + rank(E₈))/Weyl_factor
+        N_gen_v2 = (self.c.dim_K7 + self.c.rank_E8) / self.c.Weyl_factor
+        self._print(f"\n  Method 2: N_gen = (dim(K₇) + rank(E₈))/Weyl_factor")
+        self._print(f"                  = ({self.c.dim_K7} + {self.c.rank_E8})/{self.c.Weyl_factor}")
+        self._print(f"                  = {N_gen_v2:.1f} (exact)")
+
+        self._print(f"\n  Both methods yield N_gen = 3 (exact topological prediction)")
+
+        self.observables['N_generations'] = int(N_gen_v1)
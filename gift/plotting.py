@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Validation Plots
+===================================
+
+matplotlib version of the tutorial's validation chart: deviation of each
+prediction from experiment, colored by precision band, against the 1%
+threshold. Imports matplotlib, so it is loaded only on first use.
+
+Usage:
+    from gift import GIFTObservables, plotting
+    fig, ax = plotting.plot_deviations(GIFTObservables().compute_all())
+    fig.savefig('deviations.png')
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from .experimental import DATA
+
+# Precision bands of the tutorial chart: (upper bound in %, color)
+DEVIATION_COLORS = ((0.2, '#43e97b'), (0.5, '#ffd700'), (np.inf, '#ff8c00'))
+
+
+def deviations(observables, data=None):
+    """Relative deviation from experiment in %, for observables with data"""
+    data = DATA if data is None else data
+    return {name: abs((value - data[name]['exp']) / data[name]['exp']) * 100
+            for name, value in observables.items()
+            if name in data and data[name]['exp'] != 0}
+
+
+def plot_deviations(observables, data=None, ax=None):
+    """
+    Bar chart of the deviation of each observable from experiment.
+
+    Args:
+        observables: Mapping of observable name to predicted value
+        data: Experimental data in the format of experimental.DATA
+        ax: Axes to draw into (a new figure is created if None)
+
+    Returns:
+        (figure, axes)
+    """
+    devs = deviations(observables, data)
+    names, values = list(devs), list(devs.values())
+    colors = [next(color for bound, color in DEVIATION_COLORS if d < bound)
+              for d in values]
+
+    if ax is None:
+        fig, ax = plt.subplots(figsize=(12, 5))
+    else:
+        fig = ax.figure
+
+    bars = ax.bar(names, values, color=colors)
+    ax.bar_label(bars, labels=[f'{d:.3f}%' for d in values], fontsize=8)
+    ax.axhline(1.0, color='red', linestyle='--', linewidth=2, label='1% threshold')
+    ax.set_title(f"GIFT Predictions vs Experiments: All {len(names)} Observables")
+    ax.set_xlabel("Observable")
+    ax.set_ylabel("Deviation from Experiment (%)")
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.legend(loc='upper right')
+    fig.tight_layout()
+
+    return fig, ax
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Arbitrary-Precision Backends
+===============================================
+
+Backends for gift.observables.evaluate() beyond float64:
+
+- 'longdouble' (alias 'float128'): NumPy extended precision, about 19
+  significant digits on x86, still fully vectorized
+- 'mpmath': object arrays of mpmath mpf at any number of decimal digits,
+  evaluated element by element
+
+The transcendental constants (π, γ, ζ(2), ζ(3), φ, √2, √5, √17) and τ are
+computed once per precision level and memoized; the cache keeps the
+CONSTANT_CACHE_SIZE most recently used levels.
+
+Usage:
+    from gift.observables import evaluate
+    results = evaluate(backend='mpmath', dps=1000)
+    results['Q_Koide'][()]                 # mpf('0.6666...') to 1000 digits
+
+    python -m gift.precision --dps 1000    # residuals of the exact relations
+"""
+
+import types
+import argparse
+import functools
+
+import numpy as np
+import mpmath
+
+from .observables import (
+    Backend, FLOAT64, OBSERVABLES, DIM_E8xE8, B2, DIM_J3, H_STAR,
+    HIGGS_VEV, H0_PLANCK, evaluate,
+)
+
+DEFAULT_DPS = 50
+
+# Precision levels whose constants stay memoized
+CONSTANT_CACHE_SIZE = 8
+
+# Digits of the constants a long double backend is built from
+_LONGDOUBLE_DPS = 40
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+@functools.lru_cache(maxsize=CONSTANT_CACHE_SIZE)
+def constants(dps):
+    """
+    The constants of the observable formulas as mpf at dps decimal digits,
+    in the layout of Backend.constants (read-only mapping).
+    """
+    with mpmath.workdps(dps):
+        pi = +mpmath.pi
+        values = {
+            'one': mpmath.mpf(1),
+            'pi': pi,
+            'degrees': 180 / pi,
+            'gamma': +mpmath.euler,
+            'zeta2': pi**2 / 6,
+            'zeta3': mpmath.zeta(3),
+            'phi': +mpmath.phi,
+            'sqrt2': mpmath.sqrt(2),
+            'sqrt5': mpmath.sqrt(5),
+            'sqrt17': mpmath.sqrt(17),
+            'tau': mpmath.mpf(DIM_E8xE8 * B2) / (DIM_J3 * H_STAR),
+            # External inputs are decimal data, exact at any precision
+            'higgs_vev': mpmath.mpf(repr(HIGGS_VEV)),
+            'h0_planck': mpmath.mpf(repr(H0_PLANCK)),
+        }
+    return types.MappingProxyType(values)
+
+
+# ============================================================================
+# Backends
+# ============================================================================
+
+@functools.lru_cache(maxsize=None)
+def longdouble_backend():
+    """np.longdouble arrays, constants rounded from 40-digit mpf values"""
+    exact = constants(_LONGDOUBLE_DPS)
+    with mpmath.workdps(_LONGDOUBLE_DPS):
+        values = {name: np.longdouble(mpmath.nstr(value, _LONGDOUBLE_DPS))
+                  for name, value in exact.items()}
+    return Backend('longdouble', lambda value: np.asarray(value, dtype=np.longdouble),
+                   types.MappingProxyType(values))
+
+
+def _elementwise(function):
+    """Apply an mpmath function to every element of an object array"""
+    ufunc = np.frompyfunc(function, 1, 1)
+    return lambda x: ufunc(x)
+
+
+def _to_mpf(value):
+    return value if isinstance(value, mpmath.mpf) else mpmath.mpf(value)
+
+
+_asarray_mpf = np.frompyfunc(_to_mpf, 1, 1)
+
+
+@functools.lru_cache(maxsize=CONSTANT_CACHE_SIZE)
+def mpmath_backend(dps=DEFAULT_DPS):
+    """
+    Object arrays of mpf evaluated at dps decimal digits. Parameters are
+    converted with mpf(), so pass strings or integers for values that are
+    not exact binary floats (e.g. '2.1' rather than 2.1).
+    """
+    return Backend(
+        f'mpmath[{dps}]',
+        lambda value: np.asarray(_asarray_mpf(np.asarray(value, dtype=object)), dtype=object),
+        constants(dps),
+        sqrt=_elementwise(mpmath.sqrt),
+        arctan=_elementwise(mpmath.atan),
+        exp2=_elementwise(lambda x: mpmath.mpf(2)**x),
+        context=lambda: mpmath.workdps(dps),
+    )
+
+
+def get_backend(name, dps=None):
+    """Backend for 'float64', 'longdouble'/'float128' or 'mpmath' (at dps digits)"""
+    if name == 'float64':
+        return FLOAT64
+    if name in ('longdouble', 'float128'):
+        return longdouble_backend()
+    if name == 'mpmath':
+        return mpmath_backend(DEFAULT_DPS if dps is None else int(dps))
+    raise ValueError(f"Unknown backend {name!r}, expected 'float64', 'longdouble' or 'mpmath'")
+
+
+def clear_cache():
+    """Drop the memoized constants and backends of every precision level"""
+    constants.cache_clear()
+    longdouble_backend.cache_clear()
+    mpmath_backend.cache_clear()
+
+
+# ============================================================================
+# Exact relations
+# ============================================================================
+
+# Closed forms the framework states for observables at the reference
+# parameters, as functions of the constants mapping. Ω_DE = ln 2 is the
+# topological value; evaluate() gives the effective ζ(3)×γ, so its residual
+# is the quantum correction rather than rounding error.
+EXACT_RELATIONS = {
+    'theta_13': ('180/21', lambda c: c['one'] * 180 / 21),
+    'delta_CP': ('ζ(3) + √5 rad', lambda c: (c['zeta3'] + c['sqrt5']) * c['degrees']),
+    'alpha_s_MZ': ('√2/12', lambda c: c['sqrt2'] / 12),
+    'Q_Koide': ('2/3', lambda c: c['one'] * 2 / 3),
+    'm_tau_m_mu': ('84/5', lambda c: c['one'] * 84 / 5),
+    'Omega_DE': ('ln 2', lambda c: mpmath.log(2)),
+    'n_s': ('(5π/16)²', lambda c: (5 * c['pi'] / 16)**2),
+    'N_generations': ('3', lambda c: c['one'] * 3),
+}
+
+
+def _exact_mpf(value):
+    """Exact mpf of an mpf, float64 or long double value"""
+    if isinstance(value, mpmath.mpf):
+        return value
+    numerator, denominator = value.as_integer_ratio()
+    return mpmath.mpf(numerator) / denominator
+
+
+def residuals(dps=DEFAULT_DPS, backend='mpmath'):
+    """
+    |evaluated - closed form| of EXACT_RELATIONS at the reference
+    parameters, as mpf at dps digits. Zero (to about 10^-dps) where the
+    relation holds; 'float64' or 'longdouble' show that precision's error.
+    """
+    results = evaluate(backend=backend, dps=dps)
+    with mpmath.workdps(dps):
+        exact = constants(dps)
+        return {name: abs(_exact_mpf(results[name][()]) - closed_form(exact))
+                for name, (_, closed_form) in EXACT_RELATIONS.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--dps', type=int, default=DEFAULT_DPS,
+                        help=f"decimal digits (default: {DEFAULT_DPS})")
+    parser.add_argument('--digits', type=int, default=30,
+                        help="digits printed per value (default: 30)")
+    args = parser.parse_args(argv)
+
+    results = evaluate(backend='mpmath', dps=args.dps)
+    print("="*70)
+    print(f"OBSERVABLES AT {args.dps} DIGITS")
+    print("="*70)
+    for name in OBSERVABLES:
+        print(f"  {name:<15} {mpmath.nstr(results[name][()], args.digits)}")
+
+    print("\n" + "="*70)
+    print("EXACT RELATIONS: |value - closed form|")
+    print("="*70)
+    print(f"  {'observable':<15}{'closed form':<16}{'float64':>12}"
+          f"{'longdouble':>12}{f'mpmath[{args.dps}]':>14}")
+    by_backend = [residuals(args.dps, backend) for backend in ('float64', 'longdouble', 'mpmath')]
+    for name, (form, _) in EXACT_RELATIONS.items():
+        columns = ''.join(f"{mpmath.nstr(r[name], 3):>12}" for r in by_backend[:2])
+        print(f"  {name:<15}{form:<16}{columns}{mpmath.nstr(by_backend[2][name], 3):>14}")
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()
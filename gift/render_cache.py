@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Content-Hash Render Cache
+============================================
+
+Build cache for the generated animations and images:
+
+- content_hash() digests the inputs of a render (data arrays, color
+  schemes, figure parameters, the source code of the functions involved,
+  library versions) into a hex key
+- output entries record the key each file was last written from, so an
+  unchanged asset is skipped entirely
+- frame entries store rasterized RGBA frames (zlib-compressed) under their
+  own key, so a partially changed animation only re-renders the frames
+  that differ
+
+Everything is tracked in a JSON manifest next to the stored frames. Frames
+are evicted least recently used first once their total size exceeds the
+cache budget.
+
+Usage:
+    cache = RenderCache(directory, max_bytes=1024**3)
+    if not cache.output_is_current(path, key):
+        ...
+        cache.record_output(path, key)
+    cache.evict()
+    cache.save()
+"""
+
+import os
+import json
+import time
+import zlib
+import types
+import inspect
+import hashlib
+
+import numpy as np
+
+# Bump whenever the manifest layout or the frame file format changes
+MANIFEST_VERSION = 1
+
+DEFAULT_MAX_BYTES = 1024**3
+# Age after which a temporary file is taken as left behind by a dead
+# process; younger ones may be another process's store in flight
+STALE_TMP_SECONDS = 3600
+
+
+def _feed(digest, obj):
+    """Update a digest with an unambiguous encoding of obj"""
+    if isinstance(obj, np.ndarray):
+        digest.update(f'ndarray:{obj.dtype.str}:{obj.shape}:'.encode())
+        digest.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, np.generic):
+        _feed(digest, obj.item())
+    elif isinstance(obj, dict):
+        digest.update(f'dict:{len(obj)}:'.encode())
+        for key in sorted(obj, key=repr):
+            _feed(digest, key)
+            _feed(digest, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        digest.update(f'{type(obj).__name__}:{len(obj)}:'.encode())
+        for item in obj:
+            _feed(digest, item)
+    elif isinstance(obj, (types.FunctionType, types.ModuleType, type)):
+        # Code is hashed by its source, so editing it invalidates the key
+        digest.update(f'source:{obj.__name__}:'.encode())
+        _feed(digest, inspect.getsource(obj))
+    elif obj is None or isinstance(obj, (str, bytes, bool, int, float, complex)):
+        digest.update(f'{type(obj).__name__}:{obj!r};'.encode())
+    else:
+        raise TypeError(f"Cannot hash the content of a {type(obj).__name__}")
+
+
+def content_hash(*parts):
+    """
+    SHA-256 hex digest of nested data: numbers, strings, lists, tuples,
+    dicts, numpy arrays, and functions or modules (hashed by source).
+    """
+    digest = hashlib.sha256()
+    _feed(digest, parts)
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    Manifest of rendered outputs plus an LRU store of rendered frames.
+
+    Frames are kept as <directory>/frames/<key>.rgba.z; the manifest
+    records each frame's shape, size on disk and last use.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.frame_dir = os.path.join(directory, 'frames')
+        self.manifest_path = os.path.join(directory, 'manifest.json')
+        self.hits = 0
+        self.misses = 0
+        self.manifest = self._load_manifest()
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest
+        except (OSError, ValueError):
+            pass
+        return {'version': MANIFEST_VERSION, 'outputs': {}, 'frames': {}}
+
+    def save(self):
+        """Write the manifest atomically"""
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f'{self.manifest_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    # ------------------------------------------------------------------------
+    # Outputs
+    # ------------------------------------------------------------------------
+
+    def output_is_current(self, path, key):
+        """True if path exists unmodified and was last written from key"""
+        entry = self.manifest['outputs'].get(os.path.abspath(path))
+        return (entry is not None and entry['key'] == key
+                and os.path.exists(path) and os.path.getsize(path) == entry['size'])
+
+    def record_output(self, path, key):
+        self.manifest['outputs'][os.path.abspath(path)] = {
+            'key': key, 'size': os.path.getsize(path), 'written': time.time(),
+        }
+
+    # ------------------------------------------------------------------------
+    # Frames
+    # ------------------------------------------------------------------------
+
+    def _frame_path(self, key):
+        return os.path.join(self.frame_dir, f'{key}.rgba.z')
+
+    def has_frame(self, key):
+        return key in self.manifest['frames'] and os.path.exists(self._frame_path(key))
+
+    def load_frame(self, key):
+        """Stored (height, width, 4) RGBA frame for key, or None"""
+        entry = self.manifest['frames'].get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        try:
+            with open(self._frame_path(key), 'rb') as f:
+                data = zlib.decompress(f.read())
+            frame = np.frombuffer(data, dtype=np.uint8).reshape(entry['shape'])
+        except (OSError, ValueError, zlib.error):
+            del self.manifest['frames'][key]
+            self.misses += 1
+            return None
+
+        entry['last_used'] = time.time()
+        self.hits += 1
+        return frame
+
+    def store_frame(self, key, frame):
+        """Compress and store one RGBA frame"""
+        frame = np.ascontiguousarray(frame)
+        os.makedirs(self.frame_dir, exist_ok=True)
+        path = self._frame_path(key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(zlib.compress(frame.tobytes(), 1))
+        os.replace(tmp_path, path)
+        self.manifest['frames'][key] = {
+            'shape': list(frame.shape), 'size': os.path.getsize(path),
+            'last_used': time.time(),
+        }
+
+    @property
+    def frame_bytes(self):
+        return sum(entry['size'] for entry in self.manifest['frames'].values())
+
+    def evict(self):
+        """
+        Delete least recently used frames until the store fits max_bytes,
+        along with frame files the manifest no longer knows about and
+        stale temporary files. Returns the number of frames removed.
+        """
+        frames = self.manifest['frames']
+        removed = 0
+        if os.path.isdir(self.frame_dir):
+            now = time.time()
+            for filename in os.listdir(self.frame_dir):
+                path = os.path.join(self.frame_dir, filename)
+                try:
+                    if filename.endswith('.tmp'):
+                        if now - os.path.getmtime(path) > STALE_TMP_SECONDS:
+                            os.remove(path)
+                    elif filename.split('.')[0] not in frames:
+                        os.remove(path)
+                except OSError:
+                    # Renamed or removed by another process meanwhile
+                    pass
+
+        total = self.frame_bytes
+        for key in sorted(frames, key=lambda key: frames[key]['last_used']):
+            if total <= self.max_bytes:
+                break
+            total -= frames.pop(key)['size']
+            try:
+                os.remove(self._frame_path(key))
+            except OSError:
+                pass
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Forget every output and delete every stored frame"""
+        self.manifest['outputs'].clear()
+        self.manifest['frames'].clear()
+        self.evict()
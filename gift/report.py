@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Headless Batch Reports
+=========================================
+
+Machine-readable validation results, without printing and without
+formatted strings: every numeric column stays numeric.
+
+- comparison(): one row per observable at the reference parameters, with
+  prediction, experimental value and error, deviation (%) and pull
+- scan_chunks(): one row per point of a parameter scan (the cartesian
+  product of the scanned axes), with every observable, its deviation (%),
+  the chi-square and the largest deviation, in fixed-size chunks
+
+Rows are streamed chunk by chunk to a writer chosen by extension, so
+memory stays constant whatever the number of scan points:
+
+- .ndjson / .jsonl: one JSON object per line (non-finite values as null)
+- .parquet: one row group per chunk (requires pyarrow)
+- .arrow: Arrow IPC file, one record batch per chunk (requires pyarrow)
+
+Usage:
+    python -m gift.report report.ndjson
+    python -m gift.report scan.parquet --scan p2=1.5:2.5:1000000 --scan Weyl_factor=4,5,6
+    python -m gift.report - --scan p2=1.9:2.1:5 | jq .chi2
+
+    from gift.report import scan_chunks, open_writer
+    with open_writer('scan.ndjson') as writer:
+        for chunk in scan_chunks({'p2': np.linspace(1.5, 2.5, 10**6)}):
+            writer.write(chunk)
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+import numpy as np
+
+from . import experimental
+from .observables import OBSERVABLES, PARAMETERS, evaluate
+
+DEFAULT_CHUNK_ROWS = 2**16
+
+
+# ============================================================================
+# Rows
+# ============================================================================
+
+def comparison(params=None, data=None):
+    """
+    Columns of the comparison with experiment at one parameter point: one
+    row per observable with experimental data, numeric except the names.
+    """
+    data = experimental.DATA if data is None else data
+    names = [name for name in OBSERVABLES if name in data]
+    results = evaluate(params)
+    prediction = np.array([float(results[name]) for name in names])
+    value = experimental.values(names, data)
+    error = experimental.errors(names, data)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        deviation = np.where(value != 0, np.abs((prediction - value) / value) * 100, 0.0)
+        pull = np.where(error > 0, (prediction - value) / error, np.nan)
+    return {
+        'observable': np.array(names),
+        'unit': np.array([data[name]['unit'] for name in names]),
+        'prediction': prediction,
+        'experimental': value,
+        'error': error,
+        'deviation_percent': deviation,
+        'pull': pull,
+    }
+
+
+def scan_size(axes):
+    return int(np.prod([len(values) for values in axes.values()], dtype=np.int64))
+
+
+def scan_chunks(axes, chunk_rows=DEFAULT_CHUNK_ROWS, data=None):
+    """
+    Yield column dicts of chunk_rows scan points over the cartesian product
+    of axes ({parameter: 1-D values}), in C order, with columns point,
+    the scanned parameters, each observable, each observable's deviation
+    (%), chi2 and max_deviation_percent.
+    """
+    unknown = set(axes) - set(PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown parameters {sorted(unknown)}, expected some of {PARAMETERS}")
+    data = experimental.DATA if data is None else data
+    axes = {name: np.asarray(values, dtype=float) for name, values in axes.items()}
+    shape = tuple(len(values) for values in axes.values())
+    names = [name for name in OBSERVABLES if name in data]
+    value = experimental.values(names, data)
+    error = experimental.errors(names, data)
+    measured = error > 0
+
+    total = scan_size(axes)
+    for start in range(0, total, chunk_rows):
+        point = np.arange(start, min(start + chunk_rows, total), dtype=np.int64)
+        index = np.unravel_index(point, shape) if shape else ()
+        params = {name: values[i] for (name, values), i in zip(axes.items(), index)}
+        results = evaluate(params)
+
+        columns = {'point': point}
+        columns.update(params)
+        predictions = np.stack([np.broadcast_to(results[name], point.shape) for name in names],
+                               axis=1).astype(float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            deviation = np.abs((predictions - value) / np.where(value != 0, value, np.nan)) * 100
+            deviation[:, value == 0] = 0.0
+            pulls = (predictions[:, measured] - value[measured]) / error[measured]
+        for i, name in enumerate(names):
+            columns[name] = predictions[:, i]
+        for i, name in enumerate(names):
+            columns[f'{name}_deviation_percent'] = deviation[:, i]
+        columns['chi2'] = np.sum(pulls**2, axis=1)
+        columns['max_deviation_percent'] = deviation.max(axis=1)
+        yield columns
+
+
+def parse_axis(spec):
+    """
+    'name=start:stop:count' (linspace) or 'name=v1,v2,...' -> (name, values)
+    """
+    name, _, values = spec.partition('=')
+    if not values:
+        raise ValueError(f"Expected name=start:stop:count or name=v1,v2,..., got {spec!r}")
+    if ':' in values:
+        start, stop, count = values.split(':')
+        return name, np.linspace(float(start), float(stop), int(float(count)))
+    return name, np.array([float(value) for value in values.split(',')])
+
+
+# ============================================================================
+# Writers
+# ============================================================================
+
+class RowWriter:
+    """
+    Base class of the streaming row writers.
+
+    write() takes a dict of equal-length 1-D columns; the first chunk fixes
+    the column names and types. Every writer reports rows and bytes
+    written and throughput.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.columns = None
+        self.rows = 0
+        self.chunks = 0
+        self.elapsed = 0.0
+        self._start = time.perf_counter()
+        self._closed = False
+
+    def write(self, columns):
+        """Append one chunk of rows"""
+        columns = {name: np.asarray(values) for name, values in columns.items()}
+        if self.columns is None:
+            self._open(columns)
+            self.columns = list(columns)
+        elif list(columns) != self.columns:
+            raise ValueError(f"Columns changed from {self.columns} to {list(columns)}")
+        self._write(columns)
+        self.rows += len(next(iter(columns.values()))) if columns else 0
+        self.chunks += 1
+
+    def close(self):
+        """Finish the file and freeze the statistics"""
+        if self._closed:
+            return
+        self._closed = True
+        if self.columns is not None:
+            self._close()
+        self.elapsed = time.perf_counter() - self._start
+
+    @property
+    def bytes_written(self):
+        return os.path.getsize(self.path) if self.path != '-' and os.path.exists(self.path) else 0
+
+    @property
+    def rows_per_second(self):
+        elapsed = self.elapsed or (time.perf_counter() - self._start)
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def summary(self):
+        return (f"{self.rows:,} rows in {self.chunks} chunks, {self.rows_per_second:.3e} rows/s, "
+                f"{self.bytes_written / 1e6:.2f} MB")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _open(self, columns):
+        raise NotImplementedError
+
+    def _write(self, columns):
+        raise NotImplementedError
+
+    def _close(self):
+        raise NotImplementedError
+
+
+class NdjsonWriter(RowWriter):
+    """
+    One JSON object per line, to a file or to stdout for path '-'.
+
+    Finite chunks are formatted through one %-template per row (repr of a
+    float is its shortest round-trip form, valid JSON); chunks holding nan
+    or inf go through json.dumps with null in their place.
+    """
+
+    def _open(self, columns):
+        self._file = sys.stdout if self.path == '-' else open(self.path, 'w', encoding='utf-8')
+        fields = []
+        for name, values in columns.items():
+            placeholder = '%s' if values.dtype.kind in 'USO' else '%r'
+            fields.append(json.dumps(name).replace('%', '%%') + ': ' + placeholder)
+        self._template = '{' + ', '.join(fields) + '}\n'
+
+    def _write(self, columns):
+        lists = []
+        finite = True
+        for values in columns.values():
+            if values.dtype.kind in 'USO':
+                lists.append([json.dumps(str(value)) for value in values.tolist()])
+            else:
+                if values.dtype.kind == 'f':
+                    finite = finite and bool(np.isfinite(values).all())
+                lists.append(values.tolist())
+        if finite:
+            self._file.write(''.join(self._template % row for row in zip(*lists)))
+            return
+        names = list(columns)
+        for row in zip(*lists):
+            record = {name: (None if isinstance(value, float) and not np.isfinite(value)
+                             else json.loads(value) if isinstance(value, str) else value)
+                      for name, value in zip(names, row)}
+            self._file.write(json.dumps(record) + '\n')
+
+    def _close(self):
+        if self._file is sys.stdout:
+            self._file.flush()
+        else:
+            self._file.close()
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError("Parquet and Arrow reports require pyarrow (pip install pyarrow); "
+                          "use .ndjson otherwise") from error
+    return pyarrow
+
+
+class ParquetWriter(RowWriter):
+    """Parquet file with one row group per chunk (pyarrow)"""
+
+    def __init__(self, path, compression='zstd'):
+        super().__init__(path)
+        self.compression = compression
+
+    def _open(self, columns):
+        pa = _require_pyarrow()
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.Table.from_pydict(columns).schema
+        self._writer = pq.ParquetWriter(self.path, self._schema, compression=self.compression)
+
+    def _write(self, columns):
+        self._writer.write_table(self._pa.Table.from_pydict(columns, schema=self._schema))
+
+    def _close(self):
+        self._writer.close()
+
+
+class ArrowWriter(RowWriter):
+    """Arrow IPC file with one record batch per chunk (pyarrow)"""
+
+    def _open(self, columns):
+        pa = _require_pyarrow()
+        self._pa = pa
+        self._schema = pa.Table.from_pydict(columns).schema
+        self._writer = pa.ipc.new_file(self.path, self._schema)
+
+    def _write(self, columns):
+        self._writer.write_table(self._pa.Table.from_pydict(columns, schema=self._schema))
+
+    def _close(self):
+        self._writer.close()
+
+
+WRITERS = {
+    '.ndjson': NdjsonWriter,
+    '.jsonl': NdjsonWriter,
+    '.parquet': ParquetWriter,
+    '.arrow': ArrowWriter,
+}
+
+
+def writer_class(path):
+    """Row writer class of a path, chosen by extension; '-' is NDJSON on stdout"""
+    if path == '-':
+        return NdjsonWriter
+    extension = os.path.splitext(path)[1].lower()
+    if extension in WRITERS:
+        return WRITERS[extension]
+    raise ValueError(f"Unsupported report format {extension!r}, expected one of {list(WRITERS)}")
+
+
+def open_writer(path, **kwargs):
+    """Streaming row writer for a path (see writer_class)"""
+    return writer_class(path)(path, **kwargs)
+
+
+def write_report(path, axes=None, chunk_rows=DEFAULT_CHUNK_ROWS, data=None):
+    """
+    Write the comparison at the reference parameters, or the scan over axes
+    if given, to path. Returns the closed writer (for its statistics).
+    """
+    with open_writer(path) as writer:
+        if axes:
+            for chunk in scan_chunks(axes, chunk_rows, data):
+                writer.write(chunk)
+        else:
+            writer.write(comparison(data=data))
+    return writer
+
+
+# ============================================================================
+# Main Execution
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('output', help="output file (.ndjson, .jsonl, .parquet, .arrow) "
+                                       "or - for NDJSON on stdout")
+    parser.add_argument('--scan', action='append', default=[], metavar='NAME=SPEC',
+                        help="scanned parameter, start:stop:count or v1,v2,... (repeatable; "
+                             "default: comparison at the reference parameters)")
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS,
+                        help=f"rows per chunk / row group (default: {DEFAULT_CHUNK_ROWS})")
+    parser.add_argument('--quiet', action='store_true', help="no summary on stderr")
+    args = parser.parse_args(argv)
+
+    # Report bad arguments and a missing pyarrow before evaluating anything
+    try:
+        axes = dict(parse_axis(spec) for spec in args.scan)
+        unknown = set(axes) - set(PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown --scan parameters {sorted(unknown)}, "
+                             f"expected some of {PARAMETERS}")
+        if writer_class(args.output) in (ParquetWriter, ArrowWriter):
+            _require_pyarrow()
+    except (ValueError, ImportError) as e:
+        parser.error(str(e))
+    writer = write_report(args.output, axes, args.chunk_rows)
+    if not args.quiet:
+        print(f"{args.output}: {writer.summary()}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Incremental Revalidation
+===========================================
+
+Dependency graph from the experimental datasets (gift/datasets/) to the
+validation report, and through generate_animations.py to the rendered
+assets:
+
+    parameters -> predictions -+
+    data:<observable> ---------+-> comparison:<observable> -> statistics -> report
+                                                           -> asset:<name>
+
+Each node's key hashes its function's source, the modules it depends on
+(gift.observables and gift.constants for the predictions), its arguments
+and the keys of its inputs (a leaf's, its value), so a key changes
+exactly when something upstream changed. Results are memoized by key, in
+memory and on disk in GIFT_CACHE_DIR ('' keeps them in memory only):
+loading a new dataset version recomputes the comparisons of the
+observables whose entries changed and what depends on them, and looks
+everything else up.
+
+Usage:
+    python -m gift.revalidation run my_dataset.json   # recomputed nodes and statistics
+    python -m gift.revalidation diff pdg2022 my_dataset.json
+    python -m gift.revalidation graph
+
+    from gift import revalidation
+    run = revalidation.revalidate('pdg2022')
+    run.recomputed, run.values['statistics']['mean_deviation_percent']
+"""
+
+import os
+import json
+import argparse
+
+import numpy as np
+
+from . import constants, e8, experimental, observables
+from .observables import OBSERVABLES, P2, RANK_E8, WEYL_FACTOR, evaluate
+from .render_cache import content_hash
+
+REFERENCE_PARAMETERS = {'p2': P2, 'rank_E8': RANK_E8, 'Weyl_factor': WEYL_FACTOR}
+
+# Fields of a comparison, in report order
+COMPARISON_FIELDS = ('prediction', 'experimental', 'error', 'deviation_percent', 'pull')
+
+
+# ============================================================================
+# Graph
+# ============================================================================
+
+class Node:
+    """
+    Node of a Graph: function(*args, *input values) computes its value;
+    leaves have no function and take their value from the run. sources
+    are the modules (or other objects) the function's result depends on
+    beyond its own source, hashed into the node's key.
+    """
+
+    __slots__ = ('name', 'function', 'inputs', 'args', 'sources')
+
+    def __init__(self, name, function=None, inputs=(), args=(), sources=()):
+        self.name = name
+        self.function = function
+        self.inputs = tuple(inputs)
+        self.args = tuple(args)
+        self.sources = tuple(sources)
+
+
+class Graph:
+    """
+    Nodes in topological order: a node's inputs must be added before it.
+    """
+
+    def __init__(self):
+        self.nodes = {}
+
+    def leaf(self, name):
+        return self._add(Node(name))
+
+    def add(self, name, function, inputs=(), args=(), sources=()):
+        missing = [parent for parent in inputs if parent not in self.nodes]
+        if missing:
+            raise ValueError(f"Node {name!r}: unknown inputs {missing}")
+        return self._add(Node(name, function, inputs, args, sources))
+
+    def _add(self, node):
+        if node.name in self.nodes:
+            raise ValueError(f"Node {node.name!r} already in the graph")
+        self.nodes[node.name] = node
+        return node
+
+    def leaves(self):
+        return [name for name, node in self.nodes.items() if node.function is None]
+
+    def dependents(self, names):
+        """Every node downstream of names (included), in topological order"""
+        affected = set(names)
+        for name, node in self.nodes.items():
+            if affected.intersection(node.inputs):
+                affected.add(name)
+        return [name for name in self.nodes if name in affected]
+
+
+class Memo:
+    """
+    Node values by key, in memory and, with a path, in a JSON file.
+    Values must be JSON-serializable to persist.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.values = {}
+        if path:
+            try:
+                with open(path, encoding='utf-8') as f:
+                    self.values = json.load(f)
+            except (OSError, ValueError):
+                self.values = {}
+        self._dirty = False
+
+    def __contains__(self, key):
+        return key in self.values
+
+    def get(self, key):
+        return self.values[key]
+
+    def put(self, key, value):
+        self.values[key] = value
+        self._dirty = True
+
+    def save(self):
+        """Write the memo atomically; an unwritable cache is silently skipped"""
+        if not self.path or not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f'{self.path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.values, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError:
+            pass
+
+
+def memo_path():
+    """Path of the on-disk memo in the GIFT cache directory, or None"""
+    directory = e8.cache_dir()
+    if not directory:
+        return None
+    return os.path.join(directory, 'revalidation', 'memo.json')
+
+
+class Run:
+    """
+    Values and keys of every node after a run, and which nodes were
+    recomputed or looked up in the memo (both in topological order).
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.values = {}
+        self.keys = {}
+        self.recomputed = []
+        self.reused = []
+        self.dataset = None
+
+    def changed(self, previous):
+        """Nodes whose key differs from a previous run's, in topological order"""
+        return [name for name in self.keys if previous.keys.get(name) != self.keys[name]]
+
+
+def run(graph, leaves, memo=None):
+    """
+    Evaluate a graph for leaf values ({leaf: value}), recomputing only the
+    nodes whose key is not in the memo.
+    """
+    missing = [name for name in graph.leaves() if name not in leaves]
+    if missing:
+        raise ValueError(f"No value for leaves {missing}")
+    memo = Memo() if memo is None else memo
+
+    result = Run(graph)
+    for name, node in graph.nodes.items():
+        if node.function is None:
+            result.values[name] = leaves[name]
+            result.keys[name] = content_hash('leaf', leaves[name])
+            continue
+
+        key = content_hash(node.function, node.sources, node.args,
+                           [result.keys[i] for i in node.inputs])
+        result.keys[name] = key
+        if key in memo:
+            result.values[name] = memo.get(key)
+            result.reused.append(name)
+            continue
+
+        value = node.function(*node.args, *(result.values[i] for i in node.inputs))
+        memo.put(key, value)
+        result.values[name] = value
+        result.recomputed.append(name)
+    return result
+
+
+# ============================================================================
+# Validation nodes
+# ============================================================================
+
+def predict(parameters):
+    """Every observable at a parameter point, as floats"""
+    results = evaluate(parameters)
+    return {name: float(results[name]) for name in OBSERVABLES}
+
+
+def compare(observable, predictions, entry):
+    """Comparison of one observable with its dataset entry (None without one)"""
+    if entry is None:
+        return None
+    prediction = predictions[observable]
+    value, error = float(entry['exp']), float(entry['err'])
+    return {
+        'observable': observable,
+        'unit': entry['unit'],
+        'prediction': prediction,
+        'experimental': value,
+        'error': error,
+        'deviation_percent': abs((prediction - value) / value) * 100 if value != 0 else 0.0,
+        'pull': (prediction - value) / error if error > 0 else float('nan'),
+    }
+
+
+def statistics(*comparisons):
+    """Summary statistics over the comparisons of the observables with data"""
+    comparisons = [c for c in comparisons if c is not None]
+    if not comparisons:
+        return {'n_observables': 0}
+    deviation = np.array([c['deviation_percent'] for c in comparisons])
+    pulls = np.array([c['pull'] for c in comparisons])
+    measured = np.isfinite(pulls)
+    worst = int(np.argmax(deviation))
+    return {
+        'n_observables': len(comparisons),
+        'mean_deviation_percent': float(deviation.mean()),
+        'median_deviation_percent': float(np.median(deviation)),
+        'max_deviation_percent': float(deviation[worst]),
+        'max_deviation_observable': comparisons[worst]['observable'],
+        'n_within_1_percent': int(np.sum(deviation < 1)),
+        'chi2': float(np.sum(pulls[measured]**2)),
+        'n_measured': int(measured.sum()),
+    }
+
+
+def report(stats, *comparisons):
+    """Validation report: statistics and every comparison by observable"""
+    return {
+        'statistics': stats,
+        'comparisons': {c['observable']: c for c in comparisons if c is not None},
+    }
+
+
+def validation_graph(names=OBSERVABLES):
+    """
+    Graph of the validation: leaves 'parameters' and 'data:<observable>',
+    nodes 'predictions', 'comparison:<observable>', 'statistics', 'report'.
+    Add asset nodes on top (see generate_animations.asset_graph).
+    """
+    graph = Graph()
+    graph.leaf('parameters')
+    # evaluate() does the work: its formulas and constants key the predictions
+    graph.add('predictions', predict, ['parameters'], sources=(observables, constants))
+    for name in names:
+        graph.leaf(f'data:{name}')
+        graph.add(f'comparison:{name}', compare, ['predictions', f'data:{name}'], args=(name,))
+    comparisons = [f'comparison:{name}' for name in names]
+    graph.add('statistics', statistics, comparisons)
+    graph.add('report', report, ['statistics', *comparisons])
+    return graph
+
+
+def leaves(dataset=experimental.DEFAULT_DATASET, params=None, names=OBSERVABLES):
+    """Leaf values of a validation graph for a dataset (version, path or record)"""
+    record = experimental.load(dataset) if isinstance(dataset, str) else dataset
+    values = {'parameters': {**REFERENCE_PARAMETERS, **(params or {})}}
+    values.update({f'data:{name}': record['data'].get(name) for name in names})
+    return values
+
+
+def revalidate(dataset=experimental.DEFAULT_DATASET, params=None, graph=None, memo=None):
+    """
+    Run the validation graph (or a graph extending it) for a dataset,
+    through the on-disk memo unless one is given.
+
+    Returns:
+        Run, with the dataset record in run.dataset
+    """
+    record = experimental.load(dataset) if isinstance(dataset, str) else dataset
+    graph = validation_graph() if graph is None else graph
+    own_memo = memo is None
+    if own_memo:
+        memo = Memo(memo_path())
+    result = run(graph, leaves(record, params), memo)
+    if own_memo:
+        memo.save()
+    result.dataset = record
+    return result
+
+
+def clear_cache():
+    """Delete the on-disk memo"""
+    path = memo_path()
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+# ============================================================================
+# Report diff
+# ============================================================================
+
+def _differs(old, new):
+    if isinstance(old, float) and isinstance(new, float):
+        return not (old == new or (np.isnan(old) and np.isnan(new)))
+    return old != new
+
+
+def diff(old, new):
+    """
+    Differences between two reports.
+
+    Returns:
+        Dict with 'comparisons' ({observable: {field: (old, new)}} for the
+        observables in both reports whose fields differ), 'statistics'
+        ({field: (old, new)}), 'added' and 'removed' observables
+    """
+    before, after = old['comparisons'], new['comparisons']
+    comparisons = {}
+    for name in OBSERVABLES:
+        if name in before and name in after:
+            changes = {field: (before[name][field], after[name][field])
+                       for field in COMPARISON_FIELDS
+                       if _differs(before[name][field], after[name][field])}
+            if changes:
+                comparisons[name] = changes
+    stats = {field: (old['statistics'].get(field), new['statistics'].get(field))
+             for field in dict.fromkeys([*old['statistics'], *new['statistics']])
+             if _differs(old['statistics'].get(field), new['statistics'].get(field))}
+    return {
+        'comparisons': comparisons,
+        'statistics': stats,
+        'added': [name for name in OBSERVABLES if name in after and name not in before],
+        'removed': [name for name in OBSERVABLES if name in before and name not in after],
+    }
+
+
+def _format(value):
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
+
+
+def print_diff(changes, old_label, new_label):
+    print(f"{'observable':<15}{'field':<26}{old_label[:14]:>14}{new_label[:14]:>14}")
+    print("-"*70)
+    for name, fields in changes['comparisons'].items():
+        for i, (field, (old, new)) in enumerate(fields.items()):
+            print(f"{name if i == 0 else '':<15}{field:<26}{_format(old):>14}{_format(new):>14}")
+    for name in changes['added']:
+        print(f"{name:<15}(added)")
+    for name in changes['removed']:
+        print(f"{name:<15}(removed)")
+    if changes['statistics']:
+        print("-"*70)
+        for field, (old, new) in changes['statistics'].items():
+            print(f"{'statistics':<15}{field:<26}{_format(old):>14}{_format(new):>14}")
+
+
+# ============================================================================
+# Main Execution
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help="revalidate against a dataset")
+    run_parser.add_argument('dataset', nargs='?', default=experimental.DEFAULT_DATASET,
+                            help=f"version in gift/datasets or path "
+                                 f"(default: {experimental.DEFAULT_DATASET})")
+    run_parser.add_argument('--output', metavar='JSON', help="write the report to a file")
+    diff_parser = commands.add_parser('diff', help="diff the reports of two datasets")
+    diff_parser.add_argument('old', help="version or path")
+    diff_parser.add_argument('new', help="version or path")
+    diff_parser.add_argument('--output', metavar='JSON', help="write the diff to a file")
+    commands.add_parser('graph', help="print the dependency graph")
+    args = parser.parse_args(argv)
+
+    if args.command == 'graph':
+        for name, node in validation_graph().nodes.items():
+            inputs = ', '.join(node.inputs) if len(node.inputs) <= 3 else \
+                f"{', '.join(node.inputs[:2])}, ... ({len(node.inputs)} inputs)"
+            print(f"{name:<28}{'(leaf)' if node.function is None else '<- ' + inputs}")
+        return
+
+    try:
+        if args.command == 'run':
+            result = revalidate(args.dataset)
+        else:
+            old, result = revalidate(args.old), revalidate(args.new)
+    except ValueError as e:
+        parser.error(str(e))
+
+    record = result.dataset
+    print("="*70)
+    print(f"REVALIDATION: {record['version']}"
+          + (f" (base {record['base']})" if record['base'] else ""))
+    print("="*70)
+    print(f"Recomputed {len(result.recomputed)} nodes, "
+          f"{len(result.reused)} looked up in the memo")
+    for name in result.recomputed:
+        print(f"  {name}")
+
+    if args.command == 'run':
+        stats = result.values['statistics']
+        print("\nStatistics:")
+        for field, value in stats.items():
+            print(f"  {field:<28}{_format(value)}")
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump({'dataset': record, 'report': result.values['report']}, f, indent=2)
+            print(f"\nReport written to {args.output}")
+    else:
+        changes = diff(old.values['report'], result.values['report'])
+        affected = result.changed(old)
+        print(f"\nNodes affected between {old.dataset['version']} and {record['version']}: "
+              f"{len(affected)}")
+        for name in affected:
+            print(f"  {name}")
+        print()
+        print_diff(changes, old.dataset['version'], record['version'])
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump({'old': old.dataset['version'], 'new': record['version'],
+                           'diff': changes}, f, indent=2)
+            print(f"\nDiff written to {args.output}")
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Renormalization Group Running
+================================================
+
+Running of the gauge couplings predicted at M_Z (alpha_inv_MZ,
+sin2theta_W, alpha_s_MZ) to any scale μ, for whole batches of initial
+conditions at once.
+
+The couplings are the inverse couplings αᵢ⁻¹ of U(1)_Y (GUT normalized),
+SU(2)_L and SU(3)_c, in the MS-bar scheme, evolved in t = ln(μ/GeV):
+
+- above M_Z: Standard Model two-loop gauge beta functions,
+  dαᵢ⁻¹/dt = -bᵢ/2π - Σⱼ bᵢⱼ αⱼ/8π², without Yukawa contributions
+- below M_Z: two-loop QCD for α_s with nf = 5, 4, 3 active flavors,
+  switching at the quark mass thresholds m_b and m_c (α_s continuous);
+  the electroweak couplings are held at their M_Z values
+
+A batch is one ODE system: the state is an array (3, n) and every step
+of the adaptive Dormand–Prince integrator (scipy DOP853) advances all n
+trajectories together. The integration stops exactly at each threshold,
+and the states reached there are cached, so running the same batch to
+further scales restarts from the nearest threshold. Large batches are
+cut into fixed-size chunks, run serially or on a process pool and put
+back in order. Results therefore depend on the chunk size but not on the
+number of workers.
+
+Usage:
+    from gift import running
+    result = running.run([1.777, 1e3, 1e16])      # GIFT predictions at M_Z
+    result['alpha_s'][0]                          # α_s(m_τ)
+
+    state = np.repeat(running.initial_conditions()[0], 10000, axis=1)
+    state[2] = 1 / np.linspace(0.115, 0.121, 10000)   # α_s(M_Z) scan, no Python loop
+    result = running.run(1e16, state=state, jobs=4)
+
+    python -m gift.running --scales 1.777 1e3 1e16
+"""
+
+import os
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.integrate import solve_ivp
+
+from . import experimental
+from .observables import evaluate
+
+# Scales in GeV
+M_Z = 91.1876
+M_B = 4.18      # MS-bar m_b(m_b)
+M_C = 1.27      # MS-bar m_c(m_c)
+
+# One- and two-loop SM gauge coefficients, GUT-normalized U(1)_Y
+B_SM = np.array([41 / 10, -19 / 6, -7.0])
+B2_SM = np.array([
+    [199 / 50, 27 / 10, 44 / 5],
+    [9 / 10, 35 / 6, 12.0],
+    [11 / 10, 9 / 2, -26.0],
+])
+
+# Thresholds below M_Z: (lower scale of the region, active quark flavors)
+QCD_REGIONS = ((M_B, 5), (M_C, 4), (0.0, 3))
+
+RTOL = 1e-10
+ATOL = 1e-12
+
+DEFAULT_CHUNK_SIZE = 2**14
+
+COUPLINGS = ('alpha_inv_1', 'alpha_inv_2', 'alpha_inv_3')
+OUTPUTS = COUPLINGS + ('alpha_inv_em', 'sin2theta_W', 'alpha_s')
+
+
+# ============================================================================
+# Beta functions
+# ============================================================================
+
+def beta_sm(t, y):
+    """dαᵢ⁻¹/dt of the SM above M_Z, for a flattened (3, n) state"""
+    inverse = y.reshape(3, -1)
+    derivative = -B_SM[:, None] / (2 * np.pi) - (B2_SM @ (1 / inverse)) / (8 * np.pi**2)
+    return derivative.ravel()
+
+
+def beta_qcd(nf):
+    """dαᵢ⁻¹/dt below M_Z with nf active flavors: α_s alone runs"""
+    beta0 = 11 - 2 * nf / 3
+    beta1 = 102 - 38 * nf / 3
+
+    def beta(t, y):
+        inverse = y.reshape(3, -1)
+        derivative = np.zeros_like(inverse)
+        derivative[2] = beta0 / (2 * np.pi) + beta1 / (8 * np.pi**2 * inverse[2])
+        return derivative.ravel()
+
+    return beta
+
+
+def regions():
+    """
+    Effective theories as (lower, upper, beta) in GeV, from M_Z upward and
+    downward; every boundary other than 0 and ∞ is a threshold.
+    """
+    result = [(M_Z, np.inf, beta_sm)]
+    upper = M_Z
+    for lower, nf in QCD_REGIONS:
+        result.append((lower, upper, beta_qcd(nf)))
+        upper = lower
+    return result
+
+
+# ============================================================================
+# Initial conditions
+# ============================================================================
+
+def initial_conditions(params=None):
+    """
+    Inverse couplings (3, n) at M_Z from evaluate(params), flattened over
+    the parameter grid, and the grid shape.
+    """
+    results = evaluate(params)
+    alpha_inv_em = np.ravel(results['alpha_inv_MZ'])
+    sin2 = np.ravel(results['sin2theta_W'])
+    alpha_s = np.ravel(results['alpha_s_MZ'])
+    state = np.stack([3 / 5 * (1 - sin2) * alpha_inv_em, sin2 * alpha_inv_em, 1 / alpha_s])
+    return state, results['alpha_s_MZ'].shape
+
+
+def derived(state):
+    """All OUTPUTS from inverse couplings (3, ...)"""
+    alpha_inv_em = state[1] + 5 / 3 * state[0]
+    values = dict(zip(COUPLINGS, state))
+    values.update(alpha_inv_em=alpha_inv_em, sin2theta_W=state[1] / alpha_inv_em,
+                  alpha_s=1 / state[2])
+    return values
+
+
+# ============================================================================
+# Batched running
+# ============================================================================
+
+class Running:
+    """
+    A batch of trajectories from inverse couplings (3, n) at M_Z. The
+    states at thresholds are cached as they are reached.
+    """
+
+    def __init__(self, state):
+        self.state = np.array(state, dtype=float)
+        self.n = self.state.shape[1]
+        self.evaluations = 0
+        self._cache = {M_Z: self.state}
+
+    def _integrate(self, beta, start, stop, targets):
+        """States (len(targets), 3, n) at targets, and at stop, from the cached start"""
+        if stop == start:
+            return np.broadcast_to(self._cache[start], (len(targets), 3, self.n)), self._cache[start]
+        # solve_ivp wants distinct evaluation points, ordered along the run
+        points, where = np.unique(np.append(targets, stop), return_inverse=True)
+        if stop < start:
+            points, where = points[::-1], len(points) - 1 - where
+        solution = solve_ivp(beta, (np.log(start), np.log(stop)), self._cache[start].ravel(),
+                             method='DOP853', t_eval=np.log(points), rtol=RTOL, atol=ATOL)
+        if not solution.success:
+            raise RuntimeError(f"RG integration failed between {start} and {stop} GeV: "
+                               f"{solution.message}")
+        self.evaluations += solution.nfev
+        states = solution.y.T.reshape(-1, 3, self.n)[where]
+        return states[:-1], states[-1]
+
+    def at(self, scales):
+        """Inverse couplings (m, 3, n) at scales (m,) in GeV"""
+        scales = np.atleast_1d(np.asarray(scales, dtype=float))
+        if np.any(scales <= 0):
+            raise ValueError("Scales must be positive (GeV)")
+        result = np.empty((len(scales), 3, self.n))
+        for lower, upper, beta in regions():
+            if upper == np.inf:
+                # Above M_Z: no threshold, straight to the largest scale
+                inside = np.flatnonzero(scales >= lower)
+                order = inside[np.argsort(scales[inside])]
+                stop = scales[order[-1]] if len(order) else lower
+                result[order] = self._integrate(beta, lower, stop, scales[order])[0]
+                continue
+
+            # Below M_Z: region by region, downward from its upper threshold
+            if not np.any(scales < upper):
+                continue
+            inside = np.flatnonzero((scales >= lower) & (scales < upper))
+            order = inside[np.argsort(-scales[inside])]
+            crosses = lower > 0 and np.any(scales < lower)
+            if crosses and lower in self._cache and not len(order):
+                continue
+            stop = lower if crosses else scales[order[-1]]
+            result[order], at_stop = self._integrate(beta, upper, stop, scales[order])
+            if crosses:
+                self._cache[lower] = at_stop
+        return result
+
+
+def _run_task(task):
+    state, scales = task
+    return Running(state).at(scales)
+
+
+def run(scales, params=None, state=None, jobs=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Couplings at scales (m,) in GeV, as a dict of OUTPUTS arrays of shape
+    (m,) + grid shape.
+
+    Initial conditions are the predictions of evaluate(params), or inverse
+    couplings state (3, ...) at M_Z given directly. Chunks of chunk_size
+    trajectories run serially or on a process pool with jobs > 1.
+    """
+    if state is None:
+        state, shape = initial_conditions(params)
+    else:
+        state = np.asarray(state, dtype=float)
+        shape = state.shape[1:]
+        state = state.reshape(3, -1)
+    scales = np.atleast_1d(np.asarray(scales, dtype=float))
+
+    tasks = [(state[:, start:start + chunk_size], scales)
+             for start in range(0, state.shape[1], chunk_size)]
+    if jobs <= 1:
+        chunks = [_run_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunks = list(pool.map(_run_task, tasks))
+
+    values = np.concatenate(chunks, axis=2).transpose(1, 0, 2)
+    return {name: value.reshape((len(scales),) + tuple(shape))
+            for name, value in derived(values).items()}
+
+
+def crossing_scale(i, j, params=None, state=None, low=M_Z, high=1e19, points=400):
+    """
+    Scale in GeV where αᵢ⁻¹ = αⱼ⁻¹ (coupling indices 0, 1, 2) for each
+    trajectory, from a log grid refined linearly in ln μ; nan if they do
+    not cross in [low, high].
+    """
+    scales = np.geomspace(low, high, points)
+    result = run(scales, params, state)
+    difference = result[COUPLINGS[i]] - result[COUPLINGS[j]]
+    flat = difference.reshape(points, -1)
+    sign_change = np.signbit(flat[:-1]) != np.signbit(flat[1:])
+    crossing = np.full(flat.shape[1], np.nan)
+    found = sign_change.any(axis=0)
+    first = np.argmax(sign_change, axis=0)[found]
+    columns = np.flatnonzero(found)
+    before, after = flat[first, columns], flat[first + 1, columns]
+    log_scales = np.log(scales)
+    fraction = before / (before - after)
+    crossing[found] = np.exp(log_scales[first] + fraction * (log_scales[first + 1] - log_scales[first]))
+    return crossing.reshape(difference.shape[1:])
+
+
+# ============================================================================
+# Main Execution
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--scales', type=float, nargs='+',
+                        default=[M_C, 1.777, M_B, M_Z, 1e3, 1e10, 1e16],
+                        help="scales in GeV (default: m_c m_τ m_b M_Z 1 TeV 1e10 1e16)")
+    parser.add_argument('--scan', type=float, default=1e5,
+                        help="trajectories of the timed α_s(M_Z) scan (default: 1e5)")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="worker processes (default: 1; 0: one per CPU core)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"trajectories per chunk (default: {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count()
+
+    result = run(args.scales)
+    print("="*78)
+    print("GAUGE COUPLINGS OF THE GIFT PREDICTIONS (two-loop MS-bar running)")
+    print("="*78)
+    print(f"{'μ [GeV]':>12}{'α1⁻¹':>11}{'α2⁻¹':>11}{'α3⁻¹':>11}{'α_s':>10}"
+          f"{'α_em⁻¹':>11}{'sin²θ_W':>11}")
+    print("-"*78)
+    for index, scale in enumerate(args.scales):
+        row = {name: float(value[index]) for name, value in result.items()}
+        print(f"{scale:>12.4g}{row['alpha_inv_1']:>11.4f}{row['alpha_inv_2']:>11.4f}"
+              f"{row['alpha_inv_3']:>11.4f}{row['alpha_s']:>10.5f}"
+              f"{row['alpha_inv_em']:>11.4f}{row['sin2theta_W']:>11.5f}")
+    print("-"*78)
+    for i, j in ((0, 1), (1, 2), (0, 2)):
+        scale = float(crossing_scale(i, j))
+        print(f"  α{i + 1}⁻¹ = α{j + 1}⁻¹ at μ = {scale:.3e} GeV")
+
+    # α_s(M_Z) across ±3σ of its measurement, electroweak couplings as predicted
+    n = int(args.scan)
+    measured = experimental.DATA['alpha_s_MZ']
+    state = np.repeat(initial_conditions()[0], n, axis=1)
+    state[2] = 1 / np.linspace(measured['exp'] - 3 * measured['err'],
+                               measured['exp'] + 3 * measured['err'], n)
+    start = time.perf_counter()
+    run(args.scales, state=state, jobs=jobs, chunk_size=args.chunk_size)
+    elapsed = time.perf_counter() - start
+    print(f"  α_s(M_Z) scan: {n:,} trajectories to {len(args.scales)} scales in {elapsed:.2f} s "
+          f"({n / elapsed:.3e}/s with {jobs} worker(s))")
+    print("="*78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Symbolic Observables
+=======================================
+
+The 18 observables of gift.observables as sympy expressions, compiled
+once into a fused NumPy kernel (common subexpressions eliminated) that
+returns the values, the Jacobian and optionally the Hessian over whole
+parameter grids in a single vectorized pass: exact sensitivities instead
+of finite differences over repeated compute_all() calls.
+
+Variables:
+- parameters: p2, rank_E8, Weyl_factor, beta0, xi, delta
+- topological integers, as continuous variables: b2, b3, dim_K7, dim_G2,
+  dim_J3, dim_E8 (H* = 1 + b2 + b3, τ = 2·dim_E8·b2 / (dim_J3·H*))
+
+By default beta0, xi and delta are variables of their own, as when given
+explicitly to evaluate(). With derived=True they are replaced by their
+relations to p2, rank_E8 and Weyl_factor, so the derivatives are total
+derivatives along the framework's constraints.
+
+The generated kernel source is cached in the same directory as the E8
+tables (GIFT_CACHE_DIR, '' to disable), keyed by this module's source and
+the sympy version: later processes exec the cached source and never
+import sympy.
+
+Usage:
+    from gift import symbolic
+    d = symbolic.derivatives({'p2': np.linspace(1.9, 2.1, 101)}, order=2)
+    d.values.shape, d.jacobian.shape, d.hessian.shape
+    # (101, 18), (101, 18, 12), (101, 18, 12, 12)
+    d.elasticities()[..., d.index('n_s'), d.variables.index('xi')]   # 2.0
+
+    python -m gift.symbolic --derived      # elasticity table at the reference
+"""
+
+import os
+import json
+import time
+import argparse
+import functools
+import importlib.metadata
+
+import numpy as np
+
+from . import e8
+from .observables import (
+    OBSERVABLES, INDEPENDENT_PARAMETERS, PARAMETERS,
+    B2, B3, DIM_K7, DIM_G2, DIM_J3, DIM_E8, HIGGS_VEV, H0_PLANCK, parameters,
+)
+from .render_cache import content_hash
+
+TOPOLOGICAL_INTEGERS = ('b2', 'b3', 'dim_K7', 'dim_G2', 'dim_J3', 'dim_E8')
+VARIABLES = PARAMETERS + TOPOLOGICAL_INTEGERS
+
+TOPOLOGY = {'b2': B2, 'b3': B3, 'dim_K7': DIM_K7, 'dim_G2': DIM_G2,
+            'dim_J3': DIM_J3, 'dim_E8': DIM_E8}
+
+# Bump whenever the cached kernel file layout changes
+CACHE_VERSION = 1
+
+# ζ(3), which NumPy has no function for, enters the kernels as this literal
+ZETA3_DIGITS = '1.2020569031595942853997381615114499907649862923404988817922715553418382'
+
+
+# ============================================================================
+# Expressions
+# ============================================================================
+
+def symbols():
+    """Positive real sympy symbol of every variable, by name"""
+    import sympy
+    return {name: sympy.Symbol(name, positive=True) for name in VARIABLES}
+
+
+def expressions(derived=False):
+    """
+    Every observable as a sympy expression of the variables, with exact
+    constants (π, γ, ζ(3), φ, √2, ...), angles in degrees.
+
+    With derived=True, beta0, xi and delta are substituted by their
+    relations to p2, rank_E8 and Weyl_factor.
+    """
+    import sympy
+    s = symbols()
+    p2, rank, weyl = s['p2'], s['rank_E8'], s['Weyl_factor']
+    beta0, xi, delta = s['beta0'], s['xi'], s['delta']
+    b2, b3 = s['b2'], s['b3']
+    pi, gamma, zeta3, phi = sympy.pi, sympy.EulerGamma, sympy.zeta(3), sympy.GoldenRatio
+    sqrt, degrees = sympy.sqrt, 180 / sympy.pi
+
+    h_star = 1 + b2 + b3
+    tau = 2 * s['dim_E8'] * b2 / (s['dim_J3'] * h_star)
+    sin2theta_W = pi**2 / 6 - sqrt(2)
+    lambda_H = sqrt(17) * 2**(-weyl)
+
+    results = {
+        'theta_12': sympy.atan(sqrt(delta / gamma)) * degrees,
+        'theta_13': pi / b2 * degrees,
+        'theta_23': (rank + b3) / h_star * degrees,
+        'delta_CP': (zeta3 + sqrt(5)) * degrees,
+        'alpha_inv_0': weyl * tau * s['dim_K7'],
+        'alpha_inv_MZ': 2**(rank - 1) - sympy.Rational(1, 24),
+        'sin2theta_W': sin2theta_W,
+        'alpha_s_MZ': sqrt(2) / 12,
+        'MW_MZ': sqrt(1 - sin2theta_W),
+        'lambda_H': lambda_H,
+        'm_H': sympy.Float(HIGGS_VEV) * sqrt(2 * lambda_H),
+        'Q_Koide': s['dim_G2'] / b2,
+        'm_mu_m_e': s['dim_J3']**phi,
+        'm_tau_m_mu': (s['dim_K7'] + b3) / weyl,
+        'Omega_DE': zeta3 * gamma,
+        'n_s': xi**2,
+        'H_0': sympy.Float(H0_PLANCK) * (zeta3 / xi)**beta0,
+        'N_generations': rank - weyl,
+    }
+    if derived:
+        relations = {beta0: pi / rank, xi: weyl / p2 * (pi / rank), delta: 2 * pi / weyl**2}
+        results = {name: expr.subs(relations) for name, expr in results.items()}
+    return {name: sympy.sympify(results[name]) for name in OBSERVABLES}
+
+
+def variables(derived=False):
+    """Variables the derivatives are taken with respect to, in kernel order"""
+    return (INDEPENDENT_PARAMETERS if derived else PARAMETERS) + TOPOLOGICAL_INTEGERS
+
+
+# ============================================================================
+# Compilation
+# ============================================================================
+
+def _compile_source(order, derived):
+    """
+    Differentiate and lambdify every observable into one kernel.
+
+    Returns:
+        (source, jacobian, hessian): the generated Python source of a
+        function of the variables returning a flat list of outputs (the
+        values, then the nonzero Jacobian entries, then the nonzero upper
+        Hessian entries), and the [observable, variable(, variable)]
+        indices of those derivative entries
+    """
+    import inspect
+    import sympy
+
+    s = symbols()
+    names = variables(derived)
+    numeric = {sympy.zeta(3): sympy.Float(ZETA3_DIGITS, len(ZETA3_DIGITS))}
+    exprs = [expr.subs(numeric) for expr in expressions(derived).values()]
+
+    jacobian, hessian, firsts, seconds = [], [], [], []
+    for i, expr in enumerate(exprs):
+        for j, name in enumerate(names):
+            first = sympy.diff(expr, s[name])
+            if first == 0:
+                continue
+            jacobian.append((i, j))
+            firsts.append(first)
+            if order < 2:
+                continue
+            for k in range(j, len(names)):
+                second = sympy.diff(first, s[names[k]])
+                if second != 0:
+                    hessian.append((i, j, k))
+                    seconds.append(second)
+
+    function = sympy.lambdify([s[name] for name in names], exprs + firsts + seconds,
+                              'numpy', cse=True)
+    return inspect.getsource(function), jacobian, hessian
+
+
+def cache_key(order, derived):
+    """Key of a compiled kernel: this module's source, sympy version and options"""
+    # The file rather than the module object, which is __main__ under -m
+    with open(__file__, encoding='utf-8') as f:
+        source = f.read()
+    return content_hash(source, importlib.metadata.version('sympy'),
+                        CACHE_VERSION, order, bool(derived))
+
+
+def cache_path(order, derived):
+    """Path of a kernel's cached source in the GIFT cache directory, or None"""
+    directory = e8.cache_dir()
+    if not directory:
+        return None
+    return os.path.join(directory, 'symbolic', f'{cache_key(order, derived)[:24]}.json')
+
+
+def _load(path):
+    """Cached kernel record, or None if the file is missing or unusable"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return record if {'source', 'jacobian', 'hessian'} <= set(record) else None
+
+
+def _save(path, record):
+    """Write a kernel record atomically; an unwritable cache is silently skipped"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+class Kernel:
+    """
+    Compiled observables and derivatives of one order over the variables.
+
+    compile_seconds is the time spent differentiating and generating code,
+    zero when the source came from the disk cache.
+    """
+
+    def __init__(self, source, jacobian, hessian, order, derived, compile_seconds=0.0):
+        namespace = dict(vars(np))
+        exec(compile(source, '<gift.symbolic kernel>', 'exec'), namespace)
+        self.function = namespace['_lambdifygenerated']
+        self.source = source
+        self.jacobian_index = np.array(jacobian, dtype=np.intp).reshape(-1, 2)
+        self.hessian_index = np.array(hessian, dtype=np.intp).reshape(-1, 3)
+        self.order = order
+        self.derived = derived
+        self.variables = variables(derived)
+        self.compile_seconds = compile_seconds
+
+    def __repr__(self):
+        return (f"Kernel(order={self.order}, derived={self.derived}, "
+                f"{len(self.jacobian_index)} Jacobian and "
+                f"{len(self.hessian_index)} Hessian entries)")
+
+    def __call__(self, point):
+        """
+        Derivatives at a point: a mapping of every variable to a float array
+        (broadcast-compatible shapes)
+        """
+        arrays = [np.asarray(point[name], dtype=float) for name in self.variables]
+        shape = np.broadcast_shapes(*(array.shape for array in arrays))
+        n_observables, n_variables = len(OBSERVABLES), len(self.variables)
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            outputs = self.function(*arrays)
+
+        values = np.empty(shape + (n_observables,))
+        for i in range(n_observables):
+            values[..., i] = outputs[i]
+        jacobian = np.zeros(shape + (n_observables, n_variables))
+        offset = n_observables
+        for n, (i, j) in enumerate(self.jacobian_index):
+            jacobian[..., i, j] = outputs[offset + n]
+        hessian = None
+        if self.order >= 2:
+            hessian = np.zeros(shape + (n_observables, n_variables, n_variables))
+            offset += len(self.jacobian_index)
+            for n, (i, j, k) in enumerate(self.hessian_index):
+                hessian[..., i, j, k] = hessian[..., i, k, j] = outputs[offset + n]
+        return Derivatives(point, self.variables, values, jacobian, hessian)
+
+
+@functools.lru_cache(maxsize=None)
+def kernel(order=1, derived=False):
+    """
+    Kernel of observables with Jacobian (order=1) or Jacobian and Hessian
+    (order=2), compiled once per process and loaded from the disk cache
+    when possible.
+    """
+    if order not in (1, 2):
+        raise ValueError(f"order must be 1 or 2, got {order!r}")
+    path = cache_path(order, derived)
+    record = _load(path) if path else None
+    if record is not None:
+        return Kernel(record['source'], record['jacobian'], record['hessian'], order, derived)
+
+    start = time.perf_counter()
+    source, jacobian, hessian = _compile_source(order, derived)
+    elapsed = time.perf_counter() - start
+    if path:
+        _save(path, {'source': source, 'jacobian': jacobian, 'hessian': hessian})
+    return Kernel(source, jacobian, hessian, order, derived, elapsed)
+
+
+def clear_cache():
+    """Drop the in-process kernels and delete the cached kernel sources"""
+    kernel.cache_clear()
+    directory = e8.cache_dir()
+    if not directory:
+        return
+    directory = os.path.join(directory, 'symbolic')
+    if os.path.isdir(directory):
+        for name in os.listdir(directory):
+            if name.endswith('.json'):
+                os.remove(os.path.join(directory, name))
+
+
+# ============================================================================
+# Evaluation
+# ============================================================================
+
+class Derivatives:
+    """
+    Observables and their derivatives over a grid of points.
+
+    values has shape (*grid, 18), jacobian (*grid, 18, n) and hessian
+    (*grid, 18, n, n) or None, in OBSERVABLES and `variables` order.
+    """
+
+    def __init__(self, point, variables, values, jacobian, hessian=None):
+        self.point = point
+        self.observables = OBSERVABLES
+        self.variables = variables
+        self.values = values
+        self.jacobian = jacobian
+        self.hessian = hessian
+
+    def index(self, observable):
+        return self.observables.index(observable)
+
+    def elasticities(self):
+        """
+        Relative sensitivities ∂ln(observable)/∂ln(variable) = J·x/O, shape
+        (*grid, 18, n): the % change of each observable per % change of
+        each variable (nan or inf where an observable vanishes)
+        """
+        x = np.stack(np.broadcast_arrays(
+            *(np.asarray(self.point[name], dtype=float) for name in self.variables)), axis=-1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self.jacobian * x[..., None, :] / self.values[..., :, None]
+
+
+def point(params=None, derived=False):
+    """
+    Values of every variable of a kernel, filling in reference values; with
+    derived=False, unspecified beta0, xi and delta follow from the given
+    independent parameters, as in evaluate()
+    """
+    params = dict(params or {})
+    names = variables(derived)
+    unknown = set(params) - set(names)
+    if unknown:
+        hint = " (derived parameters are not variables with derived=True)" if derived else ""
+        raise ValueError(f"Unknown variables {sorted(unknown)}, expected some of {names}{hint}")
+
+    values = parameters({name: params[name] for name in PARAMETERS if name in params})
+    values.update({name: np.asarray(params.get(name, value), dtype=float)
+                   for name, value in TOPOLOGY.items()})
+    return {name: values[name] for name in names}
+
+
+def derivatives(params=None, order=1, derived=False):
+    """
+    Observables with their Jacobian (and Hessian with order=2) at every
+    point of a grid, in one pass of the compiled kernel.
+
+    Args:
+        params: Mapping of variable name to scalar or array; missing
+            variables take their reference values
+        order: 1 for the Jacobian, 2 for the Jacobian and Hessian
+        derived: Differentiate along beta0 = π/rank_E8, xi = (Weyl_factor/p2)·beta0
+            and delta = 2π/Weyl_factor² instead of treating them as variables
+
+    Returns:
+        Derivatives
+    """
+    return kernel(order, bool(derived))(point(params, derived))
+
+
+# ============================================================================
+# Main Execution
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--derived', action='store_true',
+                        help="total derivatives along the derived-parameter relations")
+    parser.add_argument('--order', type=int, choices=(1, 2), default=1,
+                        help="1: Jacobian, 2: Jacobian and Hessian (default: 1)")
+    for name in INDEPENDENT_PARAMETERS:
+        parser.add_argument(f'--{name}', type=float, help=f"value of {name} (default: reference)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    compiled = kernel(args.order, args.derived)
+    ready = time.perf_counter() - start
+    params = {name: getattr(args, name) for name in INDEPENDENT_PARAMETERS
+              if getattr(args, name) is not None}
+    result = compiled(point(params, args.derived))
+
+    print("="*100)
+    print("ELASTICITIES ∂ln(observable)/∂ln(variable)"
+          + (" (total, derived parameters substituted)" if args.derived else ""))
+    print("="*100)
+    print(f"Kernel: {compiled!r}")
+    origin = (f"compiled in {compiled.compile_seconds:.2f} s" if compiled.compile_seconds
+              else "loaded from cache")
+    print(f"        {origin}, ready in {ready * 1e3:.1f} ms\n")
+    width = 7
+    print(f"{'observable':<15}" + ''.join(f"{name[:width - 1]:>{width}}"
+                                          for name in result.variables))
+    print("-"*100)
+    elasticities = result.elasticities()
+    for i, name in enumerate(OBSERVABLES):
+        cells = ''.join(f"{'·':>{width}}" if value == 0 else f"{value:>{width}.3f}"
+                        for value in elasticities[i])
+        print(f"{name:<15}{cells}")
+    if result.hessian is not None:
+        curvature = np.abs(result.hessian).reshape(len(OBSERVABLES), -1).max(axis=1)
+        print("\nLargest |Hessian entry| per observable:")
+        for name, value in zip(OBSERVABLES, curvature):
+            print(f"  {name:<15}{value:.4g}")
+    print("="*100)
+
+
+if __name__ == "__main__":
+    main()
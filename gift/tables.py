@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Validation Tables
+====================================
+
+pandas comparison tables of GIFT predictions against experiment, as in the
+validation notebook. Imports pandas, so it is loaded only on first use of
+compare_with_experiment (directly or through the gift package).
+
+Usage:
+    from gift import GIFTObservables, compare_with_experiment
+    df = compare_with_experiment(GIFTObservables().compute_all(), verbose=True)
+"""
+
+import numpy as np
+import pandas as pd
+
+from .experimental import ExperimentalData
+
+
+def compare_with_experiment(observables, verbose=False):
+    """
+    Generate comprehensive comparison table.
+
+    Format follows the requested structure:
+    | observables | experimental value | GIFT value | deviation |
+
+    The table and its statistical summary are printed only with verbose=True.
+    """
+    results = []
+
+    for obs_name, pred_value in observables.items():
+        if obs_name in ExperimentalData.data:
+            exp_data = ExperimentalData.data[obs_name]
+            exp_value = exp_data['exp']
+            exp_error = exp_data['err']
+            unit = exp_data['unit']
+
+            # Calculate deviation
+            if exp_value != 0:
+                deviation = abs((pred_value - exp_value) / exp_value) * 100
+            else:
+                deviation = 0.0
+
+            results.append({
+                'observables': obs_name,
+                'experimental_value': f"{exp_value} ± {exp_error}",
+                'GIFT_value': f"{pred_value:.5f}" if isinstance(pred_value, float) else str(pred_value),
+                'deviation': f"{deviation:.3f}%",
+                'unit': unit
+            })
+
+    df = pd.DataFrame(results)
+    if verbose:
+        print_comparison(df)
+    return df
+
+
+def print_comparison(df):
+    """Print a compare_with_experiment() table with its statistical summary"""
+    print("\n" + "="*70)
+    print("EXPERIMENTAL VALIDATION")
+    print("="*70)
+
+    print("\n" + "-"*70)
+    print("| observables | experimental value | GIFT value | deviation |")
+    print("|" + "-"*12 + "|" + "-"*19 + "|" + "-"*11 + "|" + "-"*10 + "|")
+
+    for _, row in df.iterrows():
+        print(f"| {row['observables']:<11} | {row['experimental_value']:<18} | "
+              f"{row['GIFT_value']:<10} | {row['deviation']:<9} |")
+
+    print("-"*70)
+
+    # Statistical summary
+    deviations = [float(d.strip('%')) for d in df['deviation']]
+    print(f"\nSTATISTICAL SUMMARY:")
+    print(f"  Number of observables: {len(deviations)}")
+    print(f"  Mean deviation: {np.mean(deviations):.3f}%")
+    print(f"  Median deviation: {np.median(deviations):.3f}%")
+    print(f"  Min deviation: {np.min(deviations):.3f}%")
+    print(f"  Max deviation: {np.max(deviations):.3f}%")
+    print(f"  All within 1%: {sum(d < 1.0 for d in deviations)}/{len(deviations)}")
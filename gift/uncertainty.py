@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Monte Carlo Uncertainty Propagation
+======================================================
+
+Pseudo-experiments for the comparison with experiment. Every sample draws
+the experimental value of each observable from N(exp, err), then computes
+
+- the pull of each prediction, (prediction - sample) / err
+- the chi-square over all observables, Σ pull²
+
+The same normal deviates also give the chi-square expected if the
+predictions were exact (samples drawn around the predictions). The
+goodness-of-fit p-value of the observed chi-square follows from it.
+
+Samples are generated in fixed-size chunks, and each chunk is reduced
+straight away to mergeable statistics: moments and fixed-bin histograms.
+Memory is therefore bounded by the chunk size whatever the sample count.
+Chunks run serially or on a process pool. Each chunk's random stream
+comes from (seed, chunk index) alone, and chunk statistics are merged in
+chunk order. Results are therefore bit-identical for any number of
+worker processes; they depend only on the seed and the chunk size.
+
+Observables with zero uncertainty (N_generations) are exact integers, so
+they are left out of the pulls and the chi-square.
+
+Usage:
+    from gift.uncertainty import propagate
+    result = propagate(10**8, jobs=8, seed=42)
+    result.p_value, result.pull_mean
+    result.print_summary()
+
+    python -m gift.uncertainty --samples 1e8 --jobs 8
+"""
+
+import os
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import experimental
+from .observables import OBSERVABLES, evaluate
+
+DEFAULT_CHUNK_SIZE = 2**17
+
+# Histogram layout: pulls within ±PULL_HALF_WIDTH of the observed pull,
+# chi-squares within ±CHI2_HALF_WIDTH standard deviations of their mean
+PULL_HALF_WIDTH = 8.0
+PULL_BINS = 320
+CHI2_HALF_WIDTH = 8.0
+CHI2_BINS = 400
+
+
+class MonteCarloResult:
+    """
+    Pull and chi-square statistics of a set of pseudo-experiments.
+
+    Moments are accumulated relative to the observed pulls (and to the
+    expected chi-square), which keeps variances exact even for pulls of
+    thousands of σ. Histograms have one underflow and one overflow bin.
+    Results built from the same setup merge by addition.
+    """
+
+    def __init__(self, names, predictions, values, errors):
+        self.names = tuple(names)
+        self.predictions = np.asarray(predictions, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+        self.errors = np.asarray(errors, dtype=float)
+        k = len(self.names)
+
+        self.observed_pulls = (self.predictions - self.values) / self.errors
+        self.chi2_observed = float(np.sum(self.observed_pulls**2))
+
+        # Mean and spread of a noncentral chi-square with k dof
+        self.chi2_center = self.chi2_observed + k
+        chi2_spread = np.sqrt(2 * k + 4 * self.chi2_observed)
+        null_spread = np.sqrt(2 * k)
+
+        self.pull_edges = (self.observed_pulls[:, None]
+                           + np.linspace(-PULL_HALF_WIDTH, PULL_HALF_WIDTH, PULL_BINS + 1))
+        self.chi2_edges = np.linspace(max(0.0, self.chi2_center - CHI2_HALF_WIDTH * chi2_spread),
+                                      self.chi2_center + CHI2_HALF_WIDTH * chi2_spread,
+                                      CHI2_BINS + 1)
+        self.null_edges = np.linspace(0.0, k + CHI2_HALF_WIDTH * null_spread, CHI2_BINS + 1)
+
+        self.n_samples = 0
+        self.pull_shift_sum = np.zeros(k)
+        self.pull_shift_sum2 = np.zeros(k)
+        self.pull_counts = np.zeros((k, PULL_BINS + 2), dtype=np.int64)
+        self.chi2_shift_sum = 0.0
+        self.chi2_shift_sum2 = 0.0
+        self.chi2_counts = np.zeros(CHI2_BINS + 2, dtype=np.int64)
+        self.null_counts = np.zeros(CHI2_BINS + 2, dtype=np.int64)
+        self.null_exceed = 0
+
+    def empty_copy(self):
+        """A result with the same setup and no samples"""
+        return MonteCarloResult(self.names, self.predictions, self.values, self.errors)
+
+    # ------------------------------------------------------------------------
+    # Accumulation
+    # ------------------------------------------------------------------------
+
+    def add_samples(self, z):
+        """
+        Add pseudo-experiments from standard normal deviates z, shape
+        (samples, observables): sample = value + error·z.
+        """
+        # pulls = (prediction - sample) / error, built in place
+        pulls = self.values + self.errors * z
+        np.subtract(self.predictions, pulls, out=pulls)
+        pulls /= self.errors
+
+        chi2 = np.einsum('ij,ij->i', pulls, pulls)
+        chi2_shifted = chi2 - self.chi2_center
+        self.chi2_shift_sum += chi2_shifted.sum()
+        self.chi2_shift_sum2 += chi2_shifted @ chi2_shifted
+        self.chi2_counts += _histogram(chi2, self.chi2_edges[0], self.chi2_edges[-1], CHI2_BINS)
+
+        shifted = pulls
+        shifted -= self.observed_pulls
+        self.n_samples += len(z)
+        self.pull_shift_sum += shifted.sum(axis=0)
+        self.pull_shift_sum2 += np.einsum('ij,ij->j', shifted, shifted)
+        self.pull_counts += _histogram_rows(shifted, -PULL_HALF_WIDTH, PULL_HALF_WIDTH, PULL_BINS)
+
+        # Pseudo-experiments around exact predictions: pulls are -z
+        null = np.einsum('ij,ij->i', z, z)
+        self.null_counts += _histogram(null, self.null_edges[0], self.null_edges[-1], CHI2_BINS)
+        self.null_exceed += int(np.count_nonzero(null >= self.chi2_observed))
+
+    def merge(self, other):
+        """Add the samples of a result built from the same setup"""
+        self.n_samples += other.n_samples
+        self.pull_shift_sum += other.pull_shift_sum
+        self.pull_shift_sum2 += other.pull_shift_sum2
+        self.pull_counts += other.pull_counts
+        self.chi2_shift_sum += other.chi2_shift_sum
+        self.chi2_shift_sum2 += other.chi2_shift_sum2
+        self.chi2_counts += other.chi2_counts
+        self.null_counts += other.null_counts
+        self.null_exceed += other.null_exceed
+        return self
+
+    # ------------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------------
+
+    @property
+    def pull_mean(self):
+        return self.observed_pulls + self.pull_shift_sum / self.n_samples
+
+    @property
+    def pull_std(self):
+        mean_shift = self.pull_shift_sum / self.n_samples
+        return np.sqrt(np.maximum(self.pull_shift_sum2 / self.n_samples - mean_shift**2, 0))
+
+    @property
+    def chi2_mean(self):
+        return self.chi2_center + self.chi2_shift_sum / self.n_samples
+
+    @property
+    def chi2_std(self):
+        mean_shift = self.chi2_shift_sum / self.n_samples
+        return float(np.sqrt(max(self.chi2_shift_sum2 / self.n_samples - mean_shift**2, 0)))
+
+    @property
+    def p_value(self):
+        """Fraction of exact-prediction pseudo-experiments with χ² ≥ observed"""
+        return self.null_exceed / self.n_samples
+
+    def pull_histogram(self, name):
+        """(edges, counts) of one observable's pulls, without under/overflow"""
+        i = self.names.index(name)
+        return self.pull_edges[i], self.pull_counts[i, 1:-1]
+
+    def print_summary(self):
+        """Display pulls and chi-square against experiment"""
+        print("="*78)
+        print(f"MONTE CARLO UNCERTAINTY PROPAGATION ({self.n_samples:,} samples)")
+        print("="*78)
+        print(f"| {'observable':<13} | {'experimental value':<20} | {'GIFT':>11} | "
+              f"{'pull':>10} | {'MC pull σ':>9} |")
+        print("|" + "-"*15 + "|" + "-"*22 + "|" + "-"*13 + "|" + "-"*12 + "|" + "-"*11 + "|")
+        for i, name in enumerate(self.names):
+            measured = f"{self.values[i]:g} ± {self.errors[i]:g}"
+            print(f"| {name:<13} | {measured:<20} | {self.predictions[i]:>11.5g} | "
+                  f"{self.pull_mean[i]:>10.3g} | {self.pull_std[i]:>9.4f} |")
+        print("-"*78)
+        print(f"  χ² observed: {self.chi2_observed:.6g} ({len(self.names)} observables)")
+        print(f"  χ² pseudo-experiments: {self.chi2_mean:.6g} ± {self.chi2_std:.4g}")
+        print(f"  p-value (exact predictions): {self.p_value:.4g}")
+
+
+def _bin_index(x, low, high, bins):
+    """Bin of each value, 0 for underflow and bins + 1 for overflow"""
+    # Offset by one bin so truncation towards zero acts as floor()
+    index = x - low
+    index *= bins / (high - low)
+    index += 1
+    np.clip(index, 0, bins + 1, out=index)
+    return index.astype(np.intp)
+
+
+def _histogram(x, low, high, bins):
+    """Fixed-bin counts of x with underflow and overflow bins, (bins + 2,)"""
+    return np.bincount(_bin_index(x, low, high, bins), minlength=bins + 2)
+
+
+def _histogram_rows(x, low, high, bins):
+    """Per-column fixed-bin counts of x (samples, k), shape (k, bins + 2)"""
+    k = x.shape[1]
+    index = _bin_index(x, low, high, bins)
+    index += np.arange(k) * (bins + 2)
+    return np.bincount(index.ravel(), minlength=k * (bins + 2)).reshape(k, bins + 2)
+
+
+# ============================================================================
+# Engine
+# ============================================================================
+
+def setup(predictions=None, data=None, names=None):
+    """
+    Empty MonteCarloResult for the observables with nonzero uncertainty.
+
+    Args:
+        predictions: Mapping of observable to predicted value (default:
+            evaluate() at the reference parameters)
+        data: Experimental data in experimental.DATA format
+        names: Observables to include (default: all with err > 0)
+    """
+    data = experimental.DATA if data is None else data
+    if predictions is None:
+        predictions = {name: float(value) for name, value in evaluate().items()}
+    if names is None:
+        names = [name for name in OBSERVABLES
+                 if name in data and name in predictions and data[name]['err'] > 0]
+
+    return MonteCarloResult(names, [predictions[name] for name in names],
+                            experimental.values(names, data),
+                            experimental.errors(names, data))
+
+
+def chunk_sizes(n_samples, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Sizes of the fixed chunks covering n_samples (the last may be short)"""
+    full, rest = divmod(n_samples, chunk_size)
+    return [chunk_size] * full + ([rest] if rest else [])
+
+
+def simulate_chunk(template, seed, index, size):
+    """Statistics of one chunk, from the random stream of (seed, index)"""
+    rng = np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed, spawn_key=(index,))))
+    result = template.empty_copy()
+    result.add_samples(rng.standard_normal((size, len(template.names))))
+    return result
+
+
+def _simulate_task(task):
+    return simulate_chunk(*task)
+
+
+def iter_chunks(n_samples, template=None, seed=0, jobs=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield the statistics of every chunk, in chunk order.
+
+    With jobs > 1, chunks are simulated on a process pool; only their
+    small statistics objects travel back, so memory stays bounded.
+    """
+    template = setup() if template is None else template
+    tasks = ((template, seed, index, size)
+             for index, size in enumerate(chunk_sizes(n_samples, chunk_size)))
+
+    if jobs <= 1:
+        for task in tasks:
+            yield _simulate_task(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(_simulate_task, tasks)
+
+
+def propagate(n_samples, predictions=None, data=None, seed=0, jobs=1,
+              chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Run n_samples pseudo-experiments and return the merged MonteCarloResult.
+
+    The result depends only on the inputs, seed and chunk_size, not on jobs.
+    """
+    template = setup(predictions, data)
+    result = template.empty_copy()
+    for chunk in iter_chunks(n_samples, template, seed, jobs, chunk_size):
+        result.merge(chunk)
+    return result
+
+
+# ============================================================================
+# Main Execution
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo pulls and chi-square "
+                                                 "of the GIFT predictions")
+    parser.add_argument('-n', '--samples', type=float, default=1e6,
+                        help="number of pseudo-experiments (default: 1e6)")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help="worker processes (default: 1; 0: one per CPU core)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"samples per chunk (default: {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count()
+
+    start = time.perf_counter()
+    result = propagate(int(args.samples), seed=args.seed, jobs=jobs,
+                       chunk_size=args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    result.print_summary()
+    print(f"  {result.n_samples / elapsed:.3e} samples/s with {jobs} worker(s)")
+    print("="*78)
+
+
+if __name__ == "__main__":
+    main()
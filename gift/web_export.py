@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+GIFT Framework - Precomputed Data for the HTML Pages
+======================================================
+
+Exports what interactive_explorer.html, geometry_visualizer.html and
+experimental_tracker.html would otherwise recompute in every visitor's
+browser, as one binary buffer and a JSON index:
+
+- e8_roots: the 240 roots of E₈, float32 (240, 8)
+- projection_<name>: the standard 2D/3D projections of gift.e8, float32
+- rotation_maps: per-frame 3×8 maps (coordinate3d basis times the frame's
+  rotation of R⁸, as in the root animation), float32 (frames, 3, 8)
+- observables: every observable on the grid of the explorer's sliders,
+  as uint16 codes per column, (p2, rank_E8, Weyl_factor, observable) in
+  C order. Columns taking few values (all but those depending on p2) index
+  an exact palette; the others are linear, value = offset + q·scale, with
+  their largest error in the index. q = 65535 marks non-finite values
+
+Every array is little-endian and starts at a 16-byte aligned offset of
+gift_data.bin, so a page builds typed-array views on the fetched
+ArrayBuffer without copying:
+
+    new Float32Array(buffer, entry.offset, entry.length)
+
+index.json also carries the experimental data and the observables at the
+reference parameters in full precision.
+
+Usage:
+    python -m gift.web_export                   # writes data/index.json, data/gift_data.bin
+    python -m gift.web_export --output site/data --frames 240 --p2 1.8:2.2:401
+
+    from gift.web_export import export
+    index = export('data')
+"""
+
+import os
+import sys
+import json
+import argparse
+
+import numpy as np
+
+from . import e8, experimental
+from .observables import OBSERVABLES, evaluate
+
+OUTPUT_DIR = 'data'
+BUFFER_NAME = 'gift_data.bin'
+INDEX_NAME = 'index.json'
+FORMAT_VERSION = 1
+ALIGNMENT = 16
+
+# Root animation of generate_animations.py (E8_ROTATION, 120 frames)
+ROTATION = {'planes': ((0, 1),), 'turns': 1}
+DEFAULT_FRAMES = 120
+
+# Slider ranges of interactive_explorer.html
+GRID = {
+    'p2': np.linspace(1.8, 2.2, 401),
+    'rank_E8': np.array([7.0, 8.0, 9.0]),
+    'Weyl_factor': np.array([4.0, 5.0, 6.0]),
+}
+
+QUANTIZED_LEVELS = 2**16 - 1            # q = 65535 marks nan / inf
+PALETTE_LIMIT = 256
+
+# numpy dtype -> JavaScript typed array
+TYPED_ARRAYS = {'<f4': 'Float32Array', '<u2': 'Uint16Array'}
+
+
+# ============================================================================
+# Arrays
+# ============================================================================
+
+def rotation_maps(n_frames=DEFAULT_FRAMES, planes=ROTATION['planes'], turns=ROTATION['turns']):
+    """
+    Per-frame projections R⁸ -> R³ of the root animation, shape (frames, 3, 8):
+    frame f shows roots @ maps[f].T.
+    """
+    return e8.projection_basis('coordinate3d') @ e8.rotation_stack(n_frames, planes, turns)
+
+
+def quantize(values):
+    """
+    uint16 codes of a column and its column entry. Columns with at most
+    PALETTE_LIMIT distinct values index a palette of them, exactly
+    (value = palette[q]); others are linear (value = offset + q·scale).
+    Non-finite values get the code QUANTIZED_LEVELS either way.
+    """
+    values = np.asarray(values, dtype=float)
+    finite = np.isfinite(values)
+    codes = np.full(values.shape, QUANTIZED_LEVELS, dtype='<u2')
+    palette, inverse = np.unique(values[finite], return_inverse=True)
+    if len(palette) <= PALETTE_LIMIT:
+        codes[finite] = inverse
+        return codes, {'encoding': 'palette', 'palette': palette.tolist(), 'max_error': 0.0}
+
+    low, high = palette[0], palette[-1]
+    scale = (high - low) / (QUANTIZED_LEVELS - 1)
+    codes[finite] = np.rint((values[finite] - low) / scale)
+    error = np.abs(low + codes[finite] * scale - values[finite]).max()
+    return codes, {'encoding': 'linear', 'offset': float(low), 'scale': float(scale),
+                   'max_error': float(error)}
+
+
+def observable_table(grid=None):
+    """
+    Observables on the cartesian grid of axes ({parameter: 1-D values}),
+    quantized: (codes of shape grid shape + (observables,), column entries)
+    """
+    grid = GRID if grid is None else grid
+    axes = list(grid)
+    mesh = np.meshgrid(*(np.asarray(grid[name], dtype=float) for name in axes), indexing='ij')
+    results = evaluate(dict(zip(axes, mesh)))
+
+    codes = np.empty(mesh[0].shape + (len(OBSERVABLES),), dtype='<u2')
+    columns = []
+    for i, name in enumerate(OBSERVABLES):
+        codes[..., i], column = quantize(results[name])
+        columns.append({'name': name, **column})
+    return codes, columns
+
+
+def arrays(n_frames=DEFAULT_FRAMES, grid=None):
+    """The exported arrays by name, in buffer order, and the observable columns"""
+    table, columns = observable_table(grid)
+    exported = {'e8_roots': e8.roots()}
+    for name in e8.PROJECTIONS:
+        exported[f'projection_{name}'] = e8.projection(name)
+    exported['rotation_maps'] = rotation_maps(n_frames)
+    exported['observables'] = table
+    return {name: np.ascontiguousarray(values, dtype='<u2' if values.dtype == np.uint16 else '<f4')
+            for name, values in exported.items()}, columns
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+def pack(exported):
+    """
+    One little-endian buffer holding every array at a 16-byte aligned
+    offset, and the index entries locating them.
+    """
+    entries = {}
+    chunks = []
+    offset = 0
+    for name, values in exported.items():
+        padding = -offset % ALIGNMENT
+        chunks.append(b'\0' * padding)
+        offset += padding
+        dtype = values.dtype.str
+        entries[name] = {
+            'type': TYPED_ARRAYS[dtype],
+            'shape': list(values.shape),
+            'offset': offset,
+            'length': int(values.size),
+            'byteLength': int(values.nbytes),
+        }
+        chunks.append(values.tobytes())
+        offset += values.nbytes
+    return b''.join(chunks), entries
+
+
+def export(directory=OUTPUT_DIR, n_frames=DEFAULT_FRAMES, grid=None):
+    """
+    Write index.json and gift_data.bin to directory and return the index.
+    """
+    grid = GRID if grid is None else grid
+    exported, columns = arrays(n_frames, grid)
+    buffer, entries = pack(exported)
+    reference = evaluate()
+
+    index = {
+        'version': FORMAT_VERSION,
+        'endianness': 'little',
+        'buffer': BUFFER_NAME,
+        'byteLength': len(buffer),
+        'arrays': entries,
+        'grid': {
+            'axes': [{'name': name, 'values': np.asarray(values, dtype=float).tolist()}
+                     for name, values in grid.items()],
+            'columns': columns,
+            'missing': QUANTIZED_LEVELS,
+        },
+        'rotation': {'frames': n_frames, 'planes': [list(plane) for plane in ROTATION['planes']],
+                     'turns': ROTATION['turns']},
+        'reference': {name: float(reference[name]) for name in OBSERVABLES},
+        'experimental': {name: experimental.DATA[name] for name in OBSERVABLES
+                         if name in experimental.DATA},
+    }
+
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, BUFFER_NAME), 'wb') as file:
+        file.write(buffer)
+    with open(os.path.join(directory, INDEX_NAME), 'w', encoding='utf-8') as file:
+        json.dump(index, file, separators=(',', ':'))
+    return index
+
+
+def load(directory=OUTPUT_DIR):
+    """
+    Read an export back as the pages do: (index, {name: array view}), with
+    the observable table dequantized to float64 under the key 'observables'.
+    """
+    with open(os.path.join(directory, INDEX_NAME), encoding='utf-8') as file:
+        index = json.load(file)
+    with open(os.path.join(directory, index['buffer']), 'rb') as file:
+        buffer = file.read()
+    dtypes = {typed: dtype for dtype, typed in TYPED_ARRAYS.items()}
+    views = {name: np.frombuffer(buffer, dtypes[entry['type']], entry['length'],
+                                 entry['offset']).reshape(entry['shape'])
+             for name, entry in index['arrays'].items()}
+
+    codes = views['observables']
+    table = np.full(codes.shape, np.nan)
+    for i, column in enumerate(index['grid']['columns']):
+        q = codes[..., i]
+        valid = q != index['grid']['missing']
+        if column['encoding'] == 'palette':
+            table[..., i][valid] = np.asarray(column['palette'])[q[valid]]
+        else:
+            table[..., i][valid] = column['offset'] + q[valid] * column['scale']
+    views['observables'] = table
+    return index, views
+
+
+def parse_axis(spec):
+    """'start:stop:count' (linspace) or 'v1,v2,...'"""
+    if ':' in spec:
+        start, stop, count = spec.split(':')
+        return np.linspace(float(start), float(stop), int(count))
+    return np.array([float(value) for value in spec.split(',')])
+
+
+# ============================================================================
+# Main Execution
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--output', default=OUTPUT_DIR,
+                        help=f"output directory, next to the pages (default: {OUTPUT_DIR})")
+    parser.add_argument('--frames', type=int, default=DEFAULT_FRAMES,
+                        help=f"frames of the root rotation (default: {DEFAULT_FRAMES})")
+    for name in GRID:
+        parser.add_argument(f'--{name}', metavar='SPEC',
+                            help=f"{name} grid, start:stop:count or v1,v2,... "
+                                 "(default: the slider's)")
+    args = parser.parse_args(argv)
+
+    grid = {name: parse_axis(getattr(args, name)) if getattr(args, name) else values
+            for name, values in GRID.items()}
+    index = export(args.output, args.frames, grid)
+
+    print("="*72)
+    print("HTML DATA EXPORT")
+    print("="*72)
+    for name, entry in index['arrays'].items():
+        shape = '×'.join(map(str, entry['shape']))
+        print(f"{name:<26}{entry['type']:<14}{shape:>16}{entry['byteLength']:>12,} B")
+    print("-"*72)
+    linear = [column for column in index['grid']['columns'] if column['encoding'] == 'linear']
+    print(f"{BUFFER_NAME}: {index['byteLength']:,} B, "
+          f"{INDEX_NAME}: {os.path.getsize(os.path.join(args.output, INDEX_NAME)):,} B")
+    print(f"Exact palette columns: {len(index['grid']['columns']) - len(linear)}, linear: "
+          + ', '.join(f"{column['name']} ±{column['max_error']:.2g}" for column in linear))
+    print(f"Written to {os.path.abspath(args.output)}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+/*
+ * GIFT Framework - Precomputed Data Loader
+ *
+ * Loads data/index.json and data/gift_data.bin, written by
+ * `python -m gift.web_export`, as typed-array views on the fetched buffer
+ * (no parsing, no copy). load() resolves to null when the files cannot be
+ * fetched (e.g. a page opened from file://) or on a big-endian platform,
+ * and the pages then compute in JavaScript as before.
+ *
+ * Usage:
+ *     GiftData.load().then(data => {
+ *         const obs = data && GiftData.observables(data, {p2: 2, rank_E8: 8, Weyl_factor: 5});
+ *     });
+ */
+const GiftData = (function () {
+    const TYPES = {Float32Array: Float32Array, Uint16Array: Uint16Array};
+    const LITTLE_ENDIAN = new Uint8Array(new Uint16Array([1]).buffer)[0] === 1;
+
+    async function load(base = 'data/') {
+        if (!LITTLE_ENDIAN || typeof fetch === 'undefined') return null;
+        const start = performance.now();
+        try {
+            const indexResponse = await fetch(base + 'index.json');
+            if (!indexResponse.ok) return null;
+            const index = await indexResponse.json();
+            const bufferResponse = await fetch(base + index.buffer);
+            if (!bufferResponse.ok) return null;
+            const buffer = await bufferResponse.arrayBuffer();
+
+            const arrays = {};
+            for (const [name, entry] of Object.entries(index.arrays)) {
+                arrays[name] = new TYPES[entry.type](buffer, entry.offset, entry.length);
+            }
+            const milliseconds = performance.now() - start;
+            console.info(`GIFT data: ${(buffer.byteLength / 1024).toFixed(1)} KiB `
+                         + `in ${milliseconds.toFixed(1)} ms`);
+            return {index, arrays, bytes: buffer.byteLength, milliseconds};
+        } catch (error) {
+            return null;
+        }
+    }
+
+    // Observables at parameters on the exported grid, null off the grid
+    function observables(data, params) {
+        const grid = data.index.grid;
+        let flat = 0;
+        for (const axis of grid.axes) {
+            const values = axis.values;
+            const value = params[axis.name];
+            const step = values.length > 1 ? values[1] - values[0] : 1;
+            const i = Math.round((value - values[0]) / step);
+            if (!(i >= 0 && i < values.length)
+                || Math.abs(values[i] - value) > 1e-9 * Math.max(1, Math.abs(value))) {
+                return null;
+            }
+            flat = flat * values.length + i;
+        }
+
+        const codes = data.arrays.observables;
+        const base = flat * grid.columns.length;
+        const result = {};
+        grid.columns.forEach((column, j) => {
+            const q = codes[base + j];
+            result[column.name] = q === grid.missing ? NaN
+                : column.encoding === 'palette' ? column.palette[q]
+                : column.offset + q * column.scale;
+        });
+        return result;
+    }
+
+    // Rows of a (n, k) array as plain arrays, e.g. the 240 roots
+    function rows(data, name) {
+        const array = data.arrays[name];
+        const [n, k] = data.index.arrays[name].shape;
+        return Array.from({length: n}, (_, i) => Array.from(array.subarray(i * k, (i + 1) * k)));
+    }
+
+    // x, y, z of every root at one frame of the exported rotation
+    function rotationFrame(data, frame) {
+        const roots = data.arrays.e8_roots;
+        const maps = data.arrays.rotation_maps;
+        const frames = data.index.rotation.frames;
+        const map = maps.subarray((frame % frames) * 24, (frame % frames + 1) * 24);
+        const n = roots.length / 8;
+        const coords = [new Float32Array(n), new Float32Array(n), new Float32Array(n)];
+        for (let r = 0; r < n; r++) {
+            for (let k = 0; k < 3; k++) {
+                let sum = 0;
+                for (let d = 0; d < 8; d++) sum += map[k * 8 + d] * roots[r * 8 + d];
+                coords[k][r] = sum;
+            }
+        }
+        return coords;
+    }
+
+    return {load, observables, rows, rotationFrame};
+})();
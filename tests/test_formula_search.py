@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""Regression tests for gift.formula_search"""
+
+from gift import experimental, formula_search
+
+
+def test_overlapping_windows_depth_3():
+    # At 5%, the Q_Koide (0.667) and Omega_DE (0.689) windows overlap, and
+    # depth 3 drops the commutative duplicates of same-level pairs
+    result, _, _ = formula_search.search(depth=3, tolerance=0.05)
+
+    # Moving Omega_DE away must leave the Q_Koide matches unchanged
+    data = dict(experimental.DATA)
+    data['Omega_DE'] = {**data['Omega_DE'], 'exp': 1e9}
+    alone, _, _ = formula_search.search(depth=3, tolerance=0.05, data=data)
+
+    assert result.hits('Q_Koide') == alone.hits('Q_Koide') > 0
+    assert (result.keys(result.names.index('Q_Koide'))
+            == alone.keys(alone.names.index('Q_Koide'))).all()
+    assert result.hits('Omega_DE') > 0
+
+
+def test_checkpoint_not_resumed_with_other_data(tmp_path):
+    checkpoint = str(tmp_path / 'search.npz')
+    formula_search.search(depth=2, checkpoint=checkpoint)
+
+    data = dict(experimental.DATA)
+    data['Q_Koide'] = {**data['Q_Koide'], 'exp': 1e9}
+    resumed, _, _ = formula_search.search(depth=2, checkpoint=checkpoint, data=data)
+    fresh, _, _ = formula_search.search(depth=2, data=data)
+
+    assert resumed.hits('Q_Koide') == fresh.hits('Q_Koide')
+    assert resumed.candidates == fresh.candidates